@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class OdevlibConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'odevlib'
+
+    def ready(self) -> None:  # noqa: PLR6301
+        if getattr(settings, "REDIS_CACHE_TAG_INVALIDATION", False):
+            from odevlib.caching.tags import connect_tag_invalidation
+
+            connect_tag_invalidation()
@@ -12,6 +12,7 @@ from odevlib.models.errors import Error
 from odevlib.models.rbac.instance_role_assignment import InstanceRoleAssignment
 from odevlib.models.rbac.mixins import RBACHierarchyModelMixin
 from odevlib.utils.functional import flatten
+from odevlib.utils.timing import timed
 
 create_methods = ["POST"]
 """
@@ -117,6 +118,7 @@ def get_instance_rbac_roles(user: AbstractUser, model: type[models.Model], insta
     )
 
 
+@timed("rbac")
 def get_complete_instance_rbac_roles(
     user: AbstractUser,
     model: type[models.Model],
@@ -228,6 +230,7 @@ def has_access_to_model_field(
     return False
 
 
+@timed("rbac")
 def merge_permissions(roles: Iterable[RBACRole]) -> Mapping[str, str]:
     """
     Merge all given roles' permissions into a single dict, removing duplicate
@@ -0,0 +1,191 @@
+"""
+Queries over request logs and their rollups.
+
+Rollups are TimescaleDB continuous aggregates over RequestLogEntry (see migration 0004), bucketed per minute
+and per hour by path and method. Querying them instead of raw rows keeps dashboards fast over months of data.
+Percentiles in continuous aggregates require TimescaleDB 2.7 or newer, so migration 0004 skips creating rollups
+on older versions, or without TimescaleDB. After upgrading TimescaleDB, create them in a migration of your project
+with `atomic = False`, depending on ("odevlib", "0004_request_log_rollups"):
+
+    operations = [CreateRequestLogRollups()]
+
+ODevLib doesn't drop old request logs. To keep raw entries only until they are rolled up, add retention policies
+in a migration of your project, depending on ("odevlib", "0004_request_log_rollups"):
+
+    operations = [
+        AddRetentionPolicy("odevlib.requestlogentry", drop_after="30 days"),
+        migrations.RunSQL(
+            "SELECT add_retention_policy('odevlib_requestlog_1m', INTERVAL '90 days')",
+            reverse_sql="SELECT remove_retention_policy('odevlib_requestlog_1m')",
+        ),
+    ]
+
+Raw entries are always queried within a time range, so TimescaleDB only scans chunks overlapping it,
+and are paginated by (time, id) keyset instead of offsets.
+"""
+import datetime
+import re
+
+from django.db import connection
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+from odevlib.errors import codes
+from odevlib.models.errors import Error
+from odevlib.models.logging import RequestLogEntry
+
+# Resolution name -> continuous aggregate name.
+ROLLUP_VIEWS = {
+    "minute": "odevlib_requestlog_1m",
+    "hour": "odevlib_requestlog_1h",
+}
+
+# Maximal number of request log entries returned in a single page.
+REQUEST_LOGS_MAX_PAGE_SIZE = 1000
+
+ROLLUP_FIELDS = ("bucket", "path", "method", "requests", "client_errors", "server_errors", "p50", "p95", "p99")
+
+
+def get_request_log_rollups(  # noqa: PLR0913
+    resolution: str,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    path: str | None = None,
+    method: str | None = None,
+    limit: int = 1000,
+) -> list[dict] | Error:
+    """
+    Return request counts, error counts and processing time percentiles for buckets in [start, end).
+
+    Each row contains `bucket`, `path`, `method`, `requests`, `client_errors` (4xx), `server_errors` (5xx),
+    `error_rate` (share of 5xx responses) and `p50`/`p95`/`p99` processing time in milliseconds.
+    Rows are ordered from the latest bucket.
+    """
+    view = ROLLUP_VIEWS.get(resolution)
+    if view is None:
+        return Error(
+            error_code=codes.invalid_request_data,
+            eng_description=f"Unknown resolution {resolution}. Expected one of: {', '.join(ROLLUP_VIEWS)}",
+            ui_description=f"Unknown resolution {resolution}. Expected one of: {', '.join(ROLLUP_VIEWS)}",
+        )
+
+    conditions = ["bucket >= %s", "bucket < %s"]
+    params: list = [start, end]
+    if path is not None:
+        conditions.append("path = %s")
+        params.append(path)
+    if method is not None:
+        conditions.append("method = %s")
+        params.append(method)
+    params.append(limit)
+
+    # View name comes from ROLLUP_VIEWS, and all values are passed as parameters.
+    query = (
+        f"SELECT {', '.join(ROLLUP_FIELDS)} FROM {view} "  # noqa: S608
+        f"WHERE {' AND '.join(conditions)} "
+        "ORDER BY bucket DESC, path, method LIMIT %s"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(query, params)
+        rows = [dict(zip(ROLLUP_FIELDS, row, strict=True)) for row in cursor.fetchall()]
+
+    for row in rows:
+        row["error_rate"] = row["server_errors"] / row["requests"] if row["requests"] else 0.0
+    return rows
+
+
+def encode_request_log_cursor(entry: RequestLogEntry) -> str:
+    """
+    Return cursor pointing after the given entry, see `get_request_logs`.
+    """
+    return f"{entry.time.isoformat()}_{entry.pk}"
+
+
+def decode_request_log_cursor(cursor: str) -> tuple[datetime.datetime, int] | Error:
+    time_str, _, pk_str = cursor.rpartition("_")
+    entry_time = parse_datetime(time_str)
+    if entry_time is None or not pk_str.isdigit():
+        return Error(
+            error_code=codes.invalid_request_data,
+            eng_description=f'Malformed request log cursor "{cursor}"',
+            ui_description=f'Malformed request log cursor "{cursor}"',
+        )
+    return entry_time, int(pk_str)
+
+
+def get_request_logs(  # noqa: PLR0913
+    start: datetime.datetime,
+    end: datetime.datetime,
+    path: str | None = None,
+    status: str | None = None,
+    user_id: int | None = None,
+    cursor: str | None = None,
+    limit: int = 200,
+) -> tuple[list[RequestLogEntry], str | None] | Error:
+    """
+    Return a page of request log entries in [start, end), starting from the latest one, and cursor of the next page.
+    Cursor is None on the last page.
+
+    :param path: Only return entries with paths starting with this prefix.
+    :param status: Exact status code (e.g. "404") or status class (e.g. "5xx").
+    :param user_id: Only return entries of this user.
+    :param cursor: Cursor returned with the previous page.
+    :param limit: Page size, clamped to [1, REQUEST_LOGS_MAX_PAGE_SIZE].
+    """
+    limit = max(1, min(limit, REQUEST_LOGS_MAX_PAGE_SIZE))
+    queryset = RequestLogEntry.timescale.filter(time__gte=start, time__lt=end)
+
+    if path is not None:
+        queryset = queryset.filter(path__startswith=path)
+
+    if status is not None:
+        if re.fullmatch(r"[0-9]xx", status.lower()):
+            status_class = int(status[0]) * 100
+            queryset = queryset.filter(code__gte=status_class, code__lt=status_class + 100)
+        elif status.isdigit():
+            queryset = queryset.filter(code=int(status))
+        else:
+            return Error(
+                error_code=codes.invalid_request_data,
+                eng_description=f'Expected status code or class like "5xx", but got "{status}"',
+                ui_description=f'Expected status code or class like "5xx", but got "{status}"',
+            )
+
+    if user_id is not None:
+        queryset = queryset.filter(user_id=user_id)
+
+    if cursor is not None:
+        decoded = decode_request_log_cursor(cursor)
+        if isinstance(decoded, Error):
+            return decoded
+        cursor_time, cursor_pk = decoded
+        # Plain upper bound on time lets TimescaleDB exclude newer chunks, the rest is the keyset condition.
+        queryset = queryset.filter(time__lte=cursor_time).filter(
+            Q(time__lt=cursor_time) | Q(time=cursor_time, pk__lt=cursor_pk),
+        )
+
+    # Fetch one extra entry to know whether there is a next page.
+    entries = list(queryset.order_by("-time", "-pk").select_related("user")[: limit + 1])
+    if len(entries) <= limit:
+        return entries, None
+    entries = entries[:limit]
+    return entries, encode_request_log_cursor(entries[-1])
+
+
+def serialize_request_log_entry(entry: RequestLogEntry) -> dict:
+    """
+    Return lightweight JSON representation of the entry, used by the request log viewer.
+    """
+    return {
+        "id": entry.pk,
+        "time": entry.time.isoformat(),
+        "user": str(entry.user) if entry.user is not None else None,
+        "application": entry.application,
+        "method": entry.method,
+        "path": entry.path,
+        "code": entry.code,
+        "processing_time": entry.processing_time,
+        "timings": entry.timings,
+        "request": entry.request,
+        "response": entry.response,
+    }
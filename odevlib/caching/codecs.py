@@ -0,0 +1,142 @@
+"""
+Binary codecs that may be used by RedisCache to store values as bytes.
+
+Codecs operate on bytes end to end, so no UTF-8 round trip happens between
+the Python object and the Redis value.
+"""
+import abc
+import pickle
+import zlib
+from types import ModuleType
+from typing import Any
+
+
+class Codec(abc.ABC):
+    """
+    Converts Python objects into bytes and back.
+    """
+
+    @abc.abstractmethod
+    def dumps(self, value: object) -> bytes:
+        """
+        Serialize value into bytes.
+        """
+
+    @abc.abstractmethod
+    def loads(self, data: bytes | memoryview) -> Any:  # noqa: ANN401
+        """
+        Deserialize value from bytes.
+        """
+
+
+class PickleCodec(Codec):
+    """
+    Stores values using pickle protocol 5, which handles large buffers efficiently.
+
+    Only use it with Redis instances you trust, since unpickling data allows arbitrary code execution.
+    """
+
+    protocol: int
+
+    def __init__(self, protocol: int = 5) -> None:
+        self.protocol = protocol
+
+    def dumps(self, value: object) -> bytes:
+        return pickle.dumps(value, protocol=self.protocol)
+
+    def loads(self, data: bytes | memoryview) -> Any:  # noqa: ANN401, PLR6301
+        return pickle.loads(data)  # noqa: S301
+
+
+class MsgpackCodec(Codec):
+    """
+    Stores values using msgpack. Requires the `msgpack` package (`odevlib[msgpack]` extra) to be installed.
+    """
+
+    def __init__(self) -> None:
+        try:
+            import msgpack  # type: ignore[import]
+        except ImportError as e:
+            msg = "MsgpackCodec requires the msgpack package to be installed"
+            raise ImportError(msg) from e
+
+        self._msgpack = msgpack
+
+    def dumps(self, value: object) -> bytes:
+        return self._msgpack.packb(value, use_bin_type=True)
+
+    def loads(self, data: bytes | memoryview) -> Any:  # noqa: ANN401
+        return self._msgpack.unpackb(data, raw=False)
+
+
+# Header bytes prepended by CompressedCodec, so values stored with different
+# settings (or below the threshold) can still be read back.
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+_LZ4 = b"\x02"
+
+
+class CompressedCodec(Codec):
+    """
+    Wraps another codec and compresses serialized values larger than `threshold` bytes.
+
+    Supported algorithms are "zlib" (always available) and "lz4" (requires the `lz4` package, `odevlib[lz4]` extra).
+    """
+
+    codec: Codec
+    threshold: int
+    algorithm: str
+    level: int
+
+    def __init__(
+        self,
+        codec: Codec,
+        threshold: int = 1024,
+        algorithm: str = "zlib",
+        level: int = 6,
+    ) -> None:
+        if algorithm not in ("zlib", "lz4"):
+            msg = f"Unknown compression algorithm: {algorithm}"
+            raise ValueError(msg)
+
+        self._lz4: ModuleType | None = None
+        self.codec = codec
+        self.threshold = threshold
+        self.algorithm = algorithm
+        self.level = level
+
+        if algorithm == "lz4":
+            # Fail early if lz4 is not installed.
+            self._get_lz4()
+
+    def _get_lz4(self) -> ModuleType:
+        if self._lz4 is None:
+            try:
+                import lz4.frame  # type: ignore[import]
+            except ImportError as e:
+                msg = "lz4 compression requires the lz4 package to be installed"
+                raise ImportError(msg) from e
+            self._lz4 = lz4.frame
+        return self._lz4
+
+    def dumps(self, value: object) -> bytes:
+        data = self.codec.dumps(value)
+        if len(data) < self.threshold:
+            return _RAW + data
+
+        if self.algorithm == "lz4":
+            return _LZ4 + self._get_lz4().compress(data)
+        return _ZLIB + zlib.compress(data, self.level)
+
+    def loads(self, data: bytes | memoryview) -> Any:  # noqa: ANN401
+        # Slice a memoryview, so the payload is not copied before decompression/deserialization.
+        view = memoryview(data)
+        header, payload = bytes(view[:1]), view[1:]
+        if header == _ZLIB:
+            payload = memoryview(zlib.decompress(payload))
+        elif header == _LZ4:
+            payload = memoryview(self._get_lz4().decompress(payload))
+        elif header != _RAW:
+            msg = "Value was not produced by CompressedCodec"
+            raise ValueError(msg)
+        return self.codec.loads(payload)
@@ -0,0 +1,221 @@
+"""
+Hit/miss/latency instrumentation for RedisCache.
+
+Every RedisCache reports its events to the hook stored in its `metrics` class attribute. By default, this is
+the process-wide `cache_metrics` instance, which keeps counters per thread (so recording never takes a lock)
+and sums them up only when metrics are read. Counters of finished threads are merged into shared totals,
+so memory use doesn't grow with thread churn.
+
+Metrics can be exposed to Prometheus by adding `cache_metrics_view` to your urlpatterns.
+"""
+import abc
+import bisect
+import threading
+import weakref
+
+from django.http import HttpRequest, HttpResponse
+
+# Upper bounds of fill latency histogram buckets, in seconds.
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Upper bounds of serialized value size histogram buckets, in bytes.
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class CacheMetricsHook(abc.ABC):
+    """
+    Receives events from RedisCache. Implement it to forward metrics to your monitoring system.
+
+    Methods are called on the hot path, so implementations should be cheap and must not raise.
+    """
+
+    @abc.abstractmethod
+    def on_hit(self, cache: str) -> None:
+        """
+        Value was found in Redis.
+        """
+
+    @abc.abstractmethod
+    def on_miss(self, cache: str) -> None:
+        """
+        Value was not found in Redis and is going to be obtained with get_original_value.
+        """
+
+    @abc.abstractmethod
+    def on_fill(self, cache: str, seconds: float, size: int) -> None:
+        """
+        Original value was obtained and stored in Redis.
+
+        :param seconds: Time spent obtaining, serializing and storing the value.
+        :param size: Size of the serialized value in bytes.
+        """
+
+    @abc.abstractmethod
+    def on_error(self, cache: str) -> None:
+        """
+        get_original_value returned an Error, or Redis command failed.
+        """
+
+
+class CacheStats:
+    """
+    Counters of a single cache class.
+    """
+
+    __slots__ = ("hits", "misses", "errors", "fill_buckets", "fill_sum", "size_buckets", "size_sum")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        # Non-cumulative counts per bucket; the last bucket is +Inf.
+        self.fill_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.fill_sum = 0.0
+        self.size_buckets = [0] * (len(SIZE_BUCKETS) + 1)
+        self.size_sum = 0
+
+    @property
+    def fills(self) -> int:
+        return sum(self.fill_buckets)
+
+    def merge(self, other: "CacheStats") -> None:
+        self.hits += other.hits
+        self.misses += other.misses
+        self.errors += other.errors
+        self.fill_sum += other.fill_sum
+        self.size_sum += other.size_sum
+        for i, count in enumerate(other.fill_buckets):
+            self.fill_buckets[i] += count
+        for i, count in enumerate(other.size_buckets):
+            self.size_buckets[i] += count
+
+
+class CacheMetrics(CacheMetricsHook):
+    """
+    Built-in metrics hook that keeps lock-free per-thread counters.
+
+    Each thread writes only to its own CacheStats objects. The lock is taken only when a thread sees
+    a cache class for the first time, when a thread finishes, and when metrics are read.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Stats of running threads, by id of their per-cache dict.
+        self._thread_stats: dict[int, dict[str, CacheStats]] = {}
+        # Stats of finished threads, summed up, so counters never go backwards.
+        self._retired_stats: dict[str, CacheStats] = {}
+
+    def _stats(self, cache: str) -> CacheStats:
+        per_cache: dict[str, CacheStats] | None = getattr(self._local, "stats", None)
+        if per_cache is None:
+            per_cache = self._local.stats = {}
+            with self._lock:
+                self._thread_stats[id(per_cache)] = per_cache
+            weakref.finalize(threading.current_thread(), self._retire, id(per_cache))
+
+        stats = per_cache.get(cache)
+        if stats is None:
+            stats = CacheStats()
+            with self._lock:
+                per_cache[cache] = stats
+        return stats
+
+    def _retire(self, key: int) -> None:
+        """
+        Merge stats of a finished thread into the shared totals.
+        """
+        with self._lock:
+            per_cache = self._thread_stats.pop(key)
+            for cache, stats in per_cache.items():
+                self._retired_stats.setdefault(cache, CacheStats()).merge(stats)
+
+    def on_hit(self, cache: str) -> None:
+        self._stats(cache).hits += 1
+
+    def on_miss(self, cache: str) -> None:
+        self._stats(cache).misses += 1
+
+    def on_fill(self, cache: str, seconds: float, size: int) -> None:
+        stats = self._stats(cache)
+        stats.fill_buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        stats.fill_sum += seconds
+        stats.size_buckets[bisect.bisect_left(SIZE_BUCKETS, size)] += 1
+        stats.size_sum += size
+
+    def on_error(self, cache: str) -> None:
+        self._stats(cache).errors += 1
+
+    def snapshot(self) -> dict[str, CacheStats]:
+        """
+        Return counters of all caches summed across threads.
+        """
+        with self._lock:
+            all_stats = list(self._retired_stats.items())
+            for per_cache in self._thread_stats.values():
+                all_stats.extend(per_cache.items())
+
+        result: dict[str, CacheStats] = {}
+        for cache, stats in all_stats:
+            result.setdefault(cache, CacheStats()).merge(stats)
+        return result
+
+
+cache_metrics = CacheMetrics()
+
+
+def _format_histogram(name: str, cache: str, bounds: tuple, buckets: list[int], total: float) -> list[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip((*bounds, "+Inf"), buckets, strict=True):
+        cumulative += count
+        lines.append(f'{name}_bucket{{cache="{cache}",le="{bound}"}} {cumulative}')
+    lines.extend((f'{name}_sum{{cache="{cache}"}} {total}', f'{name}_count{{cache="{cache}"}} {cumulative}'))
+    return lines
+
+
+def render_prometheus(metrics: CacheMetrics = cache_metrics) -> str:
+    """
+    Render metrics in Prometheus text exposition format.
+    """
+    snapshot = sorted(metrics.snapshot().items())
+    lines: list[str] = []
+
+    for name, attribute, description in (
+        ("odevlib_cache_hits_total", "hits", "Number of values found in Redis."),
+        ("odevlib_cache_misses_total", "misses", "Number of values not found in Redis."),
+        ("odevlib_cache_errors_total", "errors", "Number of failed Redis commands and original value errors."),
+    ):
+        lines.extend((f"# HELP {name} {description}", f"# TYPE {name} counter"))
+        lines.extend(f'{name}{{cache="{cache}"}} {getattr(stats, attribute)}' for cache, stats in snapshot)
+
+    for name, description, bounds, buckets, total in (
+        (
+            "odevlib_cache_fill_seconds",
+            "Time spent obtaining and storing original values.",
+            LATENCY_BUCKETS,
+            "fill_buckets",
+            "fill_sum",
+        ),
+        (
+            "odevlib_cache_value_bytes",
+            "Size of serialized values stored in Redis.",
+            SIZE_BUCKETS,
+            "size_buckets",
+            "size_sum",
+        ),
+    ):
+        lines.extend((f"# HELP {name} {description}", f"# TYPE {name} histogram"))
+        for cache, stats in snapshot:
+            lines.extend(_format_histogram(name, cache, bounds, getattr(stats, buckets), getattr(stats, total)))
+
+    return "\n".join(lines) + "\n"
+
+
+def cache_metrics_view(request: HttpRequest) -> HttpResponse:  # noqa: ARG001
+    """
+    Expose RedisCache metrics to Prometheus scraper.
+
+    Restrict access to this view on the reverse proxy level, since it has no authentication.
+    """
+    return HttpResponse(render_prometheus(), content_type="text/plain; version=0.0.4; charset=utf-8")
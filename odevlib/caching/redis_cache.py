@@ -1,9 +1,13 @@
 import abc
-from typing import Generic, TypeVar
+import time
+from collections.abc import Iterable
+from typing import ClassVar, Generic, TypeVar
 
 import redis
-from django.conf import settings
 
+from odevlib.caching.codecs import Codec
+from odevlib.caching.metrics import CacheMetricsHook, cache_metrics
+from odevlib.caching.tags import get_redis_instance, invalidate_tags, register_redis_instance, tag_entry
 from odevlib.models.errors import Error
 
 K = TypeVar("K")
@@ -11,9 +15,25 @@ V = TypeVar("V")
 
 
 class RedisCache(abc.ABC, Generic[K, V]):
+    """
+    Caches values of type V under keys of type K in Redis.
+
+    Entries may be marked with tags by overriding `get_tags`, and dropped later with `invalidate_tags`.
+
+    Values are stored either with a binary codec (set `codec` class attribute, e.g. `PickleCodec()` or
+    `CompressedCodec(MsgpackCodec())`), or, if no codec is set, with `serialize_value`/`deserialize_value`
+    string methods of the subclass.
+    """
+
     redis_instance: redis.Redis
     timeout: int
 
+    # Binary codec used to store values. If None, serialize_value/deserialize_value are used.
+    codec: ClassVar[Codec | None] = None
+
+    # Receives hit/miss/fill/error events. Set to None to disable instrumentation.
+    metrics: ClassVar[CacheMetricsHook | None] = cache_metrics
+
     def __init__(
         self,
         timeout: int = 120,
@@ -21,13 +41,9 @@ class RedisCache(abc.ABC, Generic[K, V]):
     ) -> None:
         if redis_instance is not None:
             self.redis_instance = redis_instance
+            register_redis_instance(redis_instance)
         else:
-            url = getattr(settings, "REDIS_CACHE_URL", None)
-            if url is None:
-                msg = "REDIS_CACHE_URL is not set"
-                raise ValueError(msg)
-
-            self.redis_instance = redis.Redis.from_url(url)
+            self.redis_instance = get_redis_instance()
 
         self.timeout = timeout
 
@@ -48,14 +64,15 @@ class RedisCache(abc.ABC, Generic[K, V]):
         internally as a Redis key.
         """
 
-    @abc.abstractmethod
-    def serialize_value(self, value: V) -> str:
+    def serialize_value(self, value: V) -> str:  # noqa: ARG002
         """
-        Override this function in your subclass.
+        Override this function in your subclass, unless `codec` is set.
 
         This function should serialize value into string, that will be used
         internally as a Redis value.
         """
+        msg = f"{self.__class__.__name__} should either set codec or override serialize_value"
+        raise NotImplementedError(msg)
 
     @abc.abstractmethod
     def deserialize_key(self, key: str) -> K:
@@ -66,39 +83,110 @@ class RedisCache(abc.ABC, Generic[K, V]):
         internally as a Redis key.
         """
 
-    @abc.abstractmethod
-    def deserialize_value(self, value: str) -> V:
+    def deserialize_value(self, value: str) -> V:  # noqa: ARG002
         """
-        Override this function in your subclass.
+        Override this function in your subclass, unless `codec` is set.
 
         This function should deserialize value from string, that is used
         internally as a Redis value.
         """
+        msg = f"{self.__class__.__name__} should either set codec or override deserialize_value"
+        raise NotImplementedError(msg)
 
-    def get(self, key: K) -> V | Error:
+    def encode_value(self, value: V) -> bytes:
         """
-        Return the value stored in Redis, or, if cache is empty,
-        obtain the original value, store it, and return it.
+        Convert value into bytes stored in Redis.
         """
+        if self.codec is not None:
+            return self.codec.dumps(value)
+        return self.serialize_value(value).encode("utf-8")
 
-        converted_key = self.serialize_key(key)
+    def decode_value(self, data: bytes) -> V:
+        """
+        Convert bytes stored in Redis back into value.
+        """
+        if self.codec is not None:
+            return self.codec.loads(data)
+        return self.deserialize_value(data.decode("utf-8"))
 
-        redis_value = self.redis_instance.get(converted_key)
-        if redis_value is not None:
-            return self.deserialize_value(redis_value.decode("utf-8"))
+    def get_tags(self, key: K, value: V) -> Iterable[str]:  # noqa: ARG002, PLR6301
+        """
+        Override this function in your subclass to mark cache entries with tags.
 
+        Use `odevlib.caching.tags.model_tag` to get tags of the model rows the value is derived from,
+        so the entry is dropped automatically when these rows change.
+        """
+        return ()
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        Drop all cache entries marked with any of the specified tags.
+
+        Entries are dropped regardless of the cache class that stored them.
+        """
+        return invalidate_tags(tags, self.redis_instance)
+
+    def store(self, key: K, value: V) -> int:
+        """
+        Store the value in Redis along with its tags.
+
+        :return: Size of the serialized value in bytes.
+        """
+        converted_key = self.serialize_key(key)
+        converted_value = self.encode_value(value)
+        tags = list(self.get_tags(key, value))
+
+        if not tags:
+            self.redis_instance.set(converted_key, converted_value, ex=self.timeout)
+            return len(converted_value)
+
+        pipeline = self.redis_instance.pipeline(transaction=True)
+        pipeline.set(converted_key, converted_value, ex=self.timeout)
+        for tag in tags:
+            # Tag set lives as long as the longest-living entry in it.
+            tag_entry(pipeline, tag, converted_key, self.timeout)
+        pipeline.execute()
+        return len(converted_value)
+
+    def fill(self, key: K) -> V | Error:
+        """
+        Obtain the original value, store it in Redis, and report the fill to metrics hook.
+        """
+        start = time.perf_counter()
         value: V | Error = self.get_original_value(key)
         if isinstance(value, Error):
+            if self.metrics is not None:
+                self.metrics.on_error(self.__class__.__name__)
             return value
-        converted_value = self.serialize_value(value)
 
-        self.redis_instance.set(
-            converted_key,
-            converted_value,
-            ex=self.timeout,
-        )
+        size = self.store(key, value)
+        if self.metrics is not None:
+            self.metrics.on_fill(self.__class__.__name__, time.perf_counter() - start, size)
         return value
 
+    def get(self, key: K) -> V | Error:
+        """
+        Return the value stored in Redis, or, if cache is empty,
+        obtain the original value, store it, and return it.
+        """
+
+        converted_key = self.serialize_key(key)
+
+        try:
+            redis_value = self.redis_instance.get(converted_key)
+            if redis_value is not None:
+                if self.metrics is not None:
+                    self.metrics.on_hit(self.__class__.__name__)
+                return self.decode_value(redis_value)
+
+            if self.metrics is not None:
+                self.metrics.on_miss(self.__class__.__name__)
+            return self.fill(key)
+        except redis.RedisError:
+            if self.metrics is not None:
+                self.metrics.on_error(self.__class__.__name__)
+            raise
+
     def force_recache(self, key: K) -> V | Error:
         """
         Force get the original value, store it in Redis, and return it.
@@ -106,14 +194,9 @@ class RedisCache(abc.ABC, Generic[K, V]):
         May be helpful when you want to invalidate cache from side job.
         """
 
-        value: V | Error = self.get_original_value(key)
-        if isinstance(value, Error):
-            return value
-        converted_value = self.serialize_value(value)
-
-        self.redis_instance.set(
-            self.serialize_key(key),
-            converted_value,
-            ex=self.timeout,
-        )
-        return value
+        try:
+            return self.fill(key)
+        except redis.RedisError:
+            if self.metrics is not None:
+                self.metrics.on_error(self.__class__.__name__)
+            raise
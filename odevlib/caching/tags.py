@@ -0,0 +1,158 @@
+"""
+Tag-based invalidation of RedisCache entries.
+
+Each cache entry may be marked with any number of string tags. For every tag, Redis keeps a set of cache keys
+marked with it, so all entries derived from, e.g., a particular model row may be dropped at once
+with `invalidate_tags`.
+
+OModel rows are tagged with `model_tag(instance)`, e.g. `model:test_app__examplerbacparent:42`, and the whole
+model with `model_tag(ModelClass)`, e.g. `model:test_app__examplerbacparent`. When `REDIS_CACHE_TAG_INVALIDATION`
+setting is enabled, both tags are invalidated automatically after an OModel instance is saved or deleted,
+in every Redis server used by a RedisCache (see `register_redis_instance`).
+"""
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+import redis
+from django.conf import settings
+from django.db import models, transaction
+
+from odevlib.models.omodel import OModel
+
+# Prefix of Redis sets that hold cache keys marked with a tag.
+TAG_KEY_PREFIX = "odevlib:cache:tag:"
+
+_redis_instance: redis.Redis | None = None
+
+# Clients of Redis servers that hold tagged cache entries, one per server and database.
+_redis_instances: dict[tuple[Any, ...], redis.Redis] = {}
+
+# Adds the cache key to the tag set, and extends expiration of the set if the entry outlives it.
+# EXPIRE with NX/GT options would do the same, but requires Redis 7.
+TAG_ENTRY_SCRIPT = """
+redis.call("SADD", KEYS[1], ARGV[1])
+if redis.call("TTL", KEYS[1]) < tonumber(ARGV[2]) then
+    redis.call("EXPIRE", KEYS[1], ARGV[2])
+end
+"""
+
+
+def tag_key(tag: str) -> str:
+    """
+    Return the name of Redis set that holds keys marked with the specified tag.
+    """
+    return f"{TAG_KEY_PREFIX}{tag}"
+
+
+def model_tag(model: models.Model | type[models.Model], pk: object = None) -> str:
+    """
+    Return the tag of a model row, or of the whole model if neither instance nor pk is passed.
+
+    Example:
+    -------
+    .. code-block:: python
+
+       model_tag(parent) == "model:test_app__examplerbacparent:42"
+       model_tag(ExampleRBACParent, 42) == "model:test_app__examplerbacparent:42"
+       model_tag(ExampleRBACParent) == "model:test_app__examplerbacparent"
+    """
+    if isinstance(model, models.Model):
+        pk = model.pk
+    name = f"model:{model._meta.app_label}__{model._meta.model_name}"  # noqa: SLF001
+    if pk is None:
+        return name
+    return f"{name}:{pk}"
+
+
+def get_redis_instance() -> redis.Redis:
+    """
+    Return the Redis client built from REDIS_CACHE_URL setting, which is shared by RedisCache instances
+    that are not given a client explicitly.
+    """
+    global _redis_instance  # noqa: PLW0603
+    if _redis_instance is None:
+        url = getattr(settings, "REDIS_CACHE_URL", None)
+        if url is None:
+            msg = "REDIS_CACHE_URL is not set"
+            raise ValueError(msg)
+        _redis_instance = redis.Redis.from_url(url)
+        register_redis_instance(_redis_instance)
+    return _redis_instance
+
+
+def register_redis_instance(redis_instance: redis.Redis) -> None:
+    """
+    Make automatic invalidation drop entries stored through this client. Called by RedisCache for its client.
+
+    Clients connected to the same server and database are only registered once.
+    """
+    kwargs = redis_instance.connection_pool.connection_kwargs
+    server = tuple(kwargs.get(name) for name in ("host", "port", "path", "db", "username"))
+    _redis_instances.setdefault(server, redis_instance)
+
+
+def tag_entry(client: "redis.Redis | redis.client.Pipeline", tag: str, cache_key: str, timeout: int) -> None:
+    """
+    Mark the cache entry stored under `cache_key` for `timeout` seconds with the tag.
+    """
+    client.eval(TAG_ENTRY_SCRIPT, 1, tag_key(tag), cache_key, timeout)
+
+
+def invalidate_tags(tags: Iterable[str], redis_instance: redis.Redis | None = None) -> int:
+    """
+    Drop all cache entries marked with any of the specified tags.
+
+    :return: Number of removed cache entries.
+    """
+    tag_keys = [tag_key(tag) for tag in tags]
+    if not tag_keys:
+        return 0
+    if redis_instance is None:
+        redis_instance = get_redis_instance()
+
+    # Read and drop tag sets atomically, so keys tagged concurrently are either
+    # returned here or land in a fresh tag set.
+    pipeline = redis_instance.pipeline(transaction=True)
+    for key in tag_keys:
+        pipeline.smembers(key)
+    pipeline.delete(*tag_keys)
+    *members, _ = pipeline.execute()
+
+    cache_keys = set().union(*members)
+    if not cache_keys:
+        return 0
+    return redis_instance.delete(*cache_keys)
+
+
+def _invalidate_instance_tags(sender: type[models.Model], instance: models.Model, **kwargs) -> None:
+    if not issubclass(sender, OModel):
+        return
+
+    tags = [model_tag(sender), model_tag(sender, instance.pk)]
+    # Invalidate after commit, so concurrent readers can't refill the cache with data that is about to change.
+    transaction.on_commit(lambda: invalidate_registered_tags(tags), using=kwargs.get("using"))
+
+
+def invalidate_registered_tags(tags: Iterable[str]) -> None:
+    """
+    Drop cache entries marked with any of the specified tags from all registered Redis servers.
+
+    Errors are logged, so an unavailable server doesn't prevent invalidation in the others.
+    """
+    tags = list(tags)
+    for redis_instance in list(_redis_instances.values()):
+        try:
+            invalidate_tags(tags, redis_instance)
+        except redis.RedisError:
+            logging.exception("Error occurred while invalidating cache tags %s", tags)
+
+
+def connect_tag_invalidation() -> None:
+    """
+    Invalidate model tags when OModel instances are saved or deleted.
+
+    Called from OdevlibConfig.ready() when REDIS_CACHE_TAG_INVALIDATION setting is enabled.
+    """
+    models.signals.post_save.connect(_invalidate_instance_tags, dispatch_uid="odevlib_cache_tags")
+    models.signals.post_delete.connect(_invalidate_instance_tags, dispatch_uid="odevlib_cache_tags")
@@ -1,5 +1,6 @@
 """
 This package contains utilities useful for building distributed systems.
 
-Currently, it only supports Redis as a message broker.
-"""
\ No newline at end of file
+Message brokers are implemented on top of Redis streams. An in-memory broker with the same API
+is available for single-process deployments and tests.
+"""
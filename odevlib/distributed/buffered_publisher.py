@@ -0,0 +1,216 @@
+"""
+Publishers that coalesce messages in memory and publish them with publish_many in the background.
+
+Use them when messages are produced one by one at a high rate, so a single pipelined round trip
+is made per batch instead of per message. Messages are flushed when `max_batch` of them are buffered,
+or `flush_interval` seconds after the previous flush, whatever happens first.
+
+Buffered messages are lost if the process crashes before they are flushed, and messages of a failed flush
+are logged and dropped, so only use buffering for messages that may tolerate it.
+"""
+import asyncio
+import contextlib
+import logging
+import threading
+from collections import defaultdict
+
+from odevlib.distributed.message_broker import MessageBroker, SyncMessageBroker
+
+
+class AsyncBufferedPublisher:
+    """
+    Buffers messages published from asyncio code and flushes them in a background task.
+
+    .. code-block:: python
+
+       async with AsyncBufferedPublisher(broker) as publisher:
+           for event in events:
+               await publisher.publish("events", event)
+    """
+
+    broker: MessageBroker
+    max_batch: int
+    flush_interval: float
+    max_buffered: int
+
+    def __init__(
+        self,
+        broker: MessageBroker,
+        max_batch: int = 500,
+        flush_interval: float = 0.05,
+        max_buffered: int = 100_000,
+    ) -> None:
+        """
+        :param max_batch: Number of buffered messages that triggers a flush.
+        :param flush_interval: Maximum time in seconds a message stays in the buffer.
+        :param max_buffered: When this number of messages is buffered, publish waits for a flush (backpressure).
+        """
+        self.broker = broker
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+
+        self._buffer: defaultdict[str, list[str]] = defaultdict(list)
+        self._buffered = 0
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    async def publish(self, channel: str, message: str) -> None:
+        """
+        Add the message to the buffer.
+        """
+        if self._buffered >= self.max_buffered:
+            await self.flush()
+
+        self._buffer[channel].append(message)
+        self._buffered += 1
+        if self._buffered >= self.max_batch:
+            self._flush_requested.set()
+
+    async def flush(self) -> None:
+        """
+        Publish all buffered messages now.
+        """
+        async with self._flush_lock:
+            buffer, self._buffer = self._buffer, defaultdict(list)
+            self._buffered = 0
+            for channel, messages in buffer.items():
+                try:
+                    await self.broker.publish_many(channel, messages)
+                except Exception:
+                    logging.exception("Failed to publish %d buffered messages to %s", len(messages), channel)
+
+    async def _run(self) -> None:
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._flush_requested.wait(), self.flush_interval)
+            self._flush_requested.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        """
+        Start the background flushing task in the running event loop.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """
+        Stop the background task and flush the remaining messages.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+    async def __aenter__(self) -> "AsyncBufferedPublisher":
+        self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+
+class BufferedPublisher:
+    """
+    Buffers messages published from synchronous code and flushes them in a background thread.
+
+    .. code-block:: python
+
+       with BufferedPublisher(broker) as publisher:
+           for event in events:
+               publisher.publish("events", event)
+    """
+
+    broker: SyncMessageBroker
+    max_batch: int
+    flush_interval: float
+    max_buffered: int
+
+    def __init__(
+        self,
+        broker: SyncMessageBroker,
+        max_batch: int = 500,
+        flush_interval: float = 0.05,
+        max_buffered: int = 100_000,
+    ) -> None:
+        """
+        :param max_batch: Number of buffered messages that triggers a flush.
+        :param flush_interval: Maximum time in seconds a message stays in the buffer.
+        :param max_buffered: When this number of messages is buffered, publish waits for a flush (backpressure).
+        """
+        self.broker = broker
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+
+        self._buffer: defaultdict[str, list[str]] = defaultdict(list)
+        self._buffered = 0
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    def publish(self, channel: str, message: str) -> None:
+        """
+        Add the message to the buffer.
+        """
+        if self._buffered >= self.max_buffered:
+            self.flush()
+
+        with self._condition:
+            self._buffer[channel].append(message)
+            self._buffered += 1
+            if self._buffered >= self.max_batch:
+                self._condition.notify()
+
+    def flush(self) -> None:
+        """
+        Publish all buffered messages now.
+        """
+        with self._flush_lock:
+            with self._condition:
+                buffer, self._buffer = self._buffer, defaultdict(list)
+                self._buffered = 0
+            for channel, messages in buffer.items():
+                try:
+                    self.broker.publish_many(channel, messages)
+                except Exception:
+                    logging.exception("Failed to publish %d buffered messages to %s", len(messages), channel)
+
+    def _run(self) -> None:
+        while not self._closed:
+            with self._condition:
+                self._condition.wait_for(lambda: self._closed or self._buffered >= self.max_batch, self.flush_interval)
+            self.flush()
+
+    def start(self) -> None:
+        """
+        Start the background flushing thread.
+        """
+        if self._thread is None:
+            self._closed = False
+            self._thread = threading.Thread(target=self._run, name="odevlib-buffered-publisher", daemon=True)
+            self._thread.start()
+
+    def close(self) -> None:
+        """
+        Stop the background thread and flush the remaining messages.
+        """
+        if self._thread is not None:
+            with self._condition:
+                self._closed = True
+                self._condition.notify()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def __enter__(self) -> "BufferedPublisher":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
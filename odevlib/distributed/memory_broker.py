@@ -0,0 +1,191 @@
+"""
+In-process implementation of MessageBroker.
+
+Mirrors the semantics of RedisMessageBroker (stream ids, resuming from last_id, bounded retention and
+consumer groups), so consumers can be run in single-process deployments and benchmarked hermetically,
+without a Redis server. Messages are not shared between processes and are lost on restart.
+"""
+import asyncio
+import bisect
+import contextlib
+import functools
+import time
+from collections.abc import AsyncIterator, Iterable
+
+from odevlib.distributed.message_broker import MessageBroker
+
+StreamId = tuple[int, int]
+
+
+def _parse_id(stream_id: str) -> StreamId:
+    """
+    Convert "<milliseconds>-<sequence>" stream id into a comparable tuple.
+    """
+    ms, _, seq = stream_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+def _format_id(stream_id: StreamId) -> str:
+    return f"{stream_id[0]}-{stream_id[1]}"
+
+
+class _Group:
+    def __init__(self, last_delivered: StreamId) -> None:
+        self.last_delivered = last_delivered
+        # Delivered, but not yet acknowledged messages: stream id -> (consumer, delivery time, message).
+        self.pending: dict[str, tuple[str, float, str]] = {}
+
+
+class _Stream:
+    def __init__(self, maxlen: int | None) -> None:
+        self.maxlen = maxlen
+        # (id, formatted id, message), ordered by id. Entries before `start` are trimmed, and are removed
+        # from the list once there are `maxlen` of them, so trimming takes amortized constant time.
+        self.entries: list[tuple[StreamId, str, str]] = []
+        self.start = 0
+        self.last_id: StreamId = (0, 0)
+        self.groups: dict[str, _Group] = {}
+        self.changed = asyncio.Condition()
+
+    def next_id(self) -> StreamId:
+        ms = int(time.time() * 1000)
+        if ms <= self.last_id[0]:
+            return self.last_id[0], self.last_id[1] + 1
+        return ms, 0
+
+    def append(self, message: str) -> None:
+        stream_id = self.next_id()
+        self.entries.append((stream_id, _format_id(stream_id), message))
+        self.last_id = stream_id
+        if self.maxlen is not None and len(self.entries) - self.start > self.maxlen:
+            self.start += 1
+            if self.start >= self.maxlen:
+                del self.entries[: self.start]
+                self.start = 0
+
+    def has_after(self, stream_id: StreamId) -> bool:
+        return self.last_id > stream_id
+
+    def read_after(self, stream_id: StreamId, count: int) -> list[tuple[StreamId, str, str]]:
+        start = bisect.bisect_right(self.entries, stream_id, lo=self.start, key=lambda entry: entry[0])
+        return self.entries[start:start + count]
+
+
+class InMemoryMessageBroker(MessageBroker):
+    """
+    Implementation of MessageBroker that keeps streams in memory of the current process.
+
+    Must be used from a single event loop.
+    """
+
+    maxlen: int | None
+    count: int
+
+    def __init__(self, maxlen: int | None = 10000, count: int = 1000) -> None:
+        """
+        :param maxlen: Number of latest messages retained in each stream. None keeps all messages.
+        :param count: Maximal number of messages returned by a single read.
+        """
+        self.maxlen = maxlen
+        self.count = count
+        self._streams: dict[str, _Stream] = {}
+
+    def _stream(self, channel: str) -> _Stream:
+        stream = self._streams.get(channel)
+        if stream is None:
+            stream = self._streams[channel] = _Stream(self.maxlen)
+        return stream
+
+    async def publish(self, channel: str, message: str) -> None:
+        await self.publish_many(channel, [message])
+
+    async def publish_many(self, channel: str, messages: Iterable[str]) -> None:
+        stream = self._stream(channel)
+        for message in messages:
+            stream.append(message)
+        async with stream.changed:
+            stream.changed.notify_all()
+
+    async def asubscribe(self, channel: str, last_id: str) -> AsyncIterator[tuple[str, str]]:
+        async for batch in self.asubscribe_batches(channel, last_id):
+            for message in batch:
+                yield message
+
+    async def asubscribe_batches(self, channel: str, last_id: str) -> AsyncIterator[list[tuple[str, str]]]:
+        stream = self._stream(channel)
+        if last_id == "$":
+            stream_id = stream.last_id
+        elif last_id:
+            stream_id = _parse_id(last_id)
+        else:
+            stream_id = (0, 0)
+
+        while True:
+            entries = stream.read_after(stream_id, self.count)
+            if not entries:
+                async with stream.changed:
+                    await stream.changed.wait_for(functools.partial(stream.has_after, stream_id))
+                continue
+
+            stream_id = entries[-1][0]
+            yield [(formatted_id, message) for _, formatted_id, message in entries]
+
+    async def create_group(self, channel: str, group: str, last_id: str = "0") -> None:
+        stream = self._stream(channel)
+        if group in stream.groups:
+            return
+        stream.groups[group] = _Group(stream.last_id if last_id == "$" else _parse_id(last_id))
+
+    async def ack(self, channel: str, group: str, *stream_ids: str) -> None:
+        pending = self._stream(channel).groups[group].pending
+        for stream_id in stream_ids:
+            pending.pop(stream_id, None)
+
+    async def asubscribe_group(  # noqa: PLR0913
+        self,
+        channel: str,
+        group: str,
+        consumer: str,
+        min_idle_time: int = 60000,
+        reclaim_interval: float = 30.0,
+    ) -> AsyncIterator[tuple[str, str]]:
+        await self.create_group(channel, group)
+        stream = self._stream(channel)
+        state = stream.groups[group]
+
+        # Start with messages delivered to this consumer before, but never acknowledged.
+        own_pending = [
+            (stream_id, message) for stream_id, (owner, _, message) in state.pending.items() if owner == consumer
+        ]
+        for stream_id, message in own_pending:
+            state.pending[stream_id] = (consumer, time.monotonic(), message)
+            yield (stream_id, message)
+
+        last_reclaim = time.monotonic()
+        while True:
+            now = time.monotonic()
+            if now - last_reclaim >= reclaim_interval:
+                last_reclaim = now
+                idle = [
+                    (stream_id, message)
+                    for stream_id, (_, delivered_at, message) in state.pending.items()
+                    if (now - delivered_at) * 1000 >= min_idle_time
+                ]
+                for stream_id, message in idle[: self.count]:
+                    state.pending[stream_id] = (consumer, now, message)
+                    yield (stream_id, message)
+
+            entries = stream.read_after(state.last_delivered, self.count)
+            if not entries:
+                async with stream.changed:
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(
+                            stream.changed.wait_for(functools.partial(stream.has_after, state.last_delivered)),
+                            reclaim_interval,
+                        )
+                continue
+
+            state.last_delivered = entries[-1][0]
+            for _, formatted_id, message in entries:
+                state.pending[formatted_id] = (consumer, time.monotonic(), message)
+                yield (formatted_id, message)
@@ -1,10 +1,91 @@
 import abc
 import logging
-from collections.abc import AsyncIterator
-from typing import Iterator
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from itertools import islice
+from typing import Any
 
-from redis.asyncio.client import Redis as AIORedis
 from redis import Redis as SyncRedis
+from redis.asyncio.client import Redis as AIORedis
+from redis.exceptions import ResponseError
+
+# Number of XADD commands sent to Redis in a single pipeline by publish_many.
+PUBLISH_BATCH_SIZE = 1000
+
+
+def _chunks(messages: Iterable[str], size: int) -> Iterator[list[str]]:
+    iterator = iter(messages)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class ReadBatching:
+    """
+    Adapts XREAD COUNT and BLOCK arguments to the observed stream load.
+
+    While the stream is backlogged (a read returns the full batch), count doubles up to `max_count`,
+    so consumers make fewer round trips. When reads return less than half of the batch, count halves
+    down to `count`. While the stream is idle, block doubles up to `max_block`, so idle consumers wake up
+    less often; it resets to `block` as soon as messages arrive.
+
+    Set `max_count` equal to `count` and `max_block` equal to `block` to disable adaptation.
+    """
+
+    def __init__(self, count: int = 10, max_count: int = 1000, block: int = 1000, max_block: int = 10000) -> None:
+        """
+        :param count: Initial and minimal number of messages to read at once.
+        :param max_count: Maximal number of messages to read at once.
+        :param block: Initial and minimal time in milliseconds to wait for new messages.
+        :param max_block: Maximal time in milliseconds to wait for new messages.
+        """
+        self.min_count = count
+        self.max_count = max_count
+        self.min_block = block
+        self.max_block = max_block
+
+        self.count = count
+        self.block = block
+
+    def update(self, received: int) -> None:
+        """
+        Adjust count and block after a read that returned `received` messages.
+        """
+        if received >= self.count:
+            self.count = min(self.count * 2, self.max_count)
+        elif received < self.count // 2:
+            self.count = max(self.count // 2, self.min_count)
+
+        if received == 0:
+            self.block = min(self.block * 2, self.max_block)
+        else:
+            self.block = self.min_block
+
+    def copy(self) -> "ReadBatching":
+        """
+        Return fresh batching state with the same settings, so each subscription adapts independently.
+        """
+        return ReadBatching(self.min_count, self.max_count, self.min_block, self.max_block)
+
+
+def _is_busy_group_error(e: ResponseError) -> bool:
+    """
+    Check if XGROUP CREATE failed because the group already exists.
+    """
+    return str(e).startswith("BUSYGROUP")
+
+
+def _parse_entry(entry: tuple[Any, Any]) -> tuple[str, str | None]:
+    """
+    Convert raw stream entry into (stream_id, message) tuple.
+
+    Message is None if the entry is malformed.
+    """
+    stream_id = entry[0].decode()
+    fields = entry[1]
+    if fields is None or b"message" not in fields:
+        logging.warning("Malformed message, skipping")
+        return stream_id, None
+    return stream_id, fields[b"message"].decode()
 
 
 class MessageBroker(abc.ABC):
@@ -23,12 +104,102 @@ class MessageBroker(abc.ABC):
         since it is supported by all languages.
         """
 
+    async def publish_many(self, channel: str, messages: Iterable[str]) -> None:
+        """
+        Publish several messages to the specified channel.
+
+        Override it if the broker can publish messages in bulk more efficiently.
+        """
+        for message in messages:
+            await self.publish(channel, message)
+
     @abc.abstractmethod
-    async def asubscribe(self, channel: str) -> AsyncIterator[str]:
+    def asubscribe(self, channel: str, last_id: str) -> AsyncIterator[tuple[str, str]]:
         """
         Asynchronously subscribes to the specified channel and
-        returns async generator which yields messages.
+        returns async generator which yields (stream_id, message) tuples
+        of messages published after last_id.
+        """
+
+    def asubscribe_batches(self, channel: str, last_id: str) -> AsyncIterator[list[tuple[str, str]]]:
+        """
+        Subscribe like asubscribe, but yield messages in batches.
+        """
+        raise NotImplementedError
+
+    async def create_group(self, channel: str, group: str, last_id: str = "0") -> None:
+        """
+        Create consumer group for the channel, if it does not exist yet.
+        """
+        raise NotImplementedError
+
+    async def ack(self, channel: str, group: str, *stream_ids: str) -> None:
+        """
+        Acknowledge that messages received with asubscribe_group were processed.
+        """
+        raise NotImplementedError
+
+    def asubscribe_group(self, channel: str, group: str, consumer: str) -> AsyncIterator[tuple[str, str]]:
+        """
+        Subscribe to the specified channel as a member of consumer group.
+        Each message is delivered to a single consumer of the group.
+        """
+        raise NotImplementedError
+
+
+class SyncMessageBroker(abc.ABC):
+    """
+    Abstract class for implementing message brokers with blocking API, for code that runs outside of event loop.
+
+    Methods mirror MessageBroker, but return plain values and iterators instead of coroutines and async iterators.
+    """
+
+    @abc.abstractmethod
+    def publish(self, channel: str, message: str) -> None:
+        """
+        Publish the message to the specified channel, see `MessageBroker.publish`.
+        """
+
+    def publish_many(self, channel: str, messages: Iterable[str]) -> None:
+        """
+        Publish several messages to the specified channel.
+
+        Override it if the broker can publish messages in bulk more efficiently.
+        """
+        for message in messages:
+            self.publish(channel, message)
+
+    @abc.abstractmethod
+    def asubscribe(self, channel: str, last_id: str) -> Iterator[tuple[str, str]]:
+        """
+        Subscribe to the specified channel and return generator which yields (stream_id, message) tuples
+        of messages published after last_id.
+        """
+
+    def asubscribe_batches(self, channel: str, last_id: str) -> Iterator[list[tuple[str, str]]]:
+        """
+        Subscribe like asubscribe, but yield messages in batches.
+        """
+        raise NotImplementedError
+
+    def create_group(self, channel: str, group: str, last_id: str = "0") -> None:
+        """
+        Create consumer group for the channel, if it does not exist yet.
+        """
+        raise NotImplementedError
+
+    def ack(self, channel: str, group: str, *stream_ids: str) -> None:
+        """
+        Acknowledge that messages received with asubscribe_group were processed.
+        """
+        raise NotImplementedError
+
+    def asubscribe_group(self, channel: str, group: str, consumer: str) -> Iterator[tuple[str, str]]:
         """
+        Subscribe to the specified channel as a member of consumer group.
+        Each message is delivered to a single consumer of the group.
+        """
+        raise NotImplementedError
 
 
 class RedisMessageBroker(MessageBroker):
@@ -38,75 +209,361 @@ class RedisMessageBroker(MessageBroker):
     Uses xadd/xread commands to publish/subscribe,
     plus allows to specify last_id to get new messages
     even after worker downtime.
+
+    Consumer groups (xreadgroup/xack) are supported with asubscribe_group,
+    allowing to share load between several workers.
     """
 
     redis_client: AIORedis
+    maxlen: int | None
+    batching: ReadBatching
 
-    def __init__(self, redis_pool: AIORedis) -> None:
+    def __init__(
+        self,
+        redis_pool: AIORedis,
+        maxlen: int | None = None,
+        batching: ReadBatching | None = None,
+    ) -> None:
+        """
+        :param maxlen: If set, streams are trimmed to approximately this number of messages
+            (XADD MAXLEN ~) on each publish, so they stay bounded in memory.
+        :param batching: Settings of read batch size and blocking time used by subscriptions.
+        """
         self.redis_client = redis_pool
+        self.maxlen = maxlen
+        self.batching = batching if batching is not None else ReadBatching()
 
     async def publish(self, channel: str, message: str) -> None:
-        await self.redis_client.xadd(channel, {"message": message})
+        await self.redis_client.xadd(channel, {"message": message}, maxlen=self.maxlen, approximate=True)
+
+    async def publish_many(self, channel: str, messages: Iterable[str]) -> None:
+        """
+        Publish several messages to the specified channel, pipelining XADD commands
+        to avoid a network round trip per message.
+        """
+        for chunk in _chunks(messages, PUBLISH_BATCH_SIZE):
+            pipeline = self.redis_client.pipeline(transaction=False)
+            for message in chunk:
+                pipeline.xadd(channel, {"message": message}, maxlen=self.maxlen, approximate=True)
+            await pipeline.execute()
 
     async def asubscribe(
         self,
         channel: str,
         last_id: str,
     ) -> AsyncIterator[tuple[str, str]]:
+        async for batch in self.asubscribe_batches(channel, last_id):
+            for message in batch:
+                yield message
+
+    async def asubscribe_batches(
+        self,
+        channel: str,
+        last_id: str,
+    ) -> AsyncIterator[list[tuple[str, str]]]:
+        """
+        Subscribe like asubscribe, but yield all messages obtained by a single read at once,
+        so they may be processed in bulk (e.g. in a single DB transaction).
+        """
         stream_id = last_id if last_id else "0"
+        batching = self.batching.copy()
+
+        while True:
+            # Continuosly poll for new messages, waiting up to
+            # batching.block milliseconds if no messages are present.
+            events = await self.redis_client.xread({channel: stream_id}, block=batching.block, count=batching.count)
+            batch: list[tuple[str, str]] = []
+            received = 0
+            for _, es in events:
+                for e in es:
+                    received += 1
+                    stream_id, message = _parse_entry(e)
+                    if message is not None:
+                        batch.append((stream_id, message))
+
+            batching.update(received)
+            if batch:
+                yield batch
+
+    async def create_group(self, channel: str, group: str, last_id: str = "0") -> None:
+        """
+        Create consumer group for the channel, if it does not exist yet.
+        The stream is created as well, so groups may be set up before anything is published.
+
+        :param last_id: ID of the last message considered delivered to the group.
+            "0" delivers the whole stream history to the group, "$" delivers only new messages.
+        """
+        try:
+            await self.redis_client.xgroup_create(channel, group, id=last_id, mkstream=True)
+        except ResponseError as e:
+            if not _is_busy_group_error(e):
+                raise
+
+    async def ack(self, channel: str, group: str, *stream_ids: str) -> None:
+        """
+        Acknowledge that messages received with asubscribe_group were processed.
+        """
+        await self.redis_client.xack(channel, group, *stream_ids)
+
+    async def asubscribe_group(  # noqa: C901, PLR0913
+        self,
+        channel: str,
+        group: str,
+        consumer: str,
+        min_idle_time: int = 60000,
+        reclaim_interval: float = 30.0,
+    ) -> AsyncIterator[tuple[str, str]]:
+        """
+        Subscribe to the specified channel as a member of consumer group.
+
+        Each message is delivered to a single consumer of the group, so load is shared between
+        all processes that subscribe with the same group and different consumer names.
+        Delivery is at-least-once: acknowledge each processed message with `ack`, otherwise it is
+        delivered again after this consumer restarts, or reclaimed by any consumer of the group
+        once it stays unacknowledged for `min_idle_time` milliseconds.
+
+        :param consumer: Name of this consumer, unique within the group and stable across restarts.
+        :param min_idle_time: Time in milliseconds after which unacknowledged messages of crashed consumers are
+            reclaimed.
+        :param reclaim_interval: How often, in seconds, to look for messages to reclaim.
+        """
+        await self.create_group(channel, group)
+
+        # Start with messages delivered to this consumer before restart, but never acknowledged.
+        # Once they are exhausted, switch to new messages (">").
+        stream_id = "0"
+        reclaim_cursor: str | bytes = "0-0"
+        last_reclaim = time.monotonic()
+        batching = self.batching.copy()
 
         while True:
-            # Continuosly poll for new messages,
-            # sleeping for 1s if no messages are present.
-            events = await self.redis_client.xread({channel: stream_id}, block=1000, count=10)
+            # Reclaimed messages become pending for this consumer, so only reclaim after own backlog is replayed,
+            # otherwise they would be yielded twice.
+            if stream_id == ">" and time.monotonic() - last_reclaim >= reclaim_interval:
+                last_reclaim = time.monotonic()
+                reclaimed = await self.redis_client.xautoclaim(
+                    channel,
+                    group,
+                    consumer,
+                    min_idle_time,
+                    start_id=reclaim_cursor,
+                    count=batching.count,
+                )
+                reclaim_cursor = reclaimed[0]
+                for e in reclaimed[1]:
+                    if e[0] is None:
+                        continue
+                    message_id, message = _parse_entry(e)
+                    if message is None:
+                        await self.ack(channel, group, message_id)
+                        continue
+                    yield (message_id, message)
+
+            events = await self.redis_client.xreadgroup(
+                group,
+                consumer,
+                {channel: stream_id},
+                block=batching.block,
+                count=batching.count,
+            )
+            received = 0
             for _, es in events:
                 for e in es:
-                    stream_id = e[0].decode()
+                    received += 1
+                    message_id, message = _parse_entry(e)
+                    if stream_id != ">":
+                        stream_id = message_id
 
-                    if b"message" not in e[1]:
-                        logging.warning("Malformed message, skipping")
+                    if message is None:
+                        # Acknowledge malformed messages, so they are not redelivered forever.
+                        await self.ack(channel, group, message_id)
                         continue
 
-                    message = e[1][b"message"].decode()
-                    yield (stream_id, message)
+                    yield (message_id, message)
 
+            batching.update(received)
+            if stream_id != ">" and not received:
+                stream_id = ">"
 
 
-class RedisSyncMessageBroker(MessageBroker):
+class RedisSyncMessageBroker(SyncMessageBroker):
     """
     Implementation of MessageBroker using Redis.
 
     Uses xadd/xread commands to publish/subscribe,
     plus allows to specify last_id to get new messages
     even after worker downtime.
+
+    Consumer groups (xreadgroup/xack) are supported with asubscribe_group,
+    allowing to share load between several workers.
     """
 
     redis_client: SyncRedis
+    maxlen: int | None
+    batching: ReadBatching
 
-    def __init__(self, redis_pool: SyncRedis) -> None:
+    def __init__(
+        self,
+        redis_pool: SyncRedis,
+        maxlen: int | None = None,
+        batching: ReadBatching | None = None,
+    ) -> None:
+        """
+        :param maxlen: If set, streams are trimmed to approximately this number of messages
+            (XADD MAXLEN ~) on each publish, so they stay bounded in memory.
+        :param batching: Settings of read batch size and blocking time used by subscriptions.
+        """
         self.redis_client = redis_pool
+        self.maxlen = maxlen
+        self.batching = batching if batching is not None else ReadBatching()
 
     def publish(self, channel: str, message: str) -> None:
-        self.redis_client.xadd(channel, {"message": message})
+        self.redis_client.xadd(channel, {"message": message}, maxlen=self.maxlen, approximate=True)
+
+    def publish_many(self, channel: str, messages: Iterable[str]) -> None:
+        """
+        Publish several messages to the specified channel, pipelining XADD commands
+        to avoid a network round trip per message.
+        """
+        for chunk in _chunks(messages, PUBLISH_BATCH_SIZE):
+            pipeline = self.redis_client.pipeline(transaction=False)
+            for message in chunk:
+                pipeline.xadd(channel, {"message": message}, maxlen=self.maxlen, approximate=True)
+            pipeline.execute()
 
     def asubscribe(
         self,
         channel: str,
         last_id: str,
     ) -> Iterator[tuple[str, str]]:
+        for batch in self.asubscribe_batches(channel, last_id):
+            yield from batch
+
+    def asubscribe_batches(
+        self,
+        channel: str,
+        last_id: str,
+    ) -> Iterator[list[tuple[str, str]]]:
+        """
+        Subscribe like asubscribe, but yield all messages obtained by a single read at once,
+        so they may be processed in bulk (e.g. in a single DB transaction).
+        """
         stream_id = last_id if last_id else "0"
+        batching = self.batching.copy()
+
+        while True:
+            # Continuosly poll for new messages, waiting up to
+            # batching.block milliseconds if no messages are present.
+            events = self.redis_client.xread({channel: stream_id}, block=batching.block, count=batching.count)
+            batch: list[tuple[str, str]] = []
+            received = 0
+            for _, es in events:
+                for e in es:
+                    received += 1
+                    stream_id, message = _parse_entry(e)
+                    if message is not None:
+                        batch.append((stream_id, message))
+
+            batching.update(received)
+            if batch:
+                yield batch
+
+    def create_group(self, channel: str, group: str, last_id: str = "0") -> None:
+        """
+        Create consumer group for the channel, if it does not exist yet.
+        The stream is created as well, so groups may be set up before anything is published.
+
+        :param last_id: ID of the last message considered delivered to the group.
+            "0" delivers the whole stream history to the group, "$" delivers only new messages.
+        """
+        try:
+            self.redis_client.xgroup_create(channel, group, id=last_id, mkstream=True)
+        except ResponseError as e:
+            if not _is_busy_group_error(e):
+                raise
+
+    def ack(self, channel: str, group: str, *stream_ids: str) -> None:
+        """
+        Acknowledge that messages received with asubscribe_group were processed.
+        """
+        self.redis_client.xack(channel, group, *stream_ids)
+
+    def asubscribe_group(  # noqa: C901, PLR0913
+        self,
+        channel: str,
+        group: str,
+        consumer: str,
+        min_idle_time: int = 60000,
+        reclaim_interval: float = 30.0,
+    ) -> Iterator[tuple[str, str]]:
+        """
+        Subscribe to the specified channel as a member of consumer group.
+
+        Each message is delivered to a single consumer of the group, so load is shared between
+        all processes that subscribe with the same group and different consumer names.
+        Delivery is at-least-once: acknowledge each processed message with `ack`, otherwise it is
+        delivered again after this consumer restarts, or reclaimed by any consumer of the group
+        once it stays unacknowledged for `min_idle_time` milliseconds.
+
+        :param consumer: Name of this consumer, unique within the group and stable across restarts.
+        :param min_idle_time: Time in milliseconds after which unacknowledged messages of crashed consumers are
+            reclaimed.
+        :param reclaim_interval: How often, in seconds, to look for messages to reclaim.
+        """
+        self.create_group(channel, group)
+
+        # Start with messages delivered to this consumer before restart, but never acknowledged.
+        # Once they are exhausted, switch to new messages (">").
+        stream_id = "0"
+        reclaim_cursor: str | bytes = "0-0"
+        last_reclaim = time.monotonic()
+        batching = self.batching.copy()
 
         while True:
-            # Continuosly poll for new messages,
-            # sleeping for 1s if no messages are present.
-            events = self.redis_client.xread({channel: stream_id}, block=1000, count=10)
+            # Reclaimed messages become pending for this consumer, so only reclaim after own backlog is replayed,
+            # otherwise they would be yielded twice.
+            if stream_id == ">" and time.monotonic() - last_reclaim >= reclaim_interval:
+                last_reclaim = time.monotonic()
+                reclaimed = self.redis_client.xautoclaim(
+                    channel,
+                    group,
+                    consumer,
+                    min_idle_time,
+                    start_id=reclaim_cursor,
+                    count=batching.count,
+                )
+                reclaim_cursor = reclaimed[0]
+                for e in reclaimed[1]:
+                    if e[0] is None:
+                        continue
+                    message_id, message = _parse_entry(e)
+                    if message is None:
+                        self.ack(channel, group, message_id)
+                        continue
+                    yield (message_id, message)
+
+            events = self.redis_client.xreadgroup(
+                group,
+                consumer,
+                {channel: stream_id},
+                block=batching.block,
+                count=batching.count,
+            )
+            received = 0
             for _, es in events:
                 for e in es:
-                    stream_id = e[0].decode()
+                    received += 1
+                    message_id, message = _parse_entry(e)
+                    if stream_id != ">":
+                        stream_id = message_id
 
-                    if b"message" not in e[1]:
-                        logging.warning("Malformed message, skipping")
+                    if message is None:
+                        # Acknowledge malformed messages, so they are not redelivered forever.
+                        self.ack(channel, group, message_id)
                         continue
 
-                    message = e[1][b"message"].decode()
-                    yield (stream_id, message)
+                    yield (message_id, message)
+
+            batching.update(received)
+            if stream_id != ">" and not received:
+                stream_id = ">"
@@ -0,0 +1,173 @@
+"""
+Runner that processes messages from a message broker concurrently.
+
+Messages are handled by a bounded pool of workers: coroutine handlers run as asyncio tasks,
+plain functions run in a thread pool (or any other executor, e.g. ProcessPoolExecutor).
+Reading from the stream pauses while all workers are busy, so a slow handler applies backpressure
+instead of piling up messages in memory.
+
+Although messages are processed out of order, they are acknowledged and checkpointed in stream order:
+the checkpoint always points at the last message such that it and all messages before it are processed.
+Persist it and pass it as `last_id` on restart to resume without losing messages.
+"""
+import asyncio
+import contextlib
+import inspect
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import Executor
+from typing import Any
+
+from odevlib.distributed.message_broker import MessageBroker
+
+Handler = Callable[[str, str], Awaitable[None]] | Callable[[str, str], Any]
+Checkpoint = Callable[[str], Awaitable[None]]
+
+
+class MessageRunner:
+    """
+    Dispatches messages to `handler(stream_id, message)` with at most `concurrency` messages in flight.
+
+    If the handler raises, the exception is logged. With `run`, the message is considered processed anyway.
+    With `run_group`, the message is left unacknowledged, so the consumer group redelivers it later.
+
+    .. code-block:: python
+
+       async def handle(stream_id: str, message: str) -> None:
+           ...
+
+       async def save_checkpoint(stream_id: str) -> None:
+           await redis.set("events:last_id", stream_id)
+
+       runner = MessageRunner(broker, handle, concurrency=32, checkpoint=save_checkpoint)
+       await runner.run("events", last_id=await redis.get("events:last_id"))
+    """
+
+    broker: MessageBroker
+    handler: Handler
+    concurrency: int
+    executor: Executor | None
+    checkpoint: Checkpoint | None
+
+    # ID of the last message such that it and all messages before it are processed.
+    last_processed_id: str | None
+
+    def __init__(  # noqa: PLR0913
+        self,
+        broker: MessageBroker,
+        handler: Handler,
+        concurrency: int = 16,
+        executor: Executor | None = None,
+        checkpoint: Checkpoint | None = None,
+        max_pending: int | None = None,
+    ) -> None:
+        """
+        :param concurrency: Maximal number of messages processed at the same time.
+        :param executor: Executor for synchronous handlers. Defaults to the event loop's thread pool.
+            Pass ProcessPoolExecutor for CPU-bound handlers; handler must be picklable then.
+        :param checkpoint: Called with the latest checkpointed stream id after each group of processed messages.
+        :param max_pending: Maximal number of messages dispatched, but not checkpointed yet. Limits how far
+            processing may run ahead of a slow message. Defaults to 4 * concurrency.
+        """
+        self.broker = broker
+        self.handler = handler
+        self.concurrency = concurrency
+        self.executor = executor
+        self.checkpoint = checkpoint
+        self.max_pending = max_pending if max_pending is not None else 4 * concurrency
+        self.last_processed_id = None
+
+        self._is_async = inspect.iscoroutinefunction(handler)
+
+    async def run(self, channel: str, last_id: str) -> None:
+        """
+        Process messages of the channel starting after `last_id`, until cancelled.
+        """
+        await self._run(self.broker.asubscribe(channel, last_id), ack=None)
+
+    async def run_group(self, channel: str, group: str, consumer: str) -> None:
+        """
+        Process messages of the channel as a member of consumer group, until cancelled.
+
+        Successfully processed messages are acknowledged in stream order.
+        """
+
+        async def ack(stream_ids: list[str]) -> None:
+            await self.broker.ack(channel, group, *stream_ids)
+
+        await self._run(self.broker.asubscribe_group(channel, group, consumer), ack=ack)
+
+    async def _process(self, stream_id: str, message: str) -> bool:
+        try:
+            if self._is_async:
+                await self.handler(stream_id, message)
+            else:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self.executor, self.handler, stream_id, message)
+        except Exception:
+            logging.exception("Error occurred while processing message %s", stream_id)
+            return False
+        else:
+            return True
+
+    async def _commit(
+        self,
+        queue: "asyncio.Queue[tuple[str, asyncio.Task[bool]]]",
+        ack: Callable[[list[str]], Awaitable[None]] | None,
+    ) -> None:
+        """
+        Wait for dispatched messages in stream order, acknowledging and checkpointing them in groups.
+        """
+        to_ack: list[str] = []
+        uncommitted = 0
+        while True:
+            stream_id, task = await queue.get()
+            try:
+                # Unlike awaiting the task, waiting doesn't raise if the task was cancelled, so the committer
+                # keeps running and queue.join() in _run can't hang.
+                await asyncio.wait([task])
+                if task.cancelled():
+                    logging.warning("Processing of message %s was cancelled", stream_id)
+                elif task.result():
+                    to_ack.append(stream_id)
+                self.last_processed_id = stream_id
+
+                # Commit when nothing else is dispatched or every `concurrency` messages,
+                # so a single XACK/checkpoint call covers a group of messages.
+                uncommitted += 1
+                if queue.empty() or uncommitted >= self.concurrency:
+                    uncommitted = 0
+                    if ack is not None and to_ack:
+                        await ack(to_ack)
+                        to_ack = []
+                    if self.checkpoint is not None:
+                        await self.checkpoint(stream_id)
+            except Exception:
+                logging.exception("Error occurred while committing processed messages")
+            finally:
+                queue.task_done()
+
+    async def _run(
+        self,
+        messages: AsyncIterator[tuple[str, str]],
+        ack: Callable[[list[str]], Awaitable[None]] | None,
+    ) -> None:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        queue: asyncio.Queue[tuple[str, asyncio.Task[bool]]] = asyncio.Queue(maxsize=self.max_pending)
+        committer = asyncio.create_task(self._commit(queue, ack))
+
+        try:
+            async for stream_id, message in messages:
+                await semaphore.acquire()
+                task = asyncio.create_task(self._process(stream_id, message))
+                # Released even if the task is cancelled before it starts running.
+                task.add_done_callback(lambda _: semaphore.release())
+                await queue.put((stream_id, task))
+        finally:
+            try:
+                # Let in-flight messages finish and get committed before stopping.
+                await queue.join()
+            finally:
+                committer.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await committer
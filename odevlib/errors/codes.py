@@ -26,6 +26,9 @@ internal_server_error: int = 7
 # When no authentication information was provided
 unauthenticated: int = 8
 
+# When external service is unavailable, e.g. its circuit breaker is open
+service_unavailable: int = 9
+
 # Custom HTTP status codes for internal error codes
 status_code_mapping = {
     invalid_request_data: status.HTTP_400_BAD_REQUEST,
@@ -34,4 +37,5 @@ status_code_mapping = {
     not_found: status.HTTP_404_NOT_FOUND,
     internal_server_error: status.HTTP_500_INTERNAL_SERVER_ERROR,
     unauthenticated: status.HTTP_401_UNAUTHORIZED,
+    service_unavailable: status.HTTP_503_SERVICE_UNAVAILABLE,
 }
@@ -3,25 +3,129 @@ This package contains API client that may be used to easily integrate
 with other services implemented in ODevLib.
 
 Error handling is seamless when integrating ODevLib services.
+
+Each client owns a `requests.Session`, so connections to the service are pooled and kept alive
+between requests instead of paying TCP and TLS handshakes on every call. Share one client
+per service (e.g. a module-level instance) to benefit from it.
+
+Idempotent requests are retried on transient failures, and requests to a failing service are suspended
+by its circuit breaker, see `odevlib.integrations.odevlib.resilience`. GET responses may be cached
+according to HTTP caching headers, see `odevlib.integrations.odevlib.response_cache`.
 """
 
 
+import hashlib
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from http import HTTPStatus
+from types import TracebackType
 from typing import Any
+from urllib.parse import urlencode
 
 import requests
-from requests.exceptions import JSONDecodeError
+from requests.adapters import HTTPAdapter
 
 from odevlib.errors import codes
+from odevlib.integrations.odevlib.resilience import (
+    CircuitBreaker,
+    RequestAttempts,
+    RetryPolicy,
+    get_circuit_breaker,
+)
+from odevlib.integrations.odevlib.response_cache import CachedResponse, ResponseCache
 from odevlib.models.errors import Error
+from odevlib.utils import json_backend
+
+
+def parse_response(status_code: int, content: bytes) -> Any | Error:  # noqa: ANN401
+    """
+    Convert response of ODevLib service into its JSON data or Error, if the service returned one.
+    """
+    try:
+        data = json_backend.loads(content)
+    except ValueError:
+        return Error(
+            error_code=codes.unhandled_error,
+            eng_description=f"Couldn't parse JSON when sending request to external API. Status code: {status_code}.",
+            ui_description=f"Couldn't parse JSON when sending request to external API. Status code: {status_code}.",
+        )
+
+    # Handle ODevLib errors on the other side
+    if "error_code" in data:
+        return Error(
+            error_code=data["error_code"],
+            eng_description=data["eng_description"],
+            ui_description=data["ui_description"],
+        )
+    return data
 
 
 class ODLAPIClient:
     token: str
     base_url: str
+    connect_timeout: float
+    read_timeout: float
+    session: requests.Session
+    retry_policy: RetryPolicy
+    circuit_breaker: CircuitBreaker | None
+    response_cache: ResponseCache | None
 
-    def __init__(self, base_url: str, token: str) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        base_url: str,
+        token: str,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 30.0,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: bool = True,
+        response_cache: ResponseCache | None = None,
+    ) -> None:
+        """
+        :param connect_timeout: Seconds to wait for connection to the service to be established.
+        :param read_timeout: Seconds to wait between bytes of the response.
+        :param pool_connections: Number of hosts to keep connection pools for.
+        :param pool_maxsize: Maximal number of kept-alive connections per host. Should be at least
+            the number of threads sending requests through this client at the same time.
+        :param pool_block: If True, block when all connections to a host are busy instead of opening
+            an extra connection that is discarded afterwards.
+        :param retry_policy: Policy of retrying failed requests. Defaults to RetryPolicy().
+        :param circuit_breaker: Whether to use the shared circuit breaker of base URL.
+        :param response_cache: Cache of GET responses, e.g. LRUResponseCache() or RedisResponseCache(timeout=3600).
+            See `odevlib.integrations.odevlib.response_cache`. Disabled by default.
+        """
         self.base_url = base_url
         self.token = token
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.circuit_breaker = get_circuit_breaker(base_url) if circuit_breaker else None
+        self.response_cache = response_cache
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """
+        Close all pooled connections.
+        """
+        self.session.close()
+
+    def __enter__(self) -> "ODLAPIClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
 
     def apply_authentication(self, headers: dict, query_params: dict) -> tuple[dict, dict]:
         """
@@ -31,6 +135,65 @@ class ODLAPIClient:
         headers.update({"Authorization": f"Token {self.token}"})
         return headers, query_params
 
+    def send_raw_request(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        body: Any = None,  # noqa: ANN401
+        query_params: dict | None = None,
+        headers: dict[str, Any] | None = None,
+        stream: bool = False,
+    ) -> requests.Response | Error:
+        """
+        Send a request to external API, applying authentication, retries and circuit breaker,
+        and return the response itself, e.g. to access its headers.
+
+        :param stream: If True, the body is not read until accessed. Close the response afterwards.
+        """
+        if query_params is None:
+            query_params = {}
+        if headers is None:
+            headers = {}
+        headers, query_params = self.apply_authentication(headers, query_params)
+
+        content = None
+        if body is not None:
+            content = json_backend.dumps(body)
+            headers = {"Content-Type": "application/json", **headers}
+
+        attempts = RequestAttempts(method, self.base_url, self.retry_policy, self.circuit_breaker)
+        while True:
+            error = attempts.start()
+            if error is not None:
+                return error
+
+            try:
+                response = self.session.request(
+                    method,
+                    f"{self.base_url}/{url}",
+                    data=content,
+                    headers=headers,
+                    params=query_params,
+                    timeout=(self.connect_timeout, self.read_timeout),
+                    stream=stream,
+                )
+            except requests.RequestException as e:
+                delay = attempts.failed()
+                if delay is None:
+                    return Error(
+                        error_code=codes.unhandled_error,
+                        eng_description=f"Couldn't send request to external API: {e}",
+                        ui_description="Couldn't send request to external API",
+                    )
+            else:
+                delay = attempts.responded(response.status_code, response.headers.get("Retry-After"))
+                if delay is None:
+                    return response
+                response.close()
+            finally:
+                attempts.end()
+            time.sleep(delay)
+
     def send_request(
         self,
         method: str,
@@ -48,38 +211,51 @@ class ODLAPIClient:
         :param query_params: Query parameters to send with request, if any.
         :return: Response from external API.
         """
+        if self.response_cache is not None and method.upper() == "GET":
+            return self._send_cached_get(url, query_params, headers)
 
-        if query_params is None:
-            query_params = {}
-        if headers is None:
-            headers = {}
-        headers, query_params = self.apply_authentication(headers, query_params)
+        response = self.send_raw_request(method, url, body, query_params, headers)
+        if isinstance(response, Error):
+            return response
+        return parse_response(response.status_code, response.content)
 
-        response = requests.request(
-            method,
-            f"{self.base_url}/{url}",
-            json=body,
-            headers=headers,
-            params=query_params,
-        )
+    def get_response_cache_key(self, url: str, query_params: dict | None) -> str:
+        """
+        Return key of the GET response in response cache. Responses are cached separately for each token.
+        """
+        params = urlencode(sorted((query_params or {}).items()), doseq=True)
+        token_hash = hashlib.sha256(self.token.encode("utf-8")).hexdigest()[:16]
+        return f"{token_hash}:{self.base_url}/{url}?{params}"
 
-        try:
-            json = response.json()
-            # Handle ODevLib errors on the other side
-            if "error_code" in json:
-                return Error(
-                    error_code=json["error_code"],
-                    eng_description=json["eng_description"],
-                    ui_description=json["ui_description"],
-                )
-        except JSONDecodeError:
-            return Error(
-                error_code=codes.unhandled_error,
-                eng_description=f"Couldn't parse JSON when sending request to external API. Status code: {response.status_code}.",
-                ui_description=f"Couldn't parse JSON when sending request to external API. Status code: {response.status_code}.",
-            )
+    def _send_cached_get(
+        self,
+        url: str,
+        query_params: dict | None,
+        headers: dict[str, Any] | None,
+    ) -> dict | Error:
+        assert self.response_cache is not None
+        key = self.get_response_cache_key(url, query_params)
+        cached = self.response_cache.get_response(key)
+        if cached is not None:
+            if cached.is_fresh():
+                return parse_response(200, cached.content)
+            headers = {**(headers or {}), **cached.validators()}
+
+        response = self.send_raw_request("GET", url, query_params=query_params, headers=headers)
+        if isinstance(response, Error):
+            return response
+
+        if cached is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+            cached.refresh(response.headers)
+            self.response_cache.set_response(key, cached)
+            return parse_response(200, cached.content)
 
-        return json
+        result = parse_response(response.status_code, response.content)
+        if response.status_code == HTTPStatus.OK and not isinstance(result, Error):
+            entry = CachedResponse.from_response(response.content, response.headers)
+            if entry is not None:
+                self.response_cache.set_response(key, entry)
+        return result
 
     def get(
         self,
@@ -171,3 +347,78 @@ class ODLAPIClient:
         if query_params is None:
             query_params = {}
         return self.send_request("DELETE", url, query_params=query_params)
+
+    def fetch_page(
+        self,
+        url: str,
+        query_params: dict | None = None,
+        count: int = 500,
+        last_id: int | None = None,
+    ) -> tuple[list[dict], bool] | Error:
+        """
+        Fetch a single page of an endpoint provided by OCursorPaginatedListMixin.
+
+        :param last_id: Return objects with ids greater than this one. If None, the first page is returned.
+        :return: Objects of the page and whether there are more objects after them.
+        """
+        params = {**(query_params or {}), "count": count}
+        if last_id is not None:
+            params["last_id"] = last_id
+
+        response = self.send_raw_request("GET", url, query_params=params)
+        if isinstance(response, Error):
+            return response
+
+        page = parse_response(response.status_code, response.content)
+        if isinstance(page, Error):
+            return page
+        return page, response.headers.get("X-ODEVLIB-HAS-MORE") == "true"
+
+    def iter_pages(  # noqa: PLR0913
+        self,
+        url: str,
+        query_params: dict | None = None,
+        count: int = 500,
+        last_id: int | None = None,
+        id_field: str = "id",
+    ) -> Iterator[list[dict] | Error]:
+        """
+        Iterate over all pages of an endpoint provided by OCursorPaginatedListMixin, in order of ids.
+
+        The next page is fetched in a background thread while the current one is processed, and at most
+        two pages are held in memory at once. If a request fails, its Error is yielded and iteration stops.
+
+        :param count: Number of objects per page.
+        :param last_id: Only iterate over objects with ids greater than this one, e.g. to resume a sync.
+        :param id_field: Field of objects that contains their id.
+        """
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="odevlib-page-prefetch") as executor:
+            future: Future | None = executor.submit(self.fetch_page, url, query_params, count, last_id)
+            while future is not None:
+                result = future.result()
+                if isinstance(result, Error):
+                    yield result
+                    return
+
+                page, has_more = result
+                future = None
+                if has_more and page:
+                    future = executor.submit(self.fetch_page, url, query_params, count, page[-1][id_field])
+                yield page
+
+    def iter_items(  # noqa: PLR0913
+        self,
+        url: str,
+        query_params: dict | None = None,
+        count: int = 500,
+        last_id: int | None = None,
+        id_field: str = "id",
+    ) -> Iterator[dict | Error]:
+        """
+        Iterate over all objects of an endpoint provided by OCursorPaginatedListMixin. See `iter_pages`.
+        """
+        for page in self.iter_pages(url, query_params, count, last_id, id_field):
+            if isinstance(page, Error):
+                yield page
+                return
+            yield from page
@@ -0,0 +1,255 @@
+"""
+Asyncio-based counterpart of ODLAPIClient, built on httpx.
+
+Use it to call several ODevLib services (or one service several times) concurrently:
+
+.. code-block:: python
+
+   client = AsyncODLAPIClient("https://orders.example.com/api", token)
+   users, orders = await gather(client.get("users/"), client.get("orders/"), limit=10)
+
+Sync code (e.g. Django views) can run the same coroutines on a process-wide event loop thread:
+
+.. code-block:: python
+
+   users, orders = run_sync(gather(client.get("users/"), client.get("orders/")))
+
+httpx clients are bound to the event loop they are first used in, so a client used through `run_sync`
+must not be used from other event loops.
+
+Retries and circuit breaking work as in ODLAPIClient, and circuit breakers are shared with sync clients.
+"""
+import asyncio
+import threading
+from collections.abc import Awaitable, Coroutine
+from types import TracebackType
+from typing import Any, TypeVar
+
+import httpx
+
+from odevlib.errors import codes
+from odevlib.integrations.odevlib.api_client import parse_response
+from odevlib.integrations.odevlib.resilience import (
+    CircuitBreaker,
+    RequestAttempts,
+    RetryPolicy,
+    get_circuit_breaker,
+)
+from odevlib.models.errors import Error
+from odevlib.utils import json_backend
+
+T = TypeVar("T")
+
+
+class AsyncODLAPIClient:
+    token: str
+    base_url: str
+    client: httpx.AsyncClient
+    retry_policy: RetryPolicy
+    circuit_breaker: CircuitBreaker | None
+
+    def __init__(  # noqa: PLR0913
+        self,
+        base_url: str,
+        token: str,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 30.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: bool = True,
+    ) -> None:
+        """
+        :param connect_timeout: Seconds to wait for connection to the service to be established.
+        :param read_timeout: Seconds to wait between bytes of the response.
+        :param max_connections: Maximal number of connections open at the same time.
+            Further requests wait for a free connection.
+        :param max_keepalive_connections: Maximal number of idle connections kept alive.
+        :param retry_policy: Policy of retrying failed requests. Defaults to RetryPolicy().
+        :param circuit_breaker: Whether to use the shared circuit breaker of base URL.
+        """
+        self.base_url = base_url
+        self.token = token
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.circuit_breaker = get_circuit_breaker(base_url) if circuit_breaker else None
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """
+        Close all pooled connections.
+        """
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncODLAPIClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    def apply_authentication(self, headers: dict, query_params: dict) -> tuple[dict, dict]:
+        """
+        Allow to customize how authentication is applied to the request.
+        Authorization can be either in headers or in query parameters.
+        """
+        headers.update({"Authorization": f"Token {self.token}"})
+        return headers, query_params
+
+    async def send_request(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        body: Any = None,  # noqa: ANN401
+        query_params: dict | None = None,
+        headers: dict[str, Any] | None = None,
+    ) -> dict | Error:
+        """
+        Send a request to external API.
+
+        :param method: HTTP method (GET, POST, PUT, PATCH, DELETE).
+        :param url: URL (excluding base URL) to send request to.
+        :param body: Body of the request, if any.
+        :param query_params: Query parameters to send with request, if any.
+        :return: Response from external API.
+        """
+        if query_params is None:
+            query_params = {}
+        if headers is None:
+            headers = {}
+        headers, query_params = self.apply_authentication(headers, query_params)
+
+        content = None
+        if body is not None:
+            content = json_backend.dumps(body)
+            headers = {"Content-Type": "application/json", **headers}
+
+        attempts = RequestAttempts(method, self.base_url, self.retry_policy, self.circuit_breaker)
+        while True:
+            error = attempts.start()
+            if error is not None:
+                return error
+
+            try:
+                response = await self.client.request(
+                    method,
+                    f"{self.base_url}/{url}",
+                    content=content,
+                    headers=headers,
+                    params=query_params,
+                )
+            except httpx.HTTPError as e:
+                delay = attempts.failed()
+                if delay is None:
+                    return Error(
+                        error_code=codes.unhandled_error,
+                        eng_description=f"Couldn't send request to external API: {e!r}",
+                        ui_description="Couldn't send request to external API",
+                    )
+            else:
+                delay = attempts.responded(response.status_code, response.headers.get("Retry-After"))
+                if delay is None:
+                    return parse_response(response.status_code, response.content)
+            finally:
+                attempts.end()
+            await asyncio.sleep(delay)
+
+    async def get(self, url: str, query_params: dict | None = None) -> dict | Error:
+        """
+        Send GET request to external API.
+        """
+        return await self.send_request("GET", url, query_params=query_params)
+
+    async def post(self, url: str, body: Any, query_params: dict | None = None) -> dict | Error:  # noqa: ANN401
+        """
+        Send POST request to external API.
+        """
+        return await self.send_request("POST", url, body, query_params=query_params)
+
+    async def put(self, url: str, body: Any, query_params: dict | None = None) -> dict | Error:  # noqa: ANN401
+        """
+        Send PUT request to external API.
+        """
+        return await self.send_request("PUT", url, body, query_params=query_params)
+
+    async def patch(self, url: str, body: Any, query_params: dict | None = None) -> dict | Error:  # noqa: ANN401
+        """
+        Send PATCH request to external API.
+        """
+        return await self.send_request("PATCH", url, body, query_params=query_params)
+
+    async def delete(self, url: str, query_params: dict | None = None) -> dict | Error:
+        """
+        Send DELETE request to external API.
+        """
+        return await self.send_request("DELETE", url, query_params=query_params)
+
+
+async def gather(*awaitables: Awaitable[T], limit: int = 10) -> list[T]:
+    """
+    Await all given awaitables with at most `limit` of them running at the same time.
+    Results are returned in the order of awaitables.
+
+    Client methods return Error instead of raising, so a failed request does not cancel the others.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    return await asyncio.gather(*(run(awaitable) for awaitable in awaitables))
+
+
+class EventLoopThread:
+    """
+    Event loop running forever in a daemon thread, used to run coroutines from sync code.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="odevlib-event-loop", daemon=True)
+        self._thread.start()
+
+    def run(self, coroutine: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """
+        Run the coroutine in the loop and wait for its result.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def close(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+_loop_thread: EventLoopThread | None = None
+_loop_thread_lock = threading.Lock()
+
+
+def get_event_loop_thread() -> EventLoopThread:
+    """
+    Return the process-wide event loop thread, starting it on first use.
+    """
+    global _loop_thread  # noqa: PLW0603
+    with _loop_thread_lock:
+        if _loop_thread is None:
+            _loop_thread = EventLoopThread()
+        return _loop_thread
+
+
+def run_sync(coroutine: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+    """
+    Run the coroutine on the process-wide event loop thread and return its result.
+    Must not be called from a coroutine running in that loop.
+    """
+    return get_event_loop_thread().run(coroutine, timeout)
@@ -0,0 +1,46 @@
+"""
+Response cache of ODLAPIClient shared between processes through Redis.
+"""
+from typing import ClassVar
+
+from odevlib.caching.codecs import Codec, PickleCodec
+from odevlib.caching.redis_cache import RedisCache
+from odevlib.errors import codes
+from odevlib.integrations.odevlib.response_cache import CachedResponse, ResponseCache
+from odevlib.models.errors import Error
+
+
+class RedisResponseCache(ResponseCache, RedisCache[str, CachedResponse]):
+    """
+    Shares responses between processes through Redis.
+
+    Entries are kept for `timeout` seconds, which should be longer than their freshness lifetime,
+    so stale entries can still be revalidated.
+    """
+
+    codec: ClassVar[Codec | None] = PickleCodec()
+
+    def get_original_value(self, key: str) -> CachedResponse | Error:  # noqa: PLR6301
+        return Error(
+            error_code=codes.internal_server_error,
+            eng_description=f"Response {key} is not cached. Responses are only cached by ODLAPIClient",
+            ui_description="Response is not cached",
+        )
+
+    def serialize_key(self, key: str) -> str:  # noqa: PLR6301
+        return f"odevlib:api_response:{key}"
+
+    def deserialize_key(self, key: str) -> str:  # noqa: PLR6301
+        return key.removeprefix("odevlib:api_response:")
+
+    def get_response(self, key: str) -> CachedResponse | None:
+        data = self.redis_instance.get(self.serialize_key(key))
+        if self.metrics is not None:
+            if data is None:
+                self.metrics.on_miss(self.__class__.__name__)
+            else:
+                self.metrics.on_hit(self.__class__.__name__)
+        return self.decode_value(data) if data is not None else None
+
+    def set_response(self, key: str, response: CachedResponse) -> None:
+        self.store(key, response)
@@ -0,0 +1,257 @@
+"""
+Retry and circuit breaking policies of ODevLib API clients.
+
+Idempotent requests that failed with a connection error or a transient status (429, 502, 503, 504) are retried
+with exponential backoff and full jitter, honouring `Retry-After` header of the response.
+
+Each base URL has a circuit breaker shared by all clients in the process. After `failure_threshold`
+consecutive failures (connection errors and 5xx responses) it opens, and requests fail fast with
+`codes.service_unavailable` for `recovery_timeout` seconds. Then a single probe request is let through:
+if it succeeds, the breaker closes, otherwise it stays open for another `recovery_timeout`.
+
+`RequestAttempts` applies both to a single request, so clients only send it and wait between attempts.
+"""
+import datetime
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from odevlib.errors import codes
+from odevlib.models.errors import Error
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+TRANSIENT_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class RetryPolicy:
+    max_attempts: int
+    backoff: float
+    max_backoff: float
+    methods: frozenset[str]
+    statuses: frozenset[int]
+
+    def __init__(  # noqa: PLR0913
+        self,
+        max_attempts: int = 3,
+        backoff: float = 0.1,
+        max_backoff: float = 10.0,
+        methods: frozenset[str] = IDEMPOTENT_METHODS,
+        statuses: frozenset[int] = TRANSIENT_STATUSES,
+    ) -> None:
+        """
+        :param max_attempts: Maximal number of attempts, including the first one. 1 disables retries.
+        :param backoff: Base delay in seconds. Delay before n-th retry is random from 0 to backoff * 2^(n-1).
+        :param max_backoff: Upper bound of a single delay, also applied to `Retry-After`.
+        :param methods: HTTP methods that are safe to retry.
+        :param statuses: Response status codes that are retried.
+        """
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.methods = methods
+        self.statuses = statuses
+
+    def should_retry(self, method: str, attempt: int, status_code: int | None = None) -> bool:
+        """
+        Check if the request should be retried after the given attempt (starting from 1).
+
+        :param status_code: Status code of the response, or None if the request failed without a response.
+        """
+        if attempt >= self.max_attempts or method.upper() not in self.methods:
+            return False
+        return status_code is None or status_code in self.statuses
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """
+        Return seconds to wait before the retry following the given attempt.
+        """
+        if retry_after is not None:
+            seconds = parse_retry_after(retry_after)
+            if seconds is not None:
+                return min(seconds, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))  # noqa: S311
+
+
+def parse_retry_after(value: str) -> float | None:
+    """
+    Parse `Retry-After` header, which is either a number of seconds or an HTTP date.
+    """
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.UTC)
+    return max(0.0, (retry_at - datetime.datetime.now(datetime.UTC)).total_seconds())
+
+
+class CircuitBreaker:
+    failure_threshold: int
+    recovery_timeout: float
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self._lock = threading.Lock()
+        self._failures = 0
+        # Monotonic time when the breaker opened, None while it is closed.
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        """
+        Check if a request may be sent now. Once recovery timeout passes, lets a single probe request through.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or time.monotonic() - self._opened_at < self.recovery_timeout:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+    def release_probe(self) -> None:
+        """
+        Let another probe through if the current one ended without a result, e.g. raised an unexpected exception.
+        """
+        with self._lock:
+            self._probing = False
+
+    def error(self, base_url: str) -> Error:
+        return Error(
+            error_code=codes.service_unavailable,
+            eng_description=f"{base_url} is unavailable, requests are suspended after {self._failures} failures",
+            ui_description="External service is temporarily unavailable",
+        )
+
+
+class RequestAttempts:
+    """
+    Decide whether to send each attempt of a request and how long to wait before the next one.
+
+    .. code-block:: python
+
+       attempts = RequestAttempts(method, base_url, retry_policy, circuit_breaker)
+       while True:
+           error = attempts.start()
+           if error is not None:
+               return error
+           try:
+               response = send()
+           except TransportError:
+               delay = attempts.failed()
+               if delay is None:
+                   return Error(...)
+           else:
+               delay = attempts.responded(response.status_code, response.headers.get("Retry-After"))
+               if delay is None:
+                   return response
+           finally:
+               attempts.end()
+           sleep(delay)
+    """
+
+    method: str
+    base_url: str
+    retry_policy: RetryPolicy
+    circuit_breaker: CircuitBreaker | None
+    attempt: int
+
+    def __init__(
+        self,
+        method: str,
+        base_url: str,
+        retry_policy: RetryPolicy,
+        circuit_breaker: CircuitBreaker | None,
+    ) -> None:
+        self.method = method
+        self.base_url = base_url
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.attempt = 0
+        self._recorded = True
+
+    def start(self) -> Error | None:
+        """
+        Start the next attempt. Return Error if the circuit breaker suspends requests.
+        """
+        if self.circuit_breaker is not None and not self.circuit_breaker.allow():
+            return self.circuit_breaker.error(self.base_url)
+        self.attempt += 1
+        self._recorded = False
+        return None
+
+    def failed(self) -> float | None:
+        """
+        Record that the attempt failed without a response.
+
+        :return: Seconds to wait before the next attempt, or None if the request should not be retried.
+        """
+        self._recorded = True
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_failure()
+        if self.retry_policy.should_retry(self.method, self.attempt):
+            return self.retry_policy.delay(self.attempt)
+        return None
+
+    def responded(self, status_code: int, retry_after: str | None = None) -> float | None:
+        """
+        Record response of the attempt.
+
+        :param retry_after: Value of `Retry-After` header of the response, if any.
+        :return: Seconds to wait before the next attempt, or None if the response should be returned.
+        """
+        self._recorded = True
+        if self.circuit_breaker is not None:
+            if status_code >= 500:  # noqa: PLR2004
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+        if self.retry_policy.should_retry(self.method, self.attempt, status_code):
+            return self.retry_policy.delay(self.attempt, retry_after)
+        return None
+
+    def end(self) -> None:
+        """
+        End the attempt. Must be called even if sending it raised, so that a probe of the circuit breaker
+        does not keep it open forever.
+        """
+        if not self._recorded and self.circuit_breaker is not None:
+            self.circuit_breaker.release_probe()
+        self._recorded = True
+
+
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(base_url: str, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> CircuitBreaker:
+    """
+    Return the process-wide circuit breaker of the base URL, creating it with given parameters on first use.
+    """
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(base_url)
+        if breaker is None:
+            breaker = _circuit_breakers[base_url] = CircuitBreaker(failure_threshold, recovery_timeout)
+        return breaker
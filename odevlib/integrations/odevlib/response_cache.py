@@ -0,0 +1,128 @@
+"""
+HTTP response caches for GET requests of ODLAPIClient.
+
+Responses are cached according to their `Cache-Control` header. A response is served from the cache
+without contacting the service while it is fresh (`max-age` minus `Age`). After that, or if the response
+has `no-cache`, it is revalidated with a conditional request using its `ETag`/`Last-Modified` validators,
+so an unchanged resource costs a 304 response without a body. Responses with `no-store`, and stale responses
+without validators, are not cached.
+
+Two backends are provided: LRUResponseCache keeps responses in memory of the current process,
+RedisResponseCache (see `redis_response_cache`) shares them between processes through RedisCache.
+"""
+import abc
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*\"?(\d+)")
+
+
+class CachedResponse:
+    """
+    Body of a successful GET response along with its freshness information and validators.
+    """
+
+    content: bytes
+    etag: str | None
+    last_modified: str | None
+    # Unix time after which the response must be revalidated.
+    expires_at: float
+
+    def __init__(self, content: bytes, etag: str | None, last_modified: str | None, expires_at: float) -> None:
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+
+    @classmethod
+    def from_response(
+        cls: type["CachedResponse"],
+        content: bytes,
+        headers: Mapping[str, str],
+    ) -> "CachedResponse | None":
+        """
+        Create cache entry for a 200 response, or return None if the response should not be cached.
+        """
+        cache_control = headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control:
+            return None
+
+        entry = cls(content, headers.get("ETag"), headers.get("Last-Modified"), 0)
+        entry.refresh(headers)
+        if not entry.is_fresh() and entry.etag is None and entry.last_modified is None:
+            # Could be neither served, nor revalidated.
+            return None
+        return entry
+
+    def refresh(self, headers: Mapping[str, str]) -> None:
+        """
+        Update freshness (and validators, if sent) from headers of a new response, e.g. 304 Not Modified.
+        """
+        cache_control = headers.get("Cache-Control", "").lower()
+        lifetime = 0
+        match = _MAX_AGE_RE.search(cache_control)
+        if match is not None and "no-cache" not in cache_control:
+            age = headers.get("Age", "0")
+            lifetime = int(match.group(1)) - (int(age) if age.isdigit() else 0)
+        self.expires_at = time.time() + lifetime
+
+        self.etag = headers.get("ETag", self.etag)
+        self.last_modified = headers.get("Last-Modified", self.last_modified)
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def validators(self) -> dict[str, str]:
+        """
+        Return headers of a conditional request revalidating this response.
+        """
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache(abc.ABC):
+    @abc.abstractmethod
+    def get_response(self, key: str) -> CachedResponse | None:
+        """
+        Return cached response, fresh or not, or None if there is no response cached under the key.
+        """
+
+    @abc.abstractmethod
+    def set_response(self, key: str, response: CachedResponse) -> None:
+        """
+        Store the response under the key.
+        """
+
+
+class LRUResponseCache(ResponseCache):
+    """
+    Keeps up to `maxsize` least recently used responses in memory of the current process. Thread-safe.
+    """
+
+    maxsize: int
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_response(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def set_response(self, key: str, response: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
@@ -1,37 +1,128 @@
-import threading
+"""
+Current request and user, available anywhere on the request path, e.g. in `OModel.save` and RBACSerializerMixin.
 
-from django.contrib.auth.models import AbstractUser
+Both are stored in context variables, so they are isolated between requests served concurrently on one thread
+(ASGI), and follow the request into threads it is offloaded to with `sync_to_async`/`async_to_sync` or
+`contextvars.copy_context().run`. The request is unset as soon as the response is returned by the middleware,
+so it never leaks into the next request; bodies of streaming responses are produced without it.
+
+Outside of requests (management commands, background tasks), set the user with `as_user`.
+
+`request_local.request` and `user_local` of previous versions are deprecated. They still work, but read and set
+the context variables, so a user assigned to `user_local` is only seen in the current thread or task, and
+the ones it starts afterwards.
+"""
+import sys
+import types
+import warnings
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.contrib.auth.models import AbstractUser, AnonymousUser
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-request_local = threading.local()
-user_local = None  # type: ignore
+# Context variables are not re-exported by odevlib.middleware, where `current_user` would shadow this module.
+__all__ = ["CurrentUserMiddleware", "as_user", "get_request", "get_user", "request_local"]
+
+current_request: ContextVar[Request | None] = ContextVar("odevlib_current_request", default=None)
+current_user: ContextVar[AbstractUser | None] = ContextVar("odevlib_current_user", default=None)
 
 
 def get_request() -> Request | None:
-    return getattr(request_local, "request", None)
+    return current_request.get()
 
 
-def get_user() -> AbstractUser | None:
-    request = getattr(request_local, "request", None)
+def get_user() -> AbstractUser | AnonymousUser | None:
+    """
+    Return the user set with `as_user`, or the user of the current request, which is AnonymousUser
+    for unauthenticated requests. Return None outside of requests.
+    """
+    user = current_user.get()
+    if user is not None:
+        return user
+    request = current_request.get()
     if request is None:
-        if user_local is not None:
-            return user_local
         return None
     return request.user
 
 
+@contextmanager
+def as_user(user: AbstractUser | None) -> Iterator[None]:
+    """
+    Make `get_user` return the user inside the block, e.g. to save OModels from a management command.
+    """
+    token = current_user.set(user)
+    try:
+        yield
+    finally:
+        current_user.reset(token)
+
+
+class _RequestLocal:
+    """
+    Deprecated `request_local` of previous versions, whose `request` attribute is `current_request` now.
+    """
+
+    @property
+    def request(self) -> Request | None:
+        warnings.warn("request_local is deprecated, use get_request()", DeprecationWarning, stacklevel=2)
+        return current_request.get()
+
+    @request.setter
+    def request(self, request: Request | None) -> None:  # noqa: PLR6301
+        warnings.warn("request_local is deprecated, use current_request", DeprecationWarning, stacklevel=2)
+        current_request.set(request)
+
+
+request_local = _RequestLocal()
+
+
+class _CurrentUserModule(types.ModuleType):
+    """
+    Makes the deprecated module-level `user_local` of previous versions read and set `current_user`.
+    """
+
+    @property
+    def user_local(self) -> AbstractUser | None:
+        warnings.warn("user_local is deprecated, use get_user()", DeprecationWarning, stacklevel=2)
+        return current_user.get()
+
+    @user_local.setter
+    def user_local(self, user: AbstractUser | None) -> None:  # noqa: PLR6301
+        warnings.warn("user_local is deprecated, use as_user()", DeprecationWarning, stacklevel=2)
+        current_user.set(user)
+
+
+sys.modules[__name__].__class__ = _CurrentUserModule
+
+
 class CurrentUserMiddleware:
-    def __init__(self, get_response) -> None:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[Request], Response | Awaitable[Response]]) -> None:
         self.get_response = get_response
+        # Same as django.utils.deprecation.MiddlewareMixin.
+        self.async_mode = iscoroutinefunction(self.get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
 
-    def __call__(self, request: Request) -> Response:
-        request_local.request = request
-        return self.get_response(request)
+    def __call__(self, request: Request) -> Response | Awaitable[Response]:
+        if self.async_mode:
+            return self.__acall__(request)
 
-    def process_exception(self, request: Request, exception) -> None:
-        request_local.request = None
+        token = current_request.set(request)
+        try:
+            return self.get_response(request)  # type: ignore[return-value]
+        finally:
+            current_request.reset(token)
 
-    def process_template_response(self, request: Request, response: Response) -> Response:
-        request_local.request = None
-        return response
+    async def __acall__(self, request: Request) -> Response:  # noqa: PLW3201
+        token = current_request.set(request)
+        try:
+            return await self.get_response(request)  # type: ignore[misc]
+        finally:
+            current_request.reset(token)
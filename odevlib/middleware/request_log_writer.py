@@ -0,0 +1,17 @@
+"""
+Background writer of request log entries.
+
+TimescaleLoggingMiddleware puts entries into a bounded in-process queue instead of saving them on the
+request path. A daemon thread takes them from the queue and inserts them with a single `bulk_create`
+per batch. A batch is flushed when `batch_size` entries are collected, or `flush_interval` seconds after
+its first entry arrived.
+
+When the database can't keep up and the queue is full, new entries are dropped instead of slowing down
+requests. The number of dropped entries is logged with the next flush.
+"""
+from odevlib.utils.bulk_writer import BulkWriter
+
+
+class RequestLogWriter(BulkWriter):
+    def __init__(self, queue_size: int = 10000, batch_size: int = 500, flush_interval: float = 1.0) -> None:
+        super().__init__(queue_size, batch_size, flush_interval, name="odevlib-request-log-writer")
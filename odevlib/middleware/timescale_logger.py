@@ -1,17 +1,105 @@
 import logging
+import random
 import time
 from collections.abc import Callable
+from contextlib import ExitStack
 
+from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
+from django.db import connections
 from django.http import HttpRequest, HttpResponse
 from django.utils import timezone
 
+from odevlib.middleware.request_log_writer import RequestLogWriter
 from odevlib.models.logging import RequestLogEntry
+from odevlib.utils.timing import db_timing_wrapper, start_timings, stop_timings
+
+_writer: RequestLogWriter | None = None
+
+
+def get_request_log_writer() -> RequestLogWriter:
+    """
+    Return the process-wide request log writer, starting it on first use.
+    """
+    global _writer  # noqa: PLW0603
+    if _writer is None:
+        _writer = RequestLogWriter(
+            queue_size=getattr(settings, "REQUEST_LOG_QUEUE_SIZE", 10000),
+            batch_size=getattr(settings, "REQUEST_LOG_BATCH_SIZE", 500),
+            flush_interval=getattr(settings, "REQUEST_LOG_FLUSH_INTERVAL", 1.0),
+        )
+    return _writer
+
+
+class RequestLogPolicy:
+    """
+    Decides which requests are logged and how much of them is stored.
+
+    Configured with the following settings:
+      - REQUEST_LOG_EXCLUDED_PATHS — path prefixes that are never logged.
+      - REQUEST_LOG_SAMPLE_RATE — share of requests that are logged, from 0 to 1. Defaults to 1.
+      - REQUEST_LOG_PATH_SAMPLE_RATES — sample rates for path prefixes, e.g. {"/api/health/": 0.01}.
+        The longest matching prefix overrides REQUEST_LOG_SAMPLE_RATE.
+      - REQUEST_LOG_STATUS_SAMPLE_RATES — sample rates for status classes, e.g. {"2xx": 0.1}.
+        Multiplied by the path sample rate.
+      - REQUEST_LOG_SLOW_THRESHOLD_MS — requests that took at least this time are always logged.
+      - REQUEST_LOG_MAX_BODY_SIZE — maximal number of bytes of request headers and response body
+        stored for non-2xx responses. Defaults to 10000.
+    """
+
+    def __init__(self) -> None:
+        self.excluded_paths: tuple[str, ...] = tuple(getattr(settings, "REQUEST_LOG_EXCLUDED_PATHS", ()))
+        self.sample_rate: float = getattr(settings, "REQUEST_LOG_SAMPLE_RATE", 1.0)
+        # Sorted by length, so the longest matching prefix is found first.
+        self.path_sample_rates: list[tuple[str, float]] = sorted(
+            getattr(settings, "REQUEST_LOG_PATH_SAMPLE_RATES", {}).items(),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self.status_sample_rates: dict[str, float] = getattr(settings, "REQUEST_LOG_STATUS_SAMPLE_RATES", {})
+        self.slow_threshold_ms: int | None = getattr(settings, "REQUEST_LOG_SLOW_THRESHOLD_MS", None)
+        self.max_body_size: int = getattr(settings, "REQUEST_LOG_MAX_BODY_SIZE", 10000)
+
+    def is_excluded(self, path: str) -> bool:
+        return path.startswith(self.excluded_paths)
+
+    def should_log(self, path: str, code: int, processing_time: int) -> bool:
+        if self.slow_threshold_ms is not None and processing_time >= self.slow_threshold_ms:
+            return True
+
+        rate = self.sample_rate
+        for prefix, path_rate in self.path_sample_rates:
+            if path.startswith(prefix):
+                rate = path_rate
+                break
+        rate *= self.status_sample_rates.get(f"{code // 100}xx", 1.0)
+
+        return rate >= 1 or random.random() < rate  # noqa: S311
+
+    def truncate(self, data: bytes) -> str:
+        """
+        Decode data, keeping at most max_body_size bytes.
+        """
+        if len(data) > self.max_body_size:
+            return data[: self.max_body_size].decode("utf-8", errors="ignore") + "… (truncated)"
+        return data.decode("utf-8", errors="replace")
 
 
 class TimescaleLoggingMiddleware:
+    """
+    Logs requests into RequestLogEntry hypertable. See RequestLogPolicy for sampling and filtering settings.
+
+    Besides total processing time, each entry stores time breakdown of the request in `timings`: number of DB
+    queries and time spent in DB, serialization and RBAC resolution (see odevlib.utils.timing).
+
+    By default, entries are written in batches by a background thread (see RequestLogWriter).
+    Set REQUEST_LOG_ASYNC = False in settings to save each entry on the request path instead.
+    """
+
     def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
         self.get_response = get_response
+        self.writer = get_request_log_writer() if getattr(settings, "REQUEST_LOG_ASYNC", True) else None
+        self.policy = RequestLogPolicy()
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
         # Code to be executed for each request before
@@ -21,11 +109,24 @@ class TimescaleLoggingMiddleware:
         if request.COOKIES.get("disable_timescale_logger", "false") == "true":
             return self.get_response(request)
 
-        start_timestamp = time.time()
+        if self.policy.is_excluded(request.path):
+            return self.get_response(request)
 
-        response: HttpResponse = self.get_response(request)
+        timings = start_timings()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(db_timing_wrapper))
 
-        end_timestamp = time.time()
+                start_ns = time.perf_counter_ns()
+                response: HttpResponse = self.get_response(request)
+                elapsed_ns = time.perf_counter_ns() - start_ns
+        finally:
+            stop_timings()
+
+        processing_time = elapsed_ns // 1_000_000
+        if not self.policy.should_log(request.path, response.status_code, processing_time):
+            return response
 
         user = None if isinstance(request.user, AnonymousUser) else request.user
 
@@ -35,14 +136,21 @@ class TimescaleLoggingMiddleware:
             method=request.method or "unknown",
             path=request.path,
             code=response.status_code,
-            processing_time=int((end_timestamp - start_timestamp) * 1000),
+            processing_time=processing_time,
             application="back",
+            timings={"total_us": elapsed_ns // 1000, **timings.as_dict()},
         )
 
         # If response is not OK, include it in extra as well
         if not str(response.status_code).startswith("2"):
-            entry.request = str(request.headers)
-            entry.response = response.content.decode("utf-8")
+            entry.request = self.policy.truncate(str(request.headers).encode("utf-8"))
+            # Reading content of streaming responses would consume the stream, so it is never stored.
+            if not response.streaming:
+                entry.response = self.policy.truncate(response.content)
+
+        if self.writer is not None:
+            self.writer.write(entry)
+            return response
 
         try:
             entry.save()
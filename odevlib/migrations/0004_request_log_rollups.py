@@ -0,0 +1,18 @@
+from django.db import migrations
+
+from odevlib.models.timescale import CreateRequestLogRollups
+
+
+# Rollups are only created on TimescaleDB 2.7 or newer, which supports percentile_cont in continuous aggregates.
+# Retention is not added here, projects choose it in their own migrations (see odevlib.business_logic.request_logs).
+class Migration(migrations.Migration):
+    # Continuous aggregates can't be created inside a transaction block.
+    atomic = False
+
+    dependencies = [
+        ("odevlib", "0003_updated_request_log_entry"),
+    ]
+
+    operations = [
+        CreateRequestLogRollups(),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("odevlib", "0004_request_log_rollups"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="requestlogentry",
+            name="timings",
+            field=models.JSONField(
+                blank=True,
+                null=True,
+                verbose_name="Request time breakdown (DB queries, serialization, RBAC, in microseconds)",
+            ),
+        ),
+    ]
@@ -0,0 +1,345 @@
+"""
+History of OModel: write modes, hypertable history tables and history queries.
+
+By default, simple_history inserts a historical record right after each save, in the same transaction.
+Models may opt in to other write modes, either with `history_write_mode` class attribute, or for all models
+with ODEVLIB_HISTORY_WRITE_MODE setting:
+
+  - "sync" (default) — historical records are inserted one by one, right after the save.
+  - "deferred" — historical records created within a transaction are buffered, and inserted with a single
+    `bulk_create` when the transaction commits. Records of rolled back savepoints are discarded with them.
+    If the bulk insert fails, the error is logged and records are inserted one by one.
+  - "async" — on commit, historical records are handed to a background thread, which inserts them in batches
+    (see BulkWriter). Saves don't wait for history at all, but records buffered in memory are lost
+    if the process crashes. post_create_historical_record signal is not sent in this mode.
+
+Outside of transactions (autocommit), and for models with history of many-to-many fields,
+records are always written synchronously.
+
+History tables can also be TimescaleDB hypertables partitioned by `history_date`, which keeps inserts and
+time-range queries (`Model.history.between(start, end)`) fast however large the table grows. Set chunk interval
+with `history_hypertable_interval` class attribute, or for all models with ODEVLIB_HISTORY_HYPERTABLE_INTERVAL
+setting, e.g. "7 days". The setting doesn't apply to models of ODevLib itself, as their history tables are created
+by migrations shipped with ODevLib. The table is converted by the next migration of the model (existing rows are moved
+into chunks), which requires `timescale.db.backends.postgresql` database engine. Hypertables can't have unique
+indexes without the partition column, so the primary key constraint of `history_id` is dropped. Retention and
+compression policies are added with migration operations from `odevlib.models.timescale`.
+
+OHistoricalQuerySet (`Model.history`, `instance.history`) answers audit questions in the database instead of
+loading whole history into Python: `diffs()` streams field-level changes between consecutive versions computed
+with LAG() window function, and `latest_at(moment)` reconstructs the state of objects at a moment with a single
+DISTINCT ON query.
+"""
+import functools
+import logging
+import threading
+import weakref
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
+from typing import Any
+
+from django.conf import settings
+from django.db import connections, models, router, transaction
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import Expression, F, Func, Window
+from django.db.models.functions import Lag
+from django.utils import timezone
+from simple_history.manager import HistoricalQuerySet  # type: ignore[import]
+from simple_history.models import HistoricalRecords, ModelChange  # type: ignore[import]
+from simple_history.signals import post_create_historical_record, pre_create_historical_record  # type: ignore[import]
+from timescale.db.models.fields import TimescaleDateTimeField  # type: ignore[import]
+
+from odevlib.utils.bulk_writer import BulkWriter
+
+HISTORY_WRITE_MODES = ("sync", "deferred", "async")
+
+_writer: BulkWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_history_writer() -> BulkWriter:
+    """
+    Return the process-wide background writer of historical records, starting it on first use.
+    """
+    global _writer  # noqa: PLW0603
+    with _writer_lock:
+        if _writer is None:
+            _writer = BulkWriter(
+                queue_size=getattr(settings, "ODEVLIB_HISTORY_QUEUE_SIZE", 10000),
+                batch_size=getattr(settings, "ODEVLIB_HISTORY_BATCH_SIZE", 500),
+                flush_interval=getattr(settings, "ODEVLIB_HISTORY_FLUSH_INTERVAL", 1.0),
+                # History is an audit trail, so slow down writers instead of dropping it.
+                block_when_full=True,
+                name="odevlib-history-writer",
+            )
+        return _writer
+
+
+def get_history_write_mode(model: type[models.Model]) -> str:
+    mode = getattr(model, "history_write_mode", None) or getattr(settings, "ODEVLIB_HISTORY_WRITE_MODE", "sync")
+    if mode not in HISTORY_WRITE_MODES:
+        msg = f'Unknown history write mode "{mode}" of {model.__name__}. Expected one of: {HISTORY_WRITE_MODES}'
+        raise ValueError(msg)
+    return mode
+
+
+def get_history_hypertable_interval(model: type[models.Model]) -> str | None:
+    interval = getattr(model, "history_hypertable_interval", None)
+    if interval is None and model._meta.app_label != "odevlib":  # noqa: SLF001
+        interval = getattr(settings, "ODEVLIB_HISTORY_HYPERTABLE_INTERVAL", None)
+    return interval
+
+
+# Fields that change with every save, so are not reported by `diffs` unless asked for explicitly.
+DIFF_EXCLUDED_FIELDS = frozenset({"created_at", "created_by", "updated_at", "updated_by"})
+
+
+class IsDistinctFrom(Func):
+    """
+    NULL-safe inequality: NULL is distinct from any value, but not from NULL.
+    """
+
+    template = "(%(expressions)s)"
+    arg_joiner = " IS DISTINCT FROM "
+    output_field = models.BooleanField()
+
+
+class OHistoricalQuerySet(HistoricalQuerySet):
+    def between(self, start: datetime, end: datetime) -> "OHistoricalQuerySet":
+        """
+        Return records with `history_date` in [start, end).
+
+        Bounds are compared with the column directly, so TimescaleDB only scans chunks overlapping the range.
+        """
+        return self.filter(history_date__gte=start, history_date__lt=end)
+
+    def for_objects(self, pks: Iterable[Any]) -> "OHistoricalQuerySet":
+        """
+        Return records of objects with the given primary keys.
+        """
+        return self.filter(**{f"{self._pk_attr}__in": list(pks)})
+
+    def latest_at(self, moment: datetime) -> "OHistoricalQuerySet":
+        """
+        Return the latest record of each object as of the moment, i.e. the state of objects at that time.
+        Objects deleted by then are represented by their deletion records (history_type "-").
+
+        Unlike `as_of` of simple_history, which looks for a later record of every record, this is a single
+        DISTINCT ON query over the (primary key, history_date) order.
+        """
+        return (
+            self.filter(history_date__lte=moment)
+            .order_by(self._pk_attr, "-history_date", "-history_id")
+            .distinct(self._pk_attr)
+        )
+
+    def _get_diff_fields(self, fields: Sequence[str] | None) -> list[models.Field]:
+        tracked_fields = {field.name: field for field in self.model.tracked_fields}
+        if fields is None:
+            return [
+                field
+                for name, field in tracked_fields.items()
+                if not field.primary_key and name not in DIFF_EXCLUDED_FIELDS
+            ]
+        return [tracked_fields[name] for name in fields]
+
+    def with_changes(self, fields: Sequence[str] | None = None) -> "OHistoricalQuerySet":
+        """
+        Annotate each record with values of the fields in the previous record of the same object
+        (`previous_<attname>`), and whether they differ from the values of this record (`changed_<attname>`).
+        Both are computed in the database with LAG() window function.
+
+        Window functions only see records that pass the filters, so the first record of a filtered queryset
+        (e.g. `between`) has no previous record, even if the object has earlier history.
+
+        :param fields: Names of tracked fields to compare. Defaults to all tracked fields except the primary key
+            and the audit fields.
+        """
+        partition_by = [F(self._pk_attr)]
+        order_by = [F("history_date").asc(), F("history_id").asc()]
+        annotations: dict[str, Expression] = {}
+        for field in self._get_diff_fields(fields):
+            previous = Window(Lag(field.attname), partition_by=partition_by, order_by=order_by)
+            annotations[f"previous_{field.attname}"] = previous
+            annotations[f"changed_{field.attname}"] = IsDistinctFrom(F(field.attname), previous)
+        return self.annotate(**annotations)
+
+    def diffs(
+        self,
+        fields: Sequence[str] | None = None,
+        chunk_size: int = 2000,
+    ) -> Iterator[tuple[models.Model, list[ModelChange]]]:
+        """
+        Stream records ordered by object and time, each with the list of fields changed by it, see `with_changes`.
+        The first record of an object reports changes from None. Records are fetched in chunks of `chunk_size`,
+        so history of many objects can be processed without loading it into memory.
+
+        Changes are reported by field name, with raw values (primary keys for foreign keys), like `diff_against`
+        of simple_history does.
+        """
+        diff_fields = self._get_diff_fields(fields)
+        queryset = self.with_changes([field.name for field in diff_fields]).order_by(
+            self._pk_attr,
+            "history_date",
+            "history_id",
+        )
+        for record in queryset.iterator(chunk_size=chunk_size):
+            changes = [
+                ModelChange(field.name, getattr(record, f"previous_{field.attname}"), getattr(record, field.attname))
+                for field in diff_fields
+                if getattr(record, f"changed_{field.attname}")
+            ]
+            yield record, changes
+
+
+class _PendingRecords:
+    """
+    Historical records created in the same savepoint of a transaction, waiting for it to commit.
+    """
+
+    def __init__(self, savepoint_ids: tuple[str, ...], mode: str, using: str | None) -> None:
+        self.savepoint_ids = savepoint_ids
+        self.mode = mode
+        self.using = using
+        # Pairs of saved instance and its historical record, an instance of a model built by simple_history.
+        self.records: list[tuple[models.Model, Any]] = []
+        self.callback = functools.partial(_flush_records, self)
+        self.flushed = False
+
+
+def _flush_records(pending: _PendingRecords) -> None:
+    pending.flushed = True
+    if pending.mode == "async":
+        writer = get_history_writer()
+        for _, history_instance in pending.records:
+            writer.write(history_instance, pending.using)
+        return
+
+    by_model: dict[type[models.Model], list[models.Model]] = {}
+    for _, history_instance in pending.records:
+        by_model.setdefault(type(history_instance), []).append(history_instance)
+    # The transaction is already committed, so failures are logged instead of being raised from the commit.
+    failed: set[int] = set()
+    for model, history_instances in by_model.items():
+        try:
+            model._default_manager.db_manager(pending.using).bulk_create(history_instances)  # noqa: SLF001
+        except Exception:
+            logging.exception(
+                "Error occurred while inserting %d %s records, inserting them one by one",
+                len(history_instances),
+                model.__name__,
+            )
+            failed.update(_save_records(history_instances, pending.using))
+
+    for instance, history_instance in pending.records:
+        if id(history_instance) in failed:
+            continue
+        post_create_historical_record.send(
+            sender=type(history_instance),
+            instance=instance,
+            history_instance=history_instance,
+            history_date=history_instance.history_date,
+            history_user=history_instance.history_user,
+            history_change_reason=history_instance.history_change_reason,
+            using=pending.using,
+        )
+
+
+def _save_records(history_instances: list[models.Model], using: str | None) -> set[int]:
+    """
+    Insert historical records one by one. Return `id()` of records which failed to insert.
+    """
+    failed = set()
+    for history_instance in history_instances:
+        try:
+            # Primary keys set by a rolled back batch of bulk_create are free, so they are inserted as is.
+            history_instance.save(using=using, force_insert=True)
+        except Exception:
+            logging.exception("Error occurred while inserting %s record", type(history_instance).__name__)
+            failed.add(id(history_instance))
+    return failed
+
+
+# Pending records of the current transaction of each connection by savepoint, write mode and database,
+# along with on-commit callbacks list of the transaction. Django replaces the list when the transaction
+# or a savepoint ends, which tells that pending records are no longer waiting for the same commit.
+_PendingKey = tuple[tuple[str, ...], str, str | None]
+_pending_records: weakref.WeakKeyDictionary[
+    BaseDatabaseWrapper,
+    tuple[list, dict[_PendingKey, _PendingRecords]],
+] = weakref.WeakKeyDictionary()
+
+
+class OHistoricalRecords(HistoricalRecords):
+    """
+    HistoricalRecords that supports "deferred" and "async" write modes and hypertable history tables,
+    see module docstring.
+    """
+
+    def __init__(self, *args: Any, historical_queryset: type = OHistoricalQuerySet, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init__(*args, historical_queryset=historical_queryset, **kwargs)
+
+    def get_extra_fields(self, model: type[models.Model], fields: dict[str, models.Field]) -> dict[str, Any]:  # noqa: PLR6301
+        extra_fields = super().get_extra_fields(model, fields)
+        interval = get_history_hypertable_interval(model)
+        if interval is not None:
+            # create_hypertable indexes the partition column itself.
+            extra_fields["history_date"] = TimescaleDateTimeField(interval=interval)
+        return extra_fields
+
+    def create_historical_record(self, instance: models.Model, history_type: str, using: str | None = None) -> None:
+        mode = get_history_write_mode(type(instance))
+        alias = using or router.db_for_write(type(instance), instance=instance)
+        connection = connections[alias]
+        if mode == "sync" or not connection.in_atomic_block or self.m2m_fields:
+            super().create_historical_record(instance, history_type, using)
+            return
+
+        using = using if self.use_base_model_db else None
+        history_instance = self._build_historical_record(instance, history_type, using)
+
+        # Records are grouped by savepoint, even if other callbacks are scheduled on commit in between.
+        # Django drops on-commit callbacks of rolled back savepoints, so records of such savepoints are dropped too.
+        state = _pending_records.get(connection)
+        if state is None or state[0] is not connection.run_on_commit:
+            state = (connection.run_on_commit, {})
+            _pending_records[connection] = state
+        by_key = state[1]
+        key = (tuple(connection.savepoint_ids), mode, using)
+        pending = by_key.get(key)
+        if pending is None or pending.flushed:
+            pending = _PendingRecords(*key)
+            by_key[key] = pending
+            transaction.on_commit(pending.callback, using=alias)
+        pending.records.append((instance, history_instance))
+
+    def _build_historical_record(self, instance: models.Model, history_type: str, using: str | None) -> models.Model:
+        """
+        Build a historical record like `create_historical_record` of simple_history does, without saving it.
+        """
+        history_date = getattr(instance, "_history_date", timezone.now())
+        history_user = self.get_history_user(instance)
+        history_change_reason = self.get_change_reason_for_object(instance, history_type, using)
+        manager = getattr(instance, self.manager_name)
+
+        attrs = {field.attname: getattr(instance, field.attname) for field in self.fields_included(instance)}
+        if getattr(manager.model, "history_relation", None) is not None:
+            attrs["history_relation"] = instance
+
+        history_instance = manager.model(
+            history_date=history_date,
+            history_type=history_type,
+            history_user=history_user,
+            history_change_reason=history_change_reason,
+            **attrs,
+        )
+        pre_create_historical_record.send(
+            sender=manager.model,
+            instance=instance,
+            history_date=history_date,
+            history_user=history_user,
+            history_change_reason=history_change_reason,
+            history_instance=history_instance,
+            using=using,
+        )
+        return history_instance
@@ -23,3 +23,8 @@ class RequestLogEntry(TimescaleModel):
     processing_time = models.IntegerField(verbose_name="Request execution time (ms)")
     request = models.TextField(verbose_name="Request body (in case of non-2xx status code)", blank=True, null=True)
     response = models.TextField(verbose_name="Response body (in case of non-2xx status code)", blank=True, null=True)
+    timings = models.JSONField(
+        verbose_name="Request time breakdown (DB queries, serialization, RBAC, in microseconds)",
+        blank=True,
+        null=True,
+    )
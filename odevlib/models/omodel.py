@@ -1,16 +1,304 @@
-from typing import TYPE_CHECKING
+import copy
+from collections.abc import Collection, Iterable, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Self, TypeVar, cast
 
 from django.conf import settings
-from django.db import models
-from simple_history.models import HistoricalRecords  # type: ignore[import]
+from django.db import DatabaseError, models, transaction
+from django.utils import timezone
 
 from odevlib.middleware import get_user
+from odevlib.models.history import OHistoricalRecords
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import User
 
+M = TypeVar("M", bound=models.Model)
 
-class NHOModel(models.Model):
+
+def resolve_user(model: type[models.Model], user: "User | None") -> "User":
+    """
+    Return the passed user, or the user of the current request. Raise ValueError if there is neither.
+    """
+    # AnonymousUser of unauthenticated requests can't be stored in created_by/updated_by.
+    if user is None and ((_user := get_user()) is not None) and _user.is_authenticated:
+        user = cast("User", _user)
+    if user is None:
+        msg = (
+            f"User was not passed to the {model.__name__} "
+            "save method and could not be retrieved from the middleware"
+        )
+        raise ValueError(msg)
+    return user
+
+
+class OModelQuerySet(models.QuerySet[M]):
+    """
+    QuerySet of NHOModel and OModel, whose bulk operations do the same as `save` does for a single object:
+    stamp created_by/updated_by with the passed user (or the user of the current request), call `before_save`,
+    and, for models with history, write historical records in bulk within the same transaction.
+    """
+
+    def _write_history(self) -> bool:
+        return hasattr(self.model._meta, "simple_history_manager_attribute")  # noqa: SLF001
+
+    def _history_manager(self) -> Any:  # noqa: ANN401
+        # simple_history sets the attribute on Meta of tracked models only.
+        manager_attribute = self.model._meta.simple_history_manager_attribute  # type: ignore[attr-defined]  # noqa: SLF001
+        return getattr(self.model, manager_attribute)
+
+    def bulk_create(  # type: ignore[override]
+        self,
+        objs: Iterable[M],
+        batch_size: int | None = None,
+        ignore_conflicts: bool = False,
+        user: "User | None" = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[M]:
+        """
+        Insert objects in batches, along with their historical records.
+
+        :param user: User to stamp objects with. Defaults to the user of the current request.
+        """
+        objs = list(objs)
+        user = resolve_user(self.model, user)
+        for obj in objs:
+            obj.created_by = user  # type: ignore[attr-defined]
+            obj.updated_by = user  # type: ignore[attr-defined]
+            obj.before_save(user=user)  # type: ignore[attr-defined]
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            created = super().bulk_create(objs, batch_size=batch_size, ignore_conflicts=ignore_conflicts, **kwargs)
+            # Primary keys are only known for inserted rows, which PostgreSQL always returns without conflicts.
+            if self._write_history() and not ignore_conflicts:
+                self._history_manager().bulk_history_create(created, batch_size=batch_size, default_user=user)
+
+        if not ignore_conflicts:
+            for obj in created:
+                obj._snapshot_loaded_values()  # type: ignore[attr-defined]  # noqa: SLF001
+        return created
+
+    def bulk_update(  # type: ignore[override]
+        self,
+        objs: Iterable[M],
+        fields: Sequence[str],
+        batch_size: int | None = None,
+        user: "User | None" = None,
+    ) -> int:
+        """
+        Update given fields of objects in batches, along with updated_at/updated_by,
+        and write their historical records.
+
+        :param user: User to stamp objects with. Defaults to the user of the current request.
+        """
+        objs = list(objs)
+        user = resolve_user(self.model, user)
+        # bulk_update doesn't call pre_save, so auto_now fields have to be set manually.
+        now = timezone.now()
+        for obj in objs:
+            obj.updated_by = user  # type: ignore[attr-defined]
+            obj.updated_at = now  # type: ignore[attr-defined]
+            obj.before_save(user=user)  # type: ignore[attr-defined]
+        fields = [*fields, *(name for name in ("updated_at", "updated_by") if name not in fields)]
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            rows = super().bulk_update(objs, fields, batch_size=batch_size)
+            if self._write_history():
+                self._history_manager().bulk_history_create(
+                    objs,
+                    batch_size=batch_size,
+                    update=True,
+                    default_user=user,
+                )
+
+        for obj in objs:
+            obj._snapshot_loaded_values(fields)  # type: ignore[attr-defined]  # noqa: SLF001
+        return rows
+
+
+class OModelManager(models.Manager[M]):
+    """
+    Default manager of NHOModel and OModel, see OModelQuerySet.
+    """
+
+    def get_queryset(self) -> OModelQuerySet[M]:
+        return OModelQuerySet(self.model, using=self._db)
+
+    def bulk_create(  # type: ignore[override]
+        self,
+        objs: Iterable[M],
+        batch_size: int | None = None,
+        ignore_conflicts: bool = False,
+        user: "User | None" = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[M]:
+        return self.get_queryset().bulk_create(objs, batch_size, ignore_conflicts, user, **kwargs)
+
+    def bulk_update(  # type: ignore[override]
+        self,
+        objs: Iterable[M],
+        fields: Sequence[str],
+        batch_size: int | None = None,
+        user: "User | None" = None,
+    ) -> int:
+        return self.get_queryset().bulk_update(objs, fields, batch_size, user)
+
+
+# A conditional expression would not be accepted by mypy as a base class.
+if TYPE_CHECKING:  # noqa: SIM108
+    _ModelBase = models.Model
+else:
+    _ModelBase = object
+
+
+# Fields maintained by NHOModel and OModel themselves, which don't make an object dirty.
+AUDIT_FIELDS = frozenset({"created_at", "created_by", "updated_at", "updated_by"})
+
+
+class DirtyFieldsMixin(_ModelBase):
+    """
+    Tracks values of concrete fields since the object was loaded from the database or saved.
+
+    Used by NHOModel and OModel to only UPDATE changed columns, and skip saving unchanged objects altogether.
+    An object saved without changes by the same user who updated it last is not saved, so its updated_at keeps
+    the time of the last change. Pass update_fields explicitly, e.g. `save(update_fields=["updated_at"])`,
+    to save it anyway.
+    """
+
+    _loaded_values: dict[str, Any]
+
+    @classmethod
+    def from_db(cls, db: str | None, field_names: Collection[str], values: Collection[Any]) -> Self:  # noqa: ANN102
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_loaded_values()  # noqa: SLF001
+        return instance
+
+    def refresh_from_db(self, using: str | None = None, fields: Sequence[str] | None = None, **kwargs: Any) -> None:  # noqa: ANN401
+        super().refresh_from_db(using, fields, **kwargs)
+        self._snapshot_loaded_values(fields)
+
+    def _snapshot_loaded_values(self, field_names: Iterable[str] | None = None) -> None:
+        if not hasattr(self, "_loaded_values"):
+            self._loaded_values = {}
+        names = set(field_names) if field_names is not None else None
+        for field in self._meta.concrete_fields:  # type: ignore[attr-defined]
+            if names is not None and field.name not in names and field.attname not in names:
+                continue
+            # Deferred fields are not loaded, so their values are unknown.
+            if field.attname not in self.__dict__:
+                continue
+            value = self.__dict__[field.attname]
+            # Mutable values (JSON, HStore, arrays) may be changed in place, so keep a copy.
+            self._loaded_values[field.attname] = copy.deepcopy(value) if isinstance(value, dict | list) else value
+
+    def get_dirty_fields(self) -> list[str] | None:
+        """
+        Return names of fields changed since the object was loaded or saved, excluding audit fields.
+        Return None if changes are not tracked for this object, e.g. it was never saved.
+        """
+        if not hasattr(self, "_loaded_values"):
+            return None
+        pk_attname = self._meta.pk.attname  # type: ignore[union-attr]
+        if pk_attname not in self._loaded_values or self._loaded_values[pk_attname] != self.__dict__.get(pk_attname):
+            return None
+
+        dirty = []
+        for field in self._meta.concrete_fields:  # type: ignore[attr-defined]
+            if field.name in AUDIT_FIELDS or field.primary_key or field.attname not in self.__dict__:
+                continue
+            if field.attname not in self._loaded_values or self._loaded_values[field.attname] != self.__dict__[
+                field.attname
+            ]:
+                dirty.append(field.name)
+        return dirty
+
+    def _get_update_fields(
+        self,
+        force_insert: bool,
+        update_fields: Iterable[str] | None,
+    ) -> set[str] | Literal[False] | None:
+        """
+        Return update_fields to save with: only changed fields along with updated_at/updated_by and fields
+        whose value is set on save, like `auto_now` fields.
+        Return False if the object is unchanged and saving should be skipped, or None to save all fields.
+        """
+        if self._state.adding or force_insert:
+            return None
+        if update_fields is not None and not update_fields:
+            # Same as Django: saving with empty update_fields does nothing.
+            return False
+        if update_fields is None:
+            dirty = self.get_dirty_fields()
+            if dirty is None:
+                return None
+            # Saving by another user is still recorded, even if nothing else changed.
+            if not dirty and self._loaded_values.get("updated_by_id") == self.__dict__.get("updated_by_id"):
+                return False
+            concrete_fields = self._meta.concrete_fields  # type: ignore[attr-defined]
+            update_fields = [*dirty, *(field.name for field in concrete_fields if _is_set_on_save(field))]
+        return {*update_fields, "updated_at", "updated_by"}
+
+    def _save_changed_fields(
+        self,
+        force_insert: bool,
+        force_update: bool,
+        using: str | None,
+        update_fields: Iterable[str] | None,
+    ) -> None:
+        """
+        Save only fields changed since the object was loaded, or skip saving, see `_get_update_fields`.
+        """
+        fields_to_update = self._get_update_fields(force_insert, update_fields)
+        if fields_to_update is False:
+            return
+        if update_fields is not None or fields_to_update is None:
+            super().save(force_insert, force_update, using, fields_to_update)
+            self._snapshot_loaded_values(fields_to_update)
+            return
+
+        # Changed fields are derived again in _save_table, after pre_save receivers may have changed more of them.
+        self._derive_update_fields = True
+        try:
+            super().save(force_insert, force_update, using)
+        finally:
+            self._derive_update_fields = False
+        self._snapshot_loaded_values()
+
+    def _save_table(  # noqa: PLR0913
+        self,
+        raw: bool = False,
+        cls: type[models.Model] | None = None,
+        force_insert: bool = False,
+        force_update: bool = False,
+        using: str | None = None,
+        update_fields: Iterable[str] | None = None,
+    ) -> bool:
+        if update_fields is not None or not getattr(self, "_derive_update_fields", False):
+            return super()._save_table(raw, cls, force_insert, force_update, using, update_fields)  # type: ignore[misc]
+
+        derived = self._get_update_fields(force_insert, None) or {"updated_at", "updated_by"}
+        try:
+            return super()._save_table(raw, cls, force_insert, force_update, using, derived)  # type: ignore[misc]
+        except DatabaseError as e:
+            # Django raises plain DatabaseError if no row was updated, e.g. it was deleted concurrently.
+            # A full save inserts the row again in this case, so derived update_fields must not change that.
+            if type(e) is not DatabaseError:
+                raise
+            return super()._save_table(raw, cls, force_insert, force_update, using)  # type: ignore[misc]
+
+
+def _is_set_on_save(field: models.Field) -> bool:
+    """
+    Return whether the field sets its value in `pre_save`, so it is saved even if it wasn't changed.
+    Django only calls `pre_save` of fields in update_fields.
+    """
+    auto_now = getattr(field, "auto_now", None)
+    if auto_now is not None:
+        # Date and time fields only set the value with auto_now, or auto_now_add on insert.
+        return auto_now
+    return type(field).pre_save is not models.Field.pre_save
+
+
+class NHOModel(DirtyFieldsMixin, models.Model):
     """
     No-History OModel.
     """
@@ -36,6 +324,8 @@ class NHOModel(models.Model):
         on_delete=models.PROTECT,
     )
 
+    objects: ClassVar[OModelManager[Any]] = OModelManager()
+
     class Meta:
         abstract = True
 
@@ -48,15 +338,7 @@ class NHOModel(models.Model):
         *args,
         **kwargs,
     ) -> None:
-        user: User = kwargs.get("user", None)
-        if user is None and ((_user := get_user()) is not None):
-            user = _user
-        if user is None:
-            msg = (
-                f"User was not passed to the {self.__class__.__name__} "
-                "save method and could not be retrieved from the middleware"
-            )
-            raise ValueError(msg)
+        user = resolve_user(self.__class__, kwargs.get("user", None))
 
         self.updated_by = user  # type: ignore[assignment]
         if self._state.adding is True:
@@ -64,7 +346,8 @@ class NHOModel(models.Model):
 
         self.before_save(*args, **kwargs)
 
-        super().save(force_insert, force_update, using, update_fields)
+        # Only changed fields are updated. Unchanged objects are not saved, and no history is written for them.
+        self._save_changed_fields(force_insert, force_update, using, update_fields)
 
     def before_save(self, *args, **kwargs) -> None:
         """
@@ -72,7 +355,7 @@ class NHOModel(models.Model):
         """
 
 
-class OModel(models.Model):
+class OModel(DirtyFieldsMixin, models.Model):
     """
     Base model that keeps track of the creator, updater and create/update date.
     """
@@ -98,7 +381,15 @@ class OModel(models.Model):
         on_delete=models.PROTECT,
     )
 
-    history = HistoricalRecords(inherit=True)
+    history = OHistoricalRecords(inherit=True)
+
+    # Overrides ODEVLIB_HISTORY_WRITE_MODE setting for this model: "sync", "deferred" or "async".
+    # See odevlib.models.history.
+    history_write_mode: ClassVar[str | None] = None
+    # Overrides ODEVLIB_HISTORY_HYPERTABLE_INTERVAL setting for this model, e.g. "7 days".
+    history_hypertable_interval: ClassVar[str | None] = None
+
+    objects: ClassVar[OModelManager[Any]] = OModelManager()
 
     class Meta:
         abstract = True
@@ -112,15 +403,7 @@ class OModel(models.Model):
         *args,
         **kwargs,
     ) -> None:
-        user: User = kwargs.get("user", None)
-        if user is None and ((_user := get_user()) is not None):
-            user = _user
-        if user is None:
-            msg = (
-                f"User was not passed to the {self.__class__.__name__} "
-                "save method and could not be retrieved from the middleware"
-            )
-            raise ValueError(msg)
+        user = resolve_user(self.__class__, kwargs.get("user", None))
 
         self.updated_by = user  # type: ignore[assignment]
         if self._state.adding is True:
@@ -128,7 +411,8 @@ class OModel(models.Model):
 
         self.before_save(*args, **kwargs)
 
-        super().save(force_insert, force_update, using, update_fields)
+        # Only changed fields are updated. Unchanged objects are not saved, and no history is written for them.
+        self._save_changed_fields(force_insert, force_update, using, update_fields)
 
     def before_save(self, *args, **kwargs) -> None:
         """
@@ -1,19 +1,21 @@
+from typing import ClassVar
+
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.db import models
-from django.db.models import Manager
 
 from odevlib.fields.rbac_model import RBACModelField
 from odevlib.models import OModel, RBACRole
+from odevlib.models.omodel import OModelManager
 
 
-class InstanceRoleAssignmentManager(Manager):
+class InstanceRoleAssignmentManager(OModelManager["InstanceRoleAssignment"]):
     def roles_for_instance(
         self,
         user: AbstractUser,
         model_name: str,
         instance_id: int,
-    ) -> list[RBACRole]:
+    ) -> list[int]:
         return list(
             InstanceRoleAssignment.objects.filter(
                 model=model_name,
@@ -40,7 +42,7 @@ class InstanceRoleAssignment(OModel):
     model = RBACModelField(verbose_name="Full model name")
     instance_id = models.IntegerField(verbose_name="ID of a particular model instance")
 
-    objects: InstanceRoleAssignmentManager = InstanceRoleAssignmentManager()
+    objects: ClassVar[InstanceRoleAssignmentManager] = InstanceRoleAssignmentManager()
 
     def __str__(self) -> str:
         return f"{self.user.username} — {self.model}[{self.instance_id}] — {self.role.name}"
@@ -1,15 +1,15 @@
 from collections.abc import Mapping
+from typing import ClassVar
 
 from django.contrib.auth.models import AbstractUser
 from django.contrib.postgres.fields import HStoreField
 from django.db import models
-from django.db.models.manager import Manager
 
 from odevlib.exceptions.immutable import ImmutableException
-from odevlib.models import OModel
+from odevlib.models.omodel import OModel, OModelManager
 
 
-class RBACRoleManager(Manager["RBACRole"]):
+class RBACRoleManager(OModelManager["RBACRole"]):
     def for_user(self, user: AbstractUser) -> models.QuerySet["RBACRole"]:
         return self.filter(rbac_assignments__user=user)
 
@@ -30,7 +30,7 @@ class RBACRole(OModel):
     ui_name = models.TextField(verbose_name="Название роли для UI")
     permissions: HStoreField = HStoreField(verbose_name="Permissions assigned to this role")
 
-    objects: RBACRoleManager = RBACRoleManager()
+    objects: ClassVar[RBACRoleManager] = RBACRoleManager()
 
     def get_permissions(self) -> Mapping[str, str]:
         """
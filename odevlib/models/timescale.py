@@ -0,0 +1,268 @@
+"""
+Migration operations adding TimescaleDB policies to hypertables.
+
+Policies may be added to any hypertable, such as OModel history tables (see `odevlib.models.history`):
+
+    operations = [
+        AddRetentionPolicy("historicalorder", drop_after="3 years"),
+        AddCompressionPolicy("historicalorder", compress_after="30 days", segment_by="id"),
+    ]
+
+Models of other apps are referenced as "app_label.model_name", e.g. "odevlib.requestlogentry".
+
+Policies are run by TimescaleDB background jobs. Retention drops whole chunks older than `drop_after`.
+Compression converts chunks older than `compress_after` into columnar form; segmenting history by the primary key
+of the tracked model keeps queries for history of a single object fast on compressed chunks.
+
+`CreateRequestLogRollups` creates continuous aggregates of request logs (see `odevlib.business_logic.request_logs`).
+"""
+import logging
+import re
+from typing import Any
+
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.operations.base import Operation
+from django.db.migrations.state import ProjectState
+
+
+class HypertablePolicyOperation(Operation):
+    reduces_to_sql = True
+    reversible = True
+
+    def __init__(self, model_name: str) -> None:
+        self.model_name = model_name
+
+    def state_forwards(self, app_label: str, state: ProjectState) -> None:
+        pass
+
+    def forwards_sql(self, schema_editor: BaseDatabaseSchemaEditor, table: str) -> list[tuple[str, list[Any]]]:
+        raise NotImplementedError
+
+    def backwards_sql(self, schema_editor: BaseDatabaseSchemaEditor, table: str) -> list[tuple[str, list[Any]]]:
+        raise NotImplementedError
+
+    def _execute(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        state: ProjectState,
+        *,
+        forwards: bool,
+    ) -> None:
+        if "." in self.model_name:
+            app_label, model_name = self.model_name.split(".", 1)
+        else:
+            model_name = self.model_name
+        model = state.apps.get_model(app_label, model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        table = model._meta.db_table  # noqa: SLF001
+        statements = self.forwards_sql(schema_editor, table) if forwards else self.backwards_sql(schema_editor, table)
+        for sql, params in statements:
+            schema_editor.execute(sql, params)
+
+    def database_forwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,  # noqa: ARG002
+        to_state: ProjectState,
+    ) -> None:
+        self._execute(app_label, schema_editor, to_state, forwards=True)
+
+    def database_backwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,  # noqa: ARG002
+    ) -> None:
+        self._execute(app_label, schema_editor, from_state, forwards=False)
+
+
+class AddRetentionPolicy(HypertablePolicyOperation):
+    def __init__(self, model_name: str, drop_after: str) -> None:
+        super().__init__(model_name)
+        self.drop_after = drop_after
+
+    def describe(self) -> str:
+        return f"Add retention policy of {self.drop_after} to {self.model_name}"
+
+    @property
+    def migration_name_fragment(self) -> str:
+        return f"{self.model_name.lower().replace('.', '_')}_retention_policy"
+
+    def forwards_sql(self, schema_editor: BaseDatabaseSchemaEditor, table: str) -> list[tuple[str, list[Any]]]:  # noqa: ARG002
+        return [("SELECT add_retention_policy(%s, INTERVAL %s)", [table, self.drop_after])]
+
+    def backwards_sql(self, schema_editor: BaseDatabaseSchemaEditor, table: str) -> list[tuple[str, list[Any]]]:  # noqa: ARG002, PLR6301
+        return [("SELECT remove_retention_policy(%s)", [table])]
+
+
+class AddCompressionPolicy(HypertablePolicyOperation):
+    def __init__(
+        self,
+        model_name: str,
+        compress_after: str,
+        segment_by: str | None = None,
+        order_by: str | None = None,
+    ) -> None:
+        """
+        :param segment_by: Column to group compressed rows by, e.g. "id" of the tracked model for history tables.
+        :param order_by: Order of rows within compressed segments. TimescaleDB defaults to the time column, descending.
+        """
+        super().__init__(model_name)
+        self.compress_after = compress_after
+        self.segment_by = segment_by
+        self.order_by = order_by
+
+    def describe(self) -> str:
+        return f"Add compression policy of {self.compress_after} to {self.model_name}"
+
+    @property
+    def migration_name_fragment(self) -> str:
+        return f"{self.model_name.lower().replace('.', '_')}_compression_policy"
+
+    def forwards_sql(self, schema_editor: BaseDatabaseSchemaEditor, table: str) -> list[tuple[str, list[Any]]]:
+        options = ["timescaledb.compress"]
+        params = []
+        if self.segment_by is not None:
+            options.append("timescaledb.compress_segmentby = %s")
+            params.append(self.segment_by)
+        if self.order_by is not None:
+            options.append("timescaledb.compress_orderby = %s")
+            params.append(self.order_by)
+
+        return [
+            (f"ALTER TABLE {schema_editor.quote_name(table)} SET ({', '.join(options)})", params),
+            ("SELECT add_compression_policy(%s, INTERVAL %s)", [table, self.compress_after]),
+        ]
+
+    def backwards_sql(self, schema_editor: BaseDatabaseSchemaEditor, table: str) -> list[tuple[str, list[Any]]]:  # noqa: PLR6301
+        return [
+            ("SELECT remove_compression_policy(%s)", [table]),
+            # Compression can only be disabled when there are no compressed chunks left.
+            ("SELECT decompress_chunk(chunk, true) FROM show_chunks(%s) AS chunk", [table]),
+            (f"ALTER TABLE {schema_editor.quote_name(table)} SET (timescaledb.compress = false)", []),
+        ]
+
+
+# percentile_cont in continuous aggregates is supported since this TimescaleDB version.
+ROLLUPS_MIN_TIMESCALEDB_VERSION = (2, 7)
+
+ROLLUP_COLUMNS = """
+    path,
+    method,
+    count(*) AS requests,
+    count(*) FILTER (WHERE code >= 400 AND code < 500) AS client_errors,
+    count(*) FILTER (WHERE code >= 500) AS server_errors,
+    percentile_cont(0.5) WITHIN GROUP (ORDER BY processing_time) AS p50,
+    percentile_cont(0.95) WITHIN GROUP (ORDER BY processing_time) AS p95,
+    percentile_cont(0.99) WITHIN GROUP (ORDER BY processing_time) AS p99
+"""
+
+# Continuous aggregate -> (bucket width, start offset, end offset, schedule interval) of its refresh policy.
+ROLLUPS = {
+    "odevlib_requestlog_1m": ("1 minute", "1 hour", "1 minute", "1 minute"),
+    "odevlib_requestlog_1h": ("1 hour", "1 day", "1 hour", "30 minutes"),
+}
+
+
+def get_timescaledb_version(schema_editor: BaseDatabaseSchemaEditor) -> tuple[int, ...] | None:
+    """
+    Return (major, minor) version of TimescaleDB extension of the database, or None if it isn't installed.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return None
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT extversion FROM pg_extension WHERE extname = 'timescaledb'")
+        row = cursor.fetchone()
+    if row is None:
+        return None
+    return tuple(int(part) for part in re.findall(r"\d+", row[0])[:2])
+
+
+class CreateRequestLogRollups(Operation):
+    """
+    Create per minute and per hour continuous aggregates of RequestLogEntry with their refresh policies,
+    skipping existing ones. Continuous aggregates can't be created in a transaction, so the migration
+    must set `atomic = False`.
+
+    Percentiles in continuous aggregates require TimescaleDB 2.7 or newer. On older versions, or without
+    TimescaleDB, the operation logs a warning and does nothing.
+    """
+
+    reversible = True
+
+    def state_forwards(self, app_label: str, state: ProjectState) -> None:
+        pass
+
+    def describe(self) -> str:  # noqa: PLR6301
+        return "Create request log rollups"
+
+    @property
+    def migration_name_fragment(self) -> str:
+        return "request_log_rollups"
+
+    def _allow_migrate(self, schema_editor: BaseDatabaseSchemaEditor, state: ProjectState) -> bool:
+        model = state.apps.get_model("odevlib", "requestlogentry")
+        return self.allow_migrate_model(schema_editor.connection.alias, model)
+
+    def _is_supported(self, schema_editor: BaseDatabaseSchemaEditor, state: ProjectState) -> bool:
+        if not self._allow_migrate(schema_editor, state):
+            return False
+        version = get_timescaledb_version(schema_editor)
+        if version is None or version < ROLLUPS_MIN_TIMESCALEDB_VERSION:
+            logging.warning(
+                "Request log rollups require TimescaleDB %s or newer, found %s. Rollups are not created.",
+                ".".join(map(str, ROLLUPS_MIN_TIMESCALEDB_VERSION)),
+                ".".join(map(str, version)) if version is not None else "none",
+            )
+            return False
+        return True
+
+    def database_forwards(
+        self,
+        app_label: str,  # noqa: ARG002
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,  # noqa: ARG002
+        to_state: ProjectState,
+    ) -> None:
+        if not self._is_supported(schema_editor, to_state):
+            return
+        for view, (bucket, start_offset, end_offset, schedule_interval) in ROLLUPS.items():
+            # View names, intervals and columns come from the constants above.
+            schema_editor.execute(
+                f"""
+                CREATE MATERIALIZED VIEW IF NOT EXISTS {view}
+                WITH (timescaledb.continuous) AS
+                SELECT time_bucket(INTERVAL '{bucket}', time) AS bucket, {ROLLUP_COLUMNS}
+                FROM odevlib_requestlogentry
+                GROUP BY bucket, path, method
+                WITH NO DATA
+                """,  # noqa: S608
+            )
+            schema_editor.execute(
+                """
+                SELECT add_continuous_aggregate_policy(
+                    %s,
+                    start_offset => INTERVAL %s,
+                    end_offset => INTERVAL %s,
+                    schedule_interval => INTERVAL %s,
+                    if_not_exists => true
+                )
+                """,
+                [view, start_offset, end_offset, schedule_interval],
+            )
+
+    def database_backwards(
+        self,
+        app_label: str,  # noqa: ARG002
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,  # noqa: ARG002
+    ) -> None:
+        if not self._allow_migrate(schema_editor, from_state) or get_timescaledb_version(schema_editor) is None:
+            return
+        for view in reversed(ROLLUPS):
+            schema_editor.execute(f"DROP MATERIALIZED VIEW IF EXISTS {view}")
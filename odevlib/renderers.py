@@ -0,0 +1,60 @@
+"""
+DRF renderer and parser using the fast JSON backend (see odevlib.utils.json_backend).
+
+Enable them in settings:
+
+.. code-block:: python
+
+   REST_FRAMEWORK = {
+       "DEFAULT_RENDERER_CLASSES": (
+           "odevlib.renderers.ODevLibJSONRenderer",
+           "rest_framework.renderers.BrowsableAPIRenderer",
+       ),
+       "DEFAULT_PARSER_CLASSES": (
+           "odevlib.renderers.ODevLibJSONParser",
+           "rest_framework.parsers.FormParser",
+           "rest_framework.parsers.MultiPartParser",
+       ),
+   }
+
+ODevLibJSONRenderer falls back to DRF's rendering when output differs from DRF's defaults, i.e. when UNICODE_JSON,
+COMPACT_JSON or STRICT_JSON setting is disabled, or when indentation is requested.
+"""
+from collections.abc import Mapping
+from typing import IO, Any
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from odevlib.utils import json_backend
+
+
+class ODevLibJSONRenderer(JSONRenderer):
+    def render(
+        self,
+        data: object,
+        accepted_media_type: str | None = None,
+        renderer_context: Mapping[str, Any] | None = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+        if (
+            self.ensure_ascii
+            or not self.compact
+            or not self.strict
+            or self.get_indent(accepted_media_type or "", renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        return json_backend.dumps(data)
+
+
+class ODevLibJSONParser(JSONParser):
+    renderer_class = ODevLibJSONRenderer
+
+    def parse(self, stream: IO[bytes], media_type: str | None = None, parser_context: Mapping | None = None) -> Any:  # noqa: ANN401, ARG002, PLR6301
+        try:
+            return json_backend.loads(stream.read())
+        except ValueError as e:
+            msg = f"JSON parse error - {e}"
+            raise ParseError(msg) from e
@@ -5,6 +5,7 @@ import typing
 from collections import OrderedDict
 from typing import TYPE_CHECKING
 
+from django.contrib.auth.models import AnonymousUser
 from django.db import models
 from rest_framework import serializers
 from rest_framework.exceptions import APIException
@@ -29,9 +30,6 @@ from odevlib.models.errors import Error
 from odevlib.models.rbac.mixins import RBACHierarchyModelMixin
 from odevlib.serializers.omodelserializer import OModelCreateSerializer, OModelSerializer
 
-if TYPE_CHECKING:
-    from django.contrib.auth.models import AbstractUser
-
 _Base = serializers.ModelSerializer if TYPE_CHECKING else object
 
 # List of fields which are always available regardless of the role. By default, this includes only
@@ -84,7 +82,7 @@ class RBACSerializerMixin(_Base):
         return pk
 
     def filter_fields(self, fields: OrderedDict[str, Field]) -> OrderedDict[str, Field]:
-        user: AbstractUser | None = get_user()
+        user = get_user()
         if user is None:
             # This should never happen, as even unauthorized users have AnonymousUser instance.
             msg = f"Couldn't obtain user in {self.__class__.__name__}"
@@ -100,6 +98,12 @@ class RBACSerializerMixin(_Base):
             ).save()
             return fields
 
+        if isinstance(user, AnonymousUser):
+            # Anonymous users have no roles.
+            return OrderedDict(
+                [(field_name, field) for field_name, field in fields.items() if field_name in always_available_fields],
+            )
+
         # Give full access to all fields to superusers
         if user.is_superuser:
             return fields
@@ -1,20 +1,107 @@
-from django.http import HttpRequest, HttpResponse
+import datetime
+
+from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import render
+from django.utils import timezone
 
+from odevlib.business_logic.request_logs import get_request_log_rollups, get_request_logs, serialize_request_log_entry
+from odevlib.errors import codes
+from odevlib.errors.codes import status_code_mapping
+from odevlib.models.errors import Error, GracefulErrorSerializer
 from odevlib.models.logging import RequestLogEntry
+from odevlib.views.request_logs import parse_time_range
 
 
 def request_logs_view(request: HttpRequest) -> HttpResponse:
+    """
+    Render the latest request log entries, a page at a time.
+
+    Supported query parameters: `start`/`end` (ISO 8601, defaults to the last 24 hours), `path` (prefix),
+    `status` (code or class like "5xx"), `user` (id), `limit` and `cursor` (returned with the previous page).
+    With `format=json`, the page is returned as JSON, which the viewer uses to load further pages.
+    """
     if not request.user.is_superuser:
         # TODO: replace this with a 403 page built into ODevLib? Not all project will have this template.
         return render(request, "403.html")
 
-    logs = RequestLogEntry.timescale.order_by("-time").select_related("user")[:10000]
+    page = _get_request_logs_page(request)
+    if isinstance(page, Error):
+        return JsonResponse(
+            GracefulErrorSerializer(instance=page).data,
+            status=status_code_mapping.get(page.error_code, 418),
+        )
+    logs, next_cursor = page
+
+    if request.GET.get("format") == "json":
+        return JsonResponse(
+            {
+                "results": [serialize_request_log_entry(entry) for entry in logs],
+                "next_cursor": next_cursor,
+            },
+        )
 
     return render(
         request,
         "admin/request_logs.html",
         context={
             "logs": logs,
+            "next_cursor": next_cursor,
+            "filters": {name: request.GET.get(name, "") for name in ("start", "end", "path", "status", "user")},
+        },
+    )
+
+
+def _get_request_logs_page(request: HttpRequest) -> tuple[list[RequestLogEntry], str | None] | Error:
+    time_range = parse_time_range(request.GET)
+    if isinstance(time_range, Error):
+        return time_range
+    start, end = time_range
+
+    user_id: str | None = request.GET.get("user") or None
+    limit: str = request.GET.get("limit", "200")
+    if (user_id is not None and not user_id.isdigit()) or not limit.isdigit():
+        return Error(
+            error_code=codes.invalid_request_data,
+            eng_description="Expected integer user and limit",
+            ui_description="Expected integer user and limit",
+        )
+    if int(limit) < 1:
+        return Error(
+            error_code=codes.invalid_request_data,
+            eng_description=f"Expected positive limit, but got {limit}",
+            ui_description=f"Expected positive limit, but got {limit}",
+        )
+
+    return get_request_logs(
+        start,
+        end,
+        path=request.GET.get("path") or None,
+        status=request.GET.get("status") or None,
+        user_id=int(user_id) if user_id is not None else None,
+        cursor=request.GET.get("cursor") or None,
+        limit=int(limit),
+    )
+
+
+def request_log_rollups_view(request: HttpRequest) -> HttpResponse:
+    """
+    Render hourly request statistics for the last week, queried from rollups only.
+    """
+    if not request.user.is_superuser:
+        return render(request, "403.html")
+
+    end = timezone.now()
+    rollups = get_request_log_rollups("hour", end - datetime.timedelta(days=7), end, limit=5000)
+    if isinstance(rollups, Error):
+        return JsonResponse(
+            GracefulErrorSerializer(instance=rollups).data,
+            status=status_code_mapping.get(rollups.error_code, 418),
+        )
+
+    return render(
+        request,
+        "admin/request_log_rollups.html",
+        context={
+            "rollups": rollups,
         },
     )
@@ -3,6 +3,7 @@ from rest_framework.routers import SimpleRouter
 
 from odevlib.views.rbac.permissions import do_i_have_rbac_permission, get_my_roles_and_permissions, list_all_rbac_permissions
 from odevlib.views.rbac.rbac_role import RBACRoleViewSet
+from odevlib.views.request_logs import request_log_rollups
 from odevlib.views.sps import SimplePermissionSystemPermissionViewSet
 
 router = SimpleRouter()
@@ -14,6 +15,7 @@ urlpatterns = [
     path('do_i_have_rbac_permission/', do_i_have_rbac_permission),
     path('list_rbac_permissions/', list_all_rbac_permissions),
     path('get_my_roles_and_permissions/', get_my_roles_and_permissions),
+    path('request_log_rollups/', request_log_rollups),
 ]
 
 urlpatterns += router.urls  # type: ignore
@@ -0,0 +1,127 @@
+"""
+Background writer of model instances.
+
+Instances are put into a bounded in-process queue instead of being saved on the caller's path. A daemon thread
+takes them from the queue and inserts them with a single `bulk_create` per model, database and batch.
+A batch is flushed when `batch_size` instances are collected, or `flush_interval` seconds after its first
+instance arrived.
+
+When the database can't keep up and the queue is full, new instances are either dropped (the default),
+or the caller is blocked until there is space in the queue. The number of dropped instances is logged
+with the next flush.
+"""
+import atexit
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+
+from django.db import close_old_connections, models
+
+
+class BulkWriter:
+    batch_size: int
+    flush_interval: float
+    block_when_full: bool
+
+    # Number of instances dropped since the last flush because the queue was full.
+    dropped: int
+
+    def __init__(  # noqa: PLR0913
+        self,
+        queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        block_when_full: bool = False,
+        name: str = "odevlib-bulk-writer",
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.block_when_full = block_when_full
+        self.dropped = 0
+
+        self._queue: queue.Queue[tuple[models.Model, str | None] | None] = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, instance: models.Model, using: str | None = None) -> None:
+        """
+        Queue the instance for writing. Only blocks if the queue is full and `block_when_full` is set.
+
+        :param using: Database alias to insert the instance into. Defaults to the one chosen by database routers.
+        """
+        if self.block_when_full:
+            self._queue.put((instance, using))
+            return
+        try:
+            self._queue.put_nowait((instance, using))
+        except queue.Full:
+            # Not synchronized, so the counter is approximate under contention.
+            self.dropped += 1
+
+    def _collect(self) -> tuple[list[tuple[models.Model, str | None]], bool]:
+        """
+        Wait for the next batch of instances and their databases. Also returns whether the writer is closed.
+        """
+        item = self._queue.get()
+        if item is None:
+            return [], True
+
+        batch = [item]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _flush(self, batch: list[tuple[models.Model, str | None]]) -> None:
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            logging.warning("%s queue is full, dropped %d instances", self._thread.name, dropped)
+
+        if not batch:
+            return
+
+        by_model: dict[tuple[type[models.Model], str | None], list[models.Model]] = defaultdict(list)
+        for instance, using in batch:
+            by_model[type(instance), using].append(instance)
+
+        # Recover from broken or timed out connections of the writer thread.
+        close_old_connections()
+        for (model, using), instances in by_model.items():
+            try:
+                self.save_batch(model, instances, using)
+            except Exception:
+                logging.exception("Error occurred while saving %d %s instances", len(instances), model.__name__)
+
+    def save_batch(self, model: type[models.Model], instances: list[models.Model], using: str | None = None) -> None:  # noqa: PLR6301
+        """
+        Insert a batch of instances of the model into the database. Called from the writer thread.
+        """
+        model._default_manager.db_manager(using).bulk_create(instances)  # noqa: SLF001
+
+    def _run(self) -> None:
+        closed = False
+        while not closed:
+            batch, closed = self._collect()
+            self._flush(batch)
+
+    def close(self) -> None:
+        """
+        Write the remaining instances and stop the writer thread.
+        """
+        if not self._thread.is_alive():
+            return
+        # Block here instead of dropping the stop signal if the queue is full.
+        self._queue.put(None)
+        self._thread.join()
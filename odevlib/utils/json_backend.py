@@ -0,0 +1,103 @@
+"""
+JSON encoding and decoding used by ODevLib renderer, parser and API clients.
+
+orjson is used when installed, falling back to the standard library `json` module. Set JSON_BACKEND setting
+to "orjson" or "json" to choose the backend explicitly.
+
+`json` backend produces the same output as DRF's JSONRenderer with default settings (UNICODE_JSON, COMPACT_JSON
+and STRICT_JSON enabled): values that JSON has no type for (Decimal, UUID, lazy translation strings, timedelta,
+querysets, etc.) and dates and times are converted by DRF's JSONEncoder, and U+2028/U+2029 are escaped so
+the output is also valid JavaScript. orjson backend converts values the same way, but its output is not
+byte-identical: floats are formatted differently (`1e20` instead of `1e+20`), and NaN and infinity are encoded
+as null, while DRF raises ValueError. orjson can't encode integers wider than 64 bits, such payloads are
+encoded with `json` instead.
+"""
+import json
+from typing import Any
+
+from django.conf import settings
+from rest_framework.utils.encoders import JSONEncoder
+
+_encoder = JSONEncoder()
+
+
+def _escape_line_separators(data: bytes) -> bytes:
+    return data.replace("\u2028".encode(), b"\\u2028").replace("\u2029".encode(), b"\\u2029")
+
+
+class JSONBackend:
+    name = "json"
+
+    def dumps(self, value: object) -> bytes:  # noqa: PLR6301
+        data = json.dumps(
+            value,
+            cls=JSONEncoder,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        return _escape_line_separators(data)
+
+    def loads(self, data: bytes | str) -> Any:  # noqa: ANN401, PLR6301
+        return json.loads(data)
+
+
+class OrjsonBackend(JSONBackend):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        # Dates and times are left to DRF's encoder, its format differs between DRF versions.
+        self._options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, value: object) -> bytes:
+        try:
+            data = self._orjson.dumps(value, default=_encoder.default, option=self._options)
+        except self._orjson.JSONEncodeError:
+            # Integers over 64 bits, or a value neither backend can encode, in which case json raises the error.
+            return super().dumps(value)
+        return _escape_line_separators(data)
+
+    def loads(self, data: bytes | str) -> Any:  # noqa: ANN401
+        return self._orjson.loads(data)
+
+
+_backend: JSONBackend | None = None
+
+
+def get_json_backend() -> JSONBackend:
+    """
+    Return the configured JSON backend, see module docstring.
+    """
+    global _backend  # noqa: PLW0603
+    if _backend is None:
+        name = getattr(settings, "JSON_BACKEND", None)
+        if name == "json":
+            _backend = JSONBackend()
+        elif name == "orjson":
+            _backend = OrjsonBackend()
+        elif name is not None:
+            msg = f'Unknown JSON_BACKEND "{name}". Expected "orjson" or "json"'
+            raise ValueError(msg)
+        else:
+            try:
+                _backend = OrjsonBackend()
+            except ImportError:
+                _backend = JSONBackend()
+    return _backend
+
+
+def dumps(value: object) -> bytes:
+    """
+    Encode value into UTF-8 JSON.
+    """
+    return get_json_backend().dumps(value)
+
+
+def loads(data: bytes | str) -> Any:  # noqa: ANN401
+    """
+    Decode JSON. Raises ValueError if data is not a valid JSON.
+    """
+    return get_json_backend().loads(data)
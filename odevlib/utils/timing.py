@@ -0,0 +1,109 @@
+"""
+Per-request time breakdown collected by TimescaleLoggingMiddleware.
+
+The middleware starts collection for each request. Code on the request path reports how much time it spent
+in a particular phase (e.g. "serialization" or "rbac") with `measure` context manager or `timed` decorator.
+Nested measurements of the same phase are only counted once. Outside of a request, measuring is a no-op.
+
+Timings are kept in a context variable, so requests served concurrently on one thread (ASGI) don't mix,
+and measurements made in threads the request is offloaded to with `sync_to_async` are counted too.
+"""
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+current_timings: ContextVar["RequestTimings | None"] = ContextVar("odevlib_request_timings", default=None)
+
+
+class RequestTimings:
+    """
+    Time spent by the current request in each phase, in nanoseconds, plus DB query count.
+    """
+
+    def __init__(self) -> None:
+        self.db_queries = 0
+        self.phases: dict[str, int] = {}
+        # Phases that are being measured right now, used to skip nested measurements.
+        self.active: set[str] = set()
+
+    def add(self, phase: str, elapsed_ns: int) -> None:
+        self.phases[phase] = self.phases.get(phase, 0) + elapsed_ns
+
+    def as_dict(self) -> dict[str, int]:
+        """
+        Return compact representation for storage: phase times in microseconds and DB query count.
+        """
+        result = {f"{phase}_us": elapsed_ns // 1000 for phase, elapsed_ns in self.phases.items()}
+        result["db_queries"] = self.db_queries
+        return result
+
+
+def start_timings() -> RequestTimings:
+    timings = RequestTimings()
+    current_timings.set(timings)
+    return timings
+
+
+def stop_timings() -> None:
+    current_timings.set(None)
+
+
+def get_timings() -> RequestTimings | None:
+    return current_timings.get()
+
+
+@contextmanager
+def measure(phase: str) -> Iterator[None]:
+    """
+    Add the time spent inside the block to the specified phase of the current request.
+    """
+    timings = get_timings()
+    if timings is None or phase in timings.active:
+        yield
+        return
+
+    timings.active.add(phase)
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        timings.add(phase, time.perf_counter_ns() - start)
+        timings.active.discard(phase)
+
+
+def timed(phase: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Measure time of the decorated function, like `measure`.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with measure(phase):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def db_timing_wrapper(execute: Callable, sql: str, params: object, many: bool, context: dict) -> object:
+    """
+    Database execute wrapper (see `connection.execute_wrapper`) that counts queries and their time.
+    """
+    timings = get_timings()
+    if timings is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter_ns()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.db_queries += 1
+        timings.add("db", time.perf_counter_ns() - start)
@@ -22,6 +22,7 @@ from odevlib.errors import codes
 from odevlib.models.errors import Error
 from odevlib.prefetching import prefetch
 from odevlib.serializers.related import RelationSerializer
+from odevlib.utils.timing import measure
 
 if TYPE_CHECKING:
     from odevlib.views.oviewset import OViewSetProtocol
@@ -65,7 +66,9 @@ class OCreateMixin(Generic[M]):
         if isinstance(instance, Error):
             return instance.serialize_response()
         response_serializer = self.serializer_class(instance)
-        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+        with measure("serialization"):
+            data = response_serializer.data
+        return Response(data, status=status.HTTP_201_CREATED)
 
     def perform_create(self, serializer) -> M | Error:
         """
@@ -117,7 +120,9 @@ class OListMixin(Generic[M]):
             return queryset.serialize_response()
 
         serializer = self.serializer_class(queryset, many=True, context=context)
-        return Response(serializer.data)
+        with measure("serialization"):
+            data = serializer.data
+        return Response(data)
 
 
 class OCursorPaginatedListMixin(Generic[M]):
@@ -214,8 +219,10 @@ class OCursorPaginatedListMixin(Generic[M]):
             return queryset.serialize_response()
 
         serializer = self.serializer_class(queryset, many=True, context=context)
+        with measure("serialization"):
+            data = serializer.data
         return Response(
-            serializer.data,
+            data,
             headers={
                 "X-ODEVLIB-HAS-MORE": str(filtered_count < available_count).lower(),
             },
@@ -250,7 +257,9 @@ class ORetrieveMixin(Generic[M]):
             ).serialize_response()
         serializer = self.serializer_class(instance, context=context)
 
-        return Response(serializer.data)
+        with measure("serialization"):
+            data = serializer.data
+        return Response(data)
 
 
 class OUpdateMixin(Generic[M]):
@@ -311,7 +320,9 @@ class OUpdateMixin(Generic[M]):
         }
 
         response_serializer = self.serializer_class(instance, context=response_context)
-        return Response(response_serializer.data)
+        with measure("serialization"):
+            data = response_serializer.data
+        return Response(data)
 
     def perform_update(self, serializer: ModelSerializer[M]) -> M | Error:
         """
@@ -415,7 +426,9 @@ class ORelationsMixin(Generic[M]):
         result = get_relations(instance)
         response_serializer = RelationSerializer(data=result, many=True)
         response_serializer.is_valid(raise_exception=True)
-        return Response(response_serializer.data)
+        with measure("serialization"):
+            data = response_serializer.data
+        return Response(data)
 
 
 class OModelMixins(OCreateMixin[M], OUpdateMixin[M], OListMixin[M], ORetrieveMixin[M], ODestroyMixin[M]):
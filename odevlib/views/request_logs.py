@@ -0,0 +1,115 @@
+import datetime
+from collections.abc import Mapping
+
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from odevlib.business_logic.request_logs import ROLLUP_VIEWS, get_request_log_rollups
+from odevlib.errors import codes
+from odevlib.models.errors import Error
+
+
+def parse_time_range(query_params: Mapping[str, str]) -> tuple[datetime.datetime, datetime.datetime] | Error:
+    """
+    Parse `start` and `end` ISO 8601 query parameters. Defaults to the last 24 hours.
+    """
+    end = timezone.now()
+    start = end - datetime.timedelta(days=1)
+
+    for name in ("start", "end"):
+        value: str | None = query_params.get(name, None)
+        if value is None:
+            continue
+        parsed = parse_datetime(value)
+        if parsed is None:
+            return Error(
+                error_code=codes.invalid_request_data,
+                eng_description=f'Expected ISO 8601 datetime in {name}, but got "{value}"',
+                ui_description=f'Expected ISO 8601 datetime in {name}, but got "{value}"',
+            )
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        if name == "start":
+            start = parsed
+        else:
+            end = parsed
+
+    return start, end
+
+
+@extend_schema(
+    summary="Get request log rollups",
+    description="Returns request counts, error counts and processing time percentiles (ms) "
+    "per path and method, bucketed by minute or hour. Only available to superusers.",
+    request=None,
+    parameters=[
+        OpenApiParameter(
+            "resolution",
+            description=f"Bucket size, one of: {', '.join(ROLLUP_VIEWS)}. Defaults to minute.",
+            location=OpenApiParameter.QUERY,
+            type=OpenApiTypes.STR,
+            required=False,
+        ),
+        OpenApiParameter(
+            "start",
+            description="Start of the time range (inclusive). Defaults to 24 hours ago.",
+            location=OpenApiParameter.QUERY,
+            type=OpenApiTypes.DATETIME,
+            required=False,
+        ),
+        OpenApiParameter(
+            "end",
+            description="End of the time range (exclusive). Defaults to now.",
+            location=OpenApiParameter.QUERY,
+            type=OpenApiTypes.DATETIME,
+            required=False,
+        ),
+        OpenApiParameter(
+            "path",
+            description="Only return rollups of this HTTP path.",
+            location=OpenApiParameter.QUERY,
+            type=OpenApiTypes.STR,
+            required=False,
+        ),
+        OpenApiParameter(
+            "method",
+            description="Only return rollups of this HTTP method.",
+            location=OpenApiParameter.QUERY,
+            type=OpenApiTypes.STR,
+            required=False,
+        ),
+    ],
+    responses={200: OpenApiTypes.OBJECT},
+)
+@api_view()
+@permission_classes([IsAuthenticated])
+def request_log_rollups(request: Request) -> Response:
+    if not request.user.is_superuser:
+        return Error(
+            error_code=codes.permission_denied,
+            eng_description="Only superusers can access request logs",
+            ui_description="Only superusers can access request logs",
+        ).serialize_response()
+
+    time_range = parse_time_range(request.query_params)
+    if isinstance(time_range, Error):
+        return time_range.serialize_response()
+    start, end = time_range
+
+    rollups = get_request_log_rollups(
+        request.query_params.get("resolution", "minute"),
+        start,
+        end,
+        path=request.query_params.get("path", None),
+        method=request.query_params.get("method", None),
+    )
+    if isinstance(rollups, Error):
+        return rollups.serialize_response()
+
+    return Response(rollups)
@@ -140,8 +140,20 @@ REST_FRAMEWORK = {
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_RENDERER_CLASSES": (
+        "odevlib.renderers.ODevLibJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "odevlib.renderers.ODevLibJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
 
+# Save request logs on the request path, so tests don't depend on the background writer thread.
+REQUEST_LOG_ASYNC = False
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "ODevLib Example app API",
     "DESCRIPTION": "Documentation of API endpoints of example ODevLib app. This app is used to test ODL functionality.",
@@ -0,0 +1,58 @@
+# Generated by Django 4.2.30 on 2026-10-19 01:21
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import odevlib.models.omodel
+import simple_history.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('test_app', '0002_added_example_rbac_models'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HistoricalExampleAutoNowOModel',
+            fields=[
+                ('id', models.BigIntegerField(auto_created=True, blank=True, db_index=True, verbose_name='ID')),
+                ('created_at', models.DateTimeField(blank=True, editable=False, verbose_name='Дата создания')),
+                ('updated_at', models.DateTimeField(blank=True, editable=False, verbose_name='Дата редактирования')),
+                ('test_field', models.TextField()),
+                ('touched_at', models.DateTimeField(blank=True, editable=False)),
+                ('history_id', models.AutoField(primary_key=True, serialize=False)),
+                ('history_date', models.DateTimeField(db_index=True)),
+                ('history_change_reason', models.CharField(max_length=100, null=True)),
+                ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+                ('created_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Создатель')),
+                ('history_user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('updated_by', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Последний редактор')),
+            ],
+            options={
+                'verbose_name': 'historical example auto now o model',
+                'verbose_name_plural': 'historical example auto now o models',
+                'ordering': ('-history_date', '-history_id'),
+                'get_latest_by': ('history_date', 'history_id'),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name='ExampleAutoNowOModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Дата создания')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Дата редактирования')),
+                ('test_field', models.TextField()),
+                ('touched_at', models.DateTimeField(auto_now=True)),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='created_%(model_name)ss', to=settings.AUTH_USER_MODEL, verbose_name='Создатель')),
+                ('updated_by', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='updated_%(model_name)ss', to=settings.AUTH_USER_MODEL, verbose_name='Последний редактор')),
+            ],
+            options={
+                'abstract': False,
+            },
+            bases=(odevlib.models.omodel.DirtyFieldsMixin, models.Model),
+        ),
+    ]
@@ -25,6 +25,15 @@ class ExampleOneToOneOModel(OModel):
     test_field = models.TextField()
 
 
+class ExampleAutoNowOModel(OModel):
+    """
+    Used to test that fields set on save are updated along with changed fields.
+    """
+
+    test_field = models.TextField()
+    touched_at = models.DateTimeField(auto_now=True)
+
+
 class ExampleRBACParent(OModel):
     test_field = models.TextField()
     test_field2 = models.TextField()
@@ -0,0 +1,92 @@
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from odevlib.caching import tags
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.commands: list[tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any, **kwargs: Any) -> "FakePipeline":
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self) -> list[Any]:
+        return [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    """
+    In-memory stand-in for redis.Redis, implementing commands used by RedisCache and tag invalidation.
+    """
+
+    def __init__(self, port: int = 6379) -> None:
+        self.values: dict[str, Any] = {}
+        self.expires: dict[str, float] = {}
+        self.connection_pool = type("Pool", (), {"connection_kwargs": {"host": "fake", "port": port, "db": 0}})()
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:  # noqa: ARG002
+        return FakePipeline(self)
+
+    def get(self, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    def set(self, key: str, value: bytes, ex: int | None = None) -> bool:
+        self.values[key] = value
+        if ex is not None:
+            self.expires[key] = time.time() + ex
+        return True
+
+    def sadd(self, key: str, *members: str) -> int:
+        members_set = self.values.setdefault(key, set())
+        added = len(set(members) - members_set)
+        members_set.update(members)
+        return added
+
+    def smembers(self, key: str) -> "set[bytes]":
+        return {member.encode() for member in self.values.get(key, set())}
+
+    def delete(self, *keys: str | bytes) -> int:
+        deleted = 0
+        for key in keys:
+            key = key.decode() if isinstance(key, bytes) else key
+            deleted += self.values.pop(key, None) is not None
+            self.expires.pop(key, None)
+        return deleted
+
+    def ttl(self, key: str) -> int:
+        if key not in self.values:
+            return -2
+        if key not in self.expires:
+            return -1
+        return int(self.expires[key] - time.time())
+
+    def expire(self, key: str, seconds: int) -> bool:
+        self.expires[key] = time.time() + seconds
+        return True
+
+    def eval(self, script: str, numkeys: int, *args: Any) -> None:
+        # Python version of the only script used.
+        assert script == tags.TAG_ENTRY_SCRIPT
+        assert numkeys == 1
+        key, member, timeout = args
+        self.sadd(key, member)
+        if self.ttl(key) < int(timeout):
+            self.expire(key, int(timeout))
+
+
+@pytest.fixture()
+def fake_redis() -> Iterator[FakeRedis]:
+    registered = dict(tags._redis_instances)  # noqa: SLF001
+    tags._redis_instances.clear()  # noqa: SLF001
+    yield FakeRedis()
+    tags._redis_instances.clear()  # noqa: SLF001
+    tags._redis_instances.update(registered)  # noqa: SLF001
@@ -0,0 +1,55 @@
+import datetime
+
+import pytest
+
+from odevlib.caching.codecs import CompressedCodec, PickleCodec
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        "short string",
+        {"key": [1, 2, 3], "date": datetime.date(2023, 1, 1)},
+        b"\x00\x01\x02" * 10000,
+    ],
+)
+def test_pickle_codec_roundtrip(value: object) -> None:
+    codec = PickleCodec()
+    data = codec.dumps(value)
+
+    assert isinstance(data, bytes)
+    assert codec.loads(data) == value
+
+
+def test_compressed_codec_skips_small_values() -> None:
+    codec = CompressedCodec(PickleCodec(), threshold=1024)
+    value = "small"
+
+    data = codec.dumps(value)
+
+    assert data == b"\x00" + PickleCodec().dumps(value)
+    assert codec.loads(data) == value
+
+
+def test_compressed_codec_compresses_large_values() -> None:
+    codec = CompressedCodec(PickleCodec(), threshold=1024)
+    value = ["repeated value"] * 1000
+
+    data = codec.dumps(value)
+
+    assert data[:1] == b"\x01"
+    assert len(data) < len(PickleCodec().dumps(value))
+    assert codec.loads(data) == value
+
+
+def test_compressed_codec_rejects_foreign_data() -> None:
+    codec = CompressedCodec(PickleCodec())
+
+    with pytest.raises(ValueError, match="CompressedCodec"):
+        codec.loads(b"\xffgarbage")
+
+
+def test_compressed_codec_rejects_unknown_algorithm() -> None:
+    with pytest.raises(ValueError, match="Unknown compression algorithm"):
+        CompressedCodec(PickleCodec(), algorithm="brotli")
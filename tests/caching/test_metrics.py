@@ -0,0 +1,123 @@
+import gc
+import threading
+
+from odevlib.caching.codecs import PickleCodec
+from odevlib.caching.metrics import CacheMetrics, CacheMetricsHook, render_prometheus
+from odevlib.caching.redis_cache import RedisCache
+from odevlib.errors import codes
+from odevlib.models.errors import Error
+from tests.caching.conftest import FakeRedis
+
+
+def test_counters_are_summed_across_threads() -> None:
+    metrics = CacheMetrics()
+
+    def record() -> None:
+        for _ in range(100):
+            metrics.on_hit("ExampleCache")
+        metrics.on_miss("ExampleCache")
+        metrics.on_error("OtherCache")
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["ExampleCache"].hits == 400
+    assert snapshot["ExampleCache"].misses == 4
+    assert snapshot["OtherCache"].errors == 4
+
+
+def test_fill_histograms() -> None:
+    metrics = CacheMetrics()
+    metrics.on_fill("ExampleCache", 0.003, 100)
+    metrics.on_fill("ExampleCache", 100.0, 10_000_000)
+
+    stats = metrics.snapshot()["ExampleCache"]
+    assert stats.fills == 2
+    assert stats.fill_buckets[1] == 1
+    assert stats.fill_buckets[-1] == 1
+    assert stats.size_buckets[1] == 1
+    assert stats.size_buckets[-1] == 1
+    assert stats.size_sum == 10_000_100
+
+
+def test_render_prometheus() -> None:
+    metrics = CacheMetrics()
+    metrics.on_hit("ExampleCache")
+    metrics.on_fill("ExampleCache", 0.003, 100)
+
+    text = render_prometheus(metrics)
+
+    assert 'odevlib_cache_hits_total{cache="ExampleCache"} 1\n' in text
+    assert 'odevlib_cache_fill_seconds_bucket{cache="ExampleCache",le="0.001"} 0\n' in text
+    assert 'odevlib_cache_fill_seconds_bucket{cache="ExampleCache",le="0.005"} 1\n' in text
+    assert 'odevlib_cache_fill_seconds_bucket{cache="ExampleCache",le="+Inf"} 1\n' in text
+    assert 'odevlib_cache_value_bytes_count{cache="ExampleCache"} 1\n' in text
+
+
+def test_stats_of_finished_threads_are_merged() -> None:
+    metrics = CacheMetrics()
+
+    for _ in range(20):
+        thread = threading.Thread(target=metrics.on_hit, args=("ExampleCache",))
+        thread.start()
+        thread.join()
+        del thread
+    gc.collect()
+
+    assert len(metrics._thread_stats) == 0  # noqa: SLF001
+    assert metrics.snapshot()["ExampleCache"].hits == 20
+
+
+class RecordingMetrics(CacheMetricsHook):
+    def __init__(self) -> None:
+        self.events: list[str] = []
+
+    def on_hit(self, cache: str) -> None:
+        self.events.append(f"hit {cache}")
+
+    def on_miss(self, cache: str) -> None:
+        self.events.append(f"miss {cache}")
+
+    def on_fill(self, cache: str, seconds: float, size: int) -> None:  # noqa: ARG002
+        self.events.append(f"fill {cache} {size}")
+
+    def on_error(self, cache: str) -> None:
+        self.events.append(f"error {cache}")
+
+
+class InstrumentedCache(RedisCache[int, dict]):
+    codec = PickleCodec()
+    metrics = RecordingMetrics()
+
+    def get_original_value(self, key: int) -> dict | Error:
+        if key < 0:
+            return Error(error_code=codes.not_found, eng_description="Negative key", ui_description="Negative key")
+        return {"key": key}
+
+    def serialize_key(self, key: int) -> str:
+        return f"instrumented_cache:{key}"
+
+    def deserialize_key(self, key: str) -> int:
+        return int(key.removeprefix("instrumented_cache:"))
+
+
+def test_redis_cache_reports_events(fake_redis: FakeRedis) -> None:
+    cache = InstrumentedCache(redis_instance=fake_redis)  # type: ignore[arg-type]
+    events = InstrumentedCache.metrics.events  # type: ignore[union-attr]
+    size = len(PickleCodec().dumps({"key": 1}))
+
+    assert cache.get(1) == {"key": 1}
+    assert cache.get(1) == {"key": 1}
+    assert isinstance(cache.get(-1), Error)
+
+    assert events == [
+        "miss InstrumentedCache",
+        f"fill InstrumentedCache {size}",
+        "hit InstrumentedCache",
+        "miss InstrumentedCache",
+        "error InstrumentedCache",
+    ]
@@ -0,0 +1,52 @@
+import redis
+
+from odevlib.caching.codecs import PickleCodec
+from odevlib.caching.redis_cache import RedisCache
+from odevlib.models.errors import Error
+
+
+class StringCache(RedisCache[int, str]):
+    def get_original_value(self, key: int) -> str | Error:
+        return str(key)
+
+    def serialize_key(self, key: int) -> str:
+        return f"string_cache:{key}"
+
+    def deserialize_key(self, key: str) -> int:
+        return int(key.removeprefix("string_cache:"))
+
+    def serialize_value(self, value: str) -> str:
+        return value
+
+    def deserialize_value(self, value: str) -> str:
+        return value
+
+
+class PickleCache(RedisCache[int, dict]):
+    codec = PickleCodec()
+
+    def get_original_value(self, key: int) -> dict | Error:
+        return {"key": key}
+
+    def serialize_key(self, key: int) -> str:
+        return f"pickle_cache:{key}"
+
+    def deserialize_key(self, key: str) -> int:
+        return int(key.removeprefix("pickle_cache:"))
+
+
+def test_string_serialization_is_used_without_codec() -> None:
+    # Redis client does not connect until the first command is sent.
+    cache = StringCache(redis_instance=redis.Redis())
+
+    assert cache.encode_value("значение") == "значение".encode()
+    assert cache.decode_value("значение".encode()) == "значение"
+
+
+def test_codec_is_used_when_set() -> None:
+    cache = PickleCache(redis_instance=redis.Redis())
+
+    data = cache.encode_value({"key": 1})
+
+    assert data == PickleCodec().dumps({"key": 1})
+    assert cache.decode_value(data) == {"key": 1}
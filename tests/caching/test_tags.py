@@ -0,0 +1,81 @@
+import pytest
+from django.contrib.auth.models import User
+from django.db import models
+
+from odevlib.caching.codecs import PickleCodec
+from odevlib.caching.redis_cache import RedisCache
+from odevlib.caching.tags import connect_tag_invalidation, model_tag, tag_key
+from odevlib.models.errors import Error
+from test_app.models import ExampleRBACParent
+from tests.caching.conftest import FakeRedis
+
+
+def test_model_tag_for_instance() -> None:
+    instance = ExampleRBACParent(pk=42, test_field="test_field", test_field2="test_field2")
+
+    assert model_tag(instance) == "model:test_app__examplerbacparent:42"
+
+
+def test_model_tag_for_model_and_pk() -> None:
+    assert model_tag(ExampleRBACParent, 42) == "model:test_app__examplerbacparent:42"
+    assert model_tag(ExampleRBACParent) == "model:test_app__examplerbacparent"
+
+
+def test_tag_key() -> None:
+    assert tag_key("model:test_app__examplerbacparent:42") == "odevlib:cache:tag:model:test_app__examplerbacparent:42"
+
+
+class TaggedCache(RedisCache[int, dict]):
+    codec = PickleCodec()
+
+    def get_original_value(self, key: int) -> dict | Error:
+        return {"key": key}
+
+    def serialize_key(self, key: int) -> str:
+        return f"tagged_cache:{key}"
+
+    def deserialize_key(self, key: str) -> int:
+        return int(key.removeprefix("tagged_cache:"))
+
+    def get_tags(self, key: int, value: dict) -> list[str]:  # noqa: ARG002
+        return [model_tag(ExampleRBACParent, key)]
+
+
+def test_store_and_invalidate(fake_redis: FakeRedis) -> None:
+    cache = TaggedCache(timeout=60, redis_instance=fake_redis)  # type: ignore[arg-type]
+    cache.store(1, {"key": 1})
+    cache.store(2, {"key": 2})
+    # Tag set is not expired before its longest-living entry.
+    TaggedCache(timeout=10, redis_instance=fake_redis).store(1, {"key": 1})  # type: ignore[arg-type]
+    assert fake_redis.ttl(tag_key(model_tag(ExampleRBACParent, 1))) > 10
+
+    assert cache.invalidate_tags(model_tag(ExampleRBACParent, 1)) == 1
+
+    assert fake_redis.get("tagged_cache:1") is None
+    assert fake_redis.get("tagged_cache:2") is not None
+    assert fake_redis.get(tag_key(model_tag(ExampleRBACParent, 1))) is None
+
+
+@pytest.mark.django_db()
+def test_model_save_invalidates_tags(
+    fake_redis: FakeRedis,
+    user: User,
+    django_capture_on_commit_callbacks,  # noqa: ANN001
+) -> None:
+    other_redis = FakeRedis(port=6380)
+    instance = ExampleRBACParent(test_field="Value", test_field2="Value 2")
+    instance.save(user=user)
+    TaggedCache(redis_instance=fake_redis).store(instance.pk, {"key": instance.pk})  # type: ignore[arg-type]
+    TaggedCache(redis_instance=other_redis).store(instance.pk, {"key": instance.pk})  # type: ignore[arg-type]
+
+    connect_tag_invalidation()
+    try:
+        with django_capture_on_commit_callbacks(execute=True):
+            instance.test_field = "New value"
+            instance.save(user=user)
+    finally:
+        models.signals.post_save.disconnect(dispatch_uid="odevlib_cache_tags")
+        models.signals.post_delete.disconnect(dispatch_uid="odevlib_cache_tags")
+
+    assert fake_redis.get(f"tagged_cache:{instance.pk}") is None
+    assert other_redis.get(f"tagged_cache:{instance.pk}") is None
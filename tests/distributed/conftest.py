@@ -0,0 +1,120 @@
+import time
+from typing import Any
+
+import pytest
+from redis.exceptions import ResponseError
+
+
+class FakeStreamRedis:
+    """
+    In-memory stand-in for redis.Redis, implementing stream commands used by consumer groups.
+    Stream ids are "<n>-0", where n is the position of the entry in the stream.
+    """
+
+    def __init__(self) -> None:
+        self.entries: list[tuple[bytes, dict[bytes, bytes]]] = []
+        # Group name -> position of the last delivered entry.
+        self.last_delivered: dict[str, int] = {}
+        # Group name -> stream id -> (consumer, delivery time).
+        self.pending: dict[str, dict[bytes, tuple[str, float]]] = {}
+        self.acked: list[str] = []
+        self.autoclaim_calls = 0
+
+    def add(self, fields: dict[bytes, bytes]) -> bytes:
+        stream_id = f"{len(self.entries) + 1}-0".encode()
+        self.entries.append((stream_id, fields))
+        return stream_id
+
+    def deliver(self, group: str, consumer: str, delivered_at: float | None = None) -> None:
+        """
+        Deliver all new entries to the consumer without acknowledging them, like a consumer that crashed.
+        """
+        for stream_id, _ in self.entries[self.last_delivered[group] :]:
+            self.pending[group][stream_id] = (consumer, delivered_at if delivered_at is not None else time.time())
+        self.last_delivered[group] = len(self.entries)
+
+    def _entry(self, stream_id: bytes) -> tuple[bytes, dict[bytes, bytes]]:
+        return self.entries[int(stream_id.split(b"-")[0]) - 1]
+
+    def xgroup_create(self, name: str, groupname: str, id: str = "$", mkstream: bool = False) -> bool:  # noqa: A002
+        assert mkstream
+        if groupname in self.last_delivered:
+            msg = "BUSYGROUP Consumer Group name already exists"
+            raise ResponseError(msg)
+        self.last_delivered[groupname] = len(self.entries) if id == "$" else 0
+        self.pending[groupname] = {}
+        return True
+
+    def xreadgroup(
+        self,
+        groupname: str,
+        consumername: str,
+        streams: dict[str, str],
+        count: int | None = None,
+        block: int | None = None,  # noqa: ARG002
+        **kwargs: Any,
+    ) -> list:
+        ((name, stream_id),) = streams.items()
+        count = count or len(self.entries)
+        if stream_id == ">":
+            start = self.last_delivered[groupname]
+            entries = self.entries[start : start + count]
+            self.last_delivered[groupname] = start + len(entries)
+            for entry_id, _ in entries:
+                self.pending[groupname][entry_id] = (consumername, time.time())
+        else:
+            after = int(stream_id.split("-")[0])
+            entries = [
+                self._entry(entry_id)
+                for entry_id, (consumer, _) in sorted(self.pending[groupname].items())
+                if consumer == consumername and int(entry_id.split(b"-")[0]) > after
+            ][:count]
+        if not entries:
+            return []
+        return [[name.encode(), entries]]
+
+    def xack(self, name: str, groupname: str, *ids: str) -> int:  # noqa: ARG002
+        for stream_id in ids:
+            self.pending[groupname].pop(stream_id.encode(), None)
+            self.acked.append(stream_id)
+        return len(ids)
+
+    def xautoclaim(
+        self,
+        name: str,  # noqa: ARG002
+        groupname: str,
+        consumername: str,
+        min_idle_time: int,
+        start_id: str | bytes = "0-0",  # noqa: ARG002
+        count: int | None = None,  # noqa: ARG002
+    ) -> list:
+        self.autoclaim_calls += 1
+        now = time.time()
+        claimed = []
+        for entry_id, (_, delivered_at) in sorted(self.pending[groupname].items()):
+            if (now - delivered_at) * 1000 >= min_idle_time:
+                self.pending[groupname][entry_id] = (consumername, now)
+                claimed.append(self._entry(entry_id))
+        return [b"0-0", claimed, []]
+
+
+class FakeAsyncStreamRedis:
+    """
+    Same as FakeStreamRedis, but with coroutine commands, like redis.asyncio.Redis.
+    """
+
+    def __init__(self, redis: FakeStreamRedis) -> None:
+        self.redis = redis
+
+    def __getattr__(self, name: str) -> Any:
+        command = getattr(self.redis, name)
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return command(*args, **kwargs)
+
+        return call
+
+
+@pytest.fixture()
+def stream_redis() -> FakeStreamRedis:
+    return FakeStreamRedis()
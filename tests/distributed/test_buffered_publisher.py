@@ -0,0 +1,59 @@
+import asyncio
+
+from odevlib.distributed.buffered_publisher import AsyncBufferedPublisher, BufferedPublisher
+
+
+class RecordingBroker:
+    """
+    Records publish_many calls instead of sending them to Redis.
+    """
+
+    def __init__(self) -> None:
+        self.batches: list[tuple[str, list[str]]] = []
+
+    def publish_many(self, channel: str, messages: list[str]) -> None:
+        self.batches.append((channel, list(messages)))
+
+
+class AsyncRecordingBroker(RecordingBroker):
+    async def publish_many(self, channel: str, messages: list[str]) -> None:  # type: ignore[override]
+        super().publish_many(channel, messages)
+
+
+def test_buffered_publisher_flushes_on_close() -> None:
+    broker = RecordingBroker()
+
+    with BufferedPublisher(broker, max_batch=1000, flush_interval=60) as publisher:  # type: ignore[arg-type]
+        for i in range(10):
+            publisher.publish("events", str(i))
+        publisher.publish("other", "message")
+
+    assert sorted(broker.batches) == [("events", [str(i) for i in range(10)]), ("other", ["message"])]
+
+
+def test_buffered_publisher_flushes_by_size() -> None:
+    broker = RecordingBroker()
+    publisher = BufferedPublisher(broker, max_batch=5, flush_interval=60, max_buffered=5)  # type: ignore[arg-type]
+
+    for i in range(7):
+        publisher.publish("events", str(i))
+
+    # Reaching max_buffered flushes synchronously, even without the background thread.
+    assert broker.batches == [("events", ["0", "1", "2", "3", "4"])]
+    publisher.close()
+    assert broker.batches[-1] == ("events", ["5", "6"])
+
+
+def test_async_buffered_publisher_flushes_by_time() -> None:
+    broker = AsyncRecordingBroker()
+
+    async def run() -> None:
+        async with AsyncBufferedPublisher(broker, max_batch=1000, flush_interval=0.01) as publisher:  # type: ignore[arg-type]
+            await publisher.publish("events", "first")
+            await asyncio.sleep(0.1)
+            assert broker.batches == [("events", ["first"])]
+            await publisher.publish("events", "second")
+
+    asyncio.run(run())
+
+    assert broker.batches == [("events", ["first"]), ("events", ["second"])]
@@ -0,0 +1,105 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+from itertools import islice
+
+import pytest
+from redis.exceptions import ResponseError
+
+from odevlib.distributed.message_broker import RedisMessageBroker, RedisSyncMessageBroker
+from tests.distributed.conftest import FakeAsyncStreamRedis, FakeStreamRedis
+
+
+async def take(iterator: AsyncIterator[tuple[str, str]], count: int) -> list[tuple[str, str]]:
+    result = []
+    async for item in iterator:
+        result.append(item)
+        if len(result) == count:
+            break
+    return result
+
+
+def subscribe(stream_redis: FakeStreamRedis, mode: str, count: int, **kwargs) -> list[tuple[str, str]]:  # noqa: ANN003
+    """
+    Take `count` messages from asubscribe_group of the sync or async broker over the fake client.
+    """
+    if mode == "sync":
+        sync_broker = RedisSyncMessageBroker(stream_redis)  # type: ignore[arg-type]
+        iterator: Iterator[tuple[str, str]] = sync_broker.asubscribe_group("events", "workers", "first", **kwargs)
+        return list(islice(iterator, count))
+
+    broker = RedisMessageBroker(FakeAsyncStreamRedis(stream_redis))  # type: ignore[arg-type]
+    return asyncio.run(take(broker.asubscribe_group("events", "workers", "first", **kwargs), count))
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_create_group_ignores_busygroup(stream_redis: FakeStreamRedis, mode: str) -> None:
+    if mode == "sync":
+        sync_broker = RedisSyncMessageBroker(stream_redis)  # type: ignore[arg-type]
+        sync_broker.create_group("events", "workers")
+        sync_broker.create_group("events", "workers")
+    else:
+        broker = RedisMessageBroker(FakeAsyncStreamRedis(stream_redis))  # type: ignore[arg-type]
+        asyncio.run(broker.create_group("events", "workers"))
+        asyncio.run(broker.create_group("events", "workers"))
+
+    assert list(stream_redis.last_delivered) == ["workers"]
+
+
+def test_create_group_raises_other_errors(stream_redis: FakeStreamRedis) -> None:
+    def fail(*args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        raise ResponseError("WRONGTYPE Operation against a key holding the wrong kind of value")
+
+    stream_redis.xgroup_create = fail  # type: ignore[method-assign]
+    with pytest.raises(ResponseError):
+        RedisSyncMessageBroker(stream_redis).create_group("events", "workers")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_pending_messages_are_replayed_before_new_ones(stream_redis: FakeStreamRedis, mode: str) -> None:
+    stream_redis.xgroup_create("events", "workers", id="0", mkstream=True)
+    stream_redis.add({b"message": b"first"})
+    stream_redis.add({b"message": b"second"})
+    # Delivered before restart, but never acknowledged.
+    stream_redis.deliver("workers", "first")
+    stream_redis.add({b"message": b"third"})
+
+    messages = subscribe(stream_redis, mode, 3)
+
+    assert messages == [("1-0", "first"), ("2-0", "second"), ("3-0", "third")]
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_malformed_messages_are_acked(stream_redis: FakeStreamRedis, mode: str) -> None:
+    stream_redis.xgroup_create("events", "workers", id="0", mkstream=True)
+    stream_redis.add({b"other": b"field"})
+    stream_redis.add({b"message": b"valid"})
+
+    messages = subscribe(stream_redis, mode, 1)
+
+    assert messages == [("2-0", "valid")]
+    assert stream_redis.acked == ["1-0"]
+    assert b"1-0" not in stream_redis.pending["workers"]
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_idle_messages_are_reclaimed(stream_redis: FakeStreamRedis, mode: str) -> None:
+    stream_redis.xgroup_create("events", "workers", id="0", mkstream=True)
+    stream_redis.add({b"message": b"stuck"})
+    stream_redis.deliver("workers", "crashed", delivered_at=time.time() - 120)
+    stream_redis.add({b"message": b"new"})
+
+    messages = subscribe(stream_redis, mode, 2, min_idle_time=60000, reclaim_interval=0)
+
+    assert messages == [("1-0", "stuck"), ("2-0", "new")]
+    assert stream_redis.pending["workers"][b"1-0"][0] == "first"
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_messages_are_not_reclaimed_before_interval(stream_redis: FakeStreamRedis, mode: str) -> None:
+    stream_redis.xgroup_create("events", "workers", id="0", mkstream=True)
+    stream_redis.add({b"message": b"new"})
+
+    subscribe(stream_redis, mode, 1, reclaim_interval=3600)
+
+    assert stream_redis.autoclaim_calls == 0
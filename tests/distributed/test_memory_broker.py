@@ -0,0 +1,93 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import TypeVar
+
+from odevlib.distributed.memory_broker import InMemoryMessageBroker
+
+T = TypeVar("T")
+
+
+async def take(iterator: AsyncIterator[T], count: int) -> list[T]:
+    result = []
+    async for item in iterator:
+        result.append(item)
+        if len(result) == count:
+            break
+    return result
+
+
+def test_subscribe_resumes_from_last_id() -> None:
+    broker = InMemoryMessageBroker()
+
+    async def run() -> None:
+        await broker.publish_many("events", ["first", "second", "third"])
+
+        messages = await take(broker.asubscribe("events", "0"), 3)
+        assert [message for _, message in messages] == ["first", "second", "third"]
+
+        first_id = messages[0][0]
+        resumed = await take(broker.asubscribe("events", first_id), 2)
+        assert resumed == messages[1:]
+
+    asyncio.run(run())
+
+
+def test_subscribe_waits_for_new_messages() -> None:
+    broker = InMemoryMessageBroker()
+
+    async def run() -> None:
+        subscription = asyncio.create_task(take(broker.asubscribe("events", "$"), 1))
+        await asyncio.sleep(0.01)
+        assert not subscription.done()
+
+        await broker.publish("events", "new")
+        messages = await asyncio.wait_for(subscription, 1)
+        assert [message for _, message in messages] == ["new"]
+
+    asyncio.run(run())
+
+
+def test_retention_is_bounded() -> None:
+    broker = InMemoryMessageBroker(maxlen=2)
+
+    async def run() -> None:
+        await broker.publish_many("events", ["first", "second", "third"])
+
+        batches = await take(broker.asubscribe_batches("events", "0"), 1)
+        assert [message for _, message in batches[0]] == ["second", "third"]
+
+        await broker.publish_many("events", [str(i) for i in range(5)])
+        batches = await take(broker.asubscribe_batches("events", "0"), 1)
+        assert [message for _, message in batches[0]] == ["3", "4"]
+
+        batches = await take(broker.asubscribe_batches("events", batches[0][0][0]), 1)
+        assert [message for _, message in batches[0]] == ["4"]
+
+    asyncio.run(run())
+
+
+def test_consumer_group_shares_and_redelivers_messages() -> None:
+    broker = InMemoryMessageBroker(count=2)
+
+    async def run() -> None:
+        await broker.publish_many("events", ["1", "2", "3", "4"])
+
+        first = await take(broker.asubscribe_group("events", "group", "first"), 2)
+        second = await take(broker.asubscribe_group("events", "group", "second"), 2)
+        assert [m for _, m in first] == ["1", "2"]
+        assert [m for _, m in second] == ["3", "4"]
+
+        # Only the first message is acknowledged, so the second one is delivered again after restart.
+        await broker.ack("events", "group", first[0][0])
+        restarted = await take(broker.asubscribe_group("events", "group", "first"), 1)
+        assert restarted == [first[1]]
+
+        # Unacknowledged messages of the second consumer are reclaimed by the first one.
+        await broker.ack("events", "group", first[1][0])
+        reclaimed = await take(
+            broker.asubscribe_group("events", "group", "first", min_idle_time=0, reclaim_interval=0),
+            2,
+        )
+        assert reclaimed == second
+
+    asyncio.run(run())
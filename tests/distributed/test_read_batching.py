@@ -0,0 +1,37 @@
+from odevlib.distributed.message_broker import ReadBatching
+
+
+def test_count_grows_while_backlogged_and_shrinks_when_idle() -> None:
+    batching = ReadBatching(count=10, max_count=80)
+
+    for _ in range(5):
+        batching.update(batching.count)
+    assert batching.count == 80
+
+    batching.update(0)
+    batching.update(0)
+    assert batching.count == 20
+
+    batching.update(15)
+    assert batching.count == 20
+
+
+def test_block_grows_while_idle_and_resets_on_messages() -> None:
+    batching = ReadBatching(block=1000, max_block=5000)
+
+    for _ in range(5):
+        batching.update(0)
+    assert batching.block == 5000
+
+    batching.update(1)
+    assert batching.block == 1000
+
+
+def test_copy_resets_state() -> None:
+    batching = ReadBatching(count=10, max_count=80)
+    batching.update(10)
+
+    fresh = batching.copy()
+
+    assert fresh.count == 10
+    assert fresh.max_count == 80
@@ -0,0 +1,96 @@
+import asyncio
+import random
+import time
+from collections.abc import AsyncIterator
+
+from odevlib.distributed.runner import MessageRunner
+
+
+class ListBroker:
+    """
+    Serves a fixed list of messages instead of reading them from Redis.
+    """
+
+    def __init__(self, count: int) -> None:
+        self.messages = [(f"{i}-0", f"message {i}") for i in range(1, count + 1)]
+        self.acked: list[str] = []
+
+    async def asubscribe(self, channel: str, last_id: str) -> AsyncIterator[tuple[str, str]]:  # noqa: ARG002
+        for message in self.messages:
+            yield message
+
+    async def asubscribe_group(self, channel: str, group: str, consumer: str) -> AsyncIterator[tuple[str, str]]:
+        async for message in self.asubscribe(channel, "0"):
+            yield message
+
+    async def ack(self, channel: str, group: str, *stream_ids: str) -> None:  # noqa: ARG002
+        self.acked.extend(stream_ids)
+
+
+def test_concurrency_is_bounded_and_checkpoints_are_ordered() -> None:
+    broker = ListBroker(50)
+    in_flight = 0
+    max_in_flight = 0
+    checkpoints: list[str] = []
+
+    async def handle(stream_id: str, message: str) -> None:  # noqa: ARG001
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(random.uniform(0, 0.01))  # noqa: S311
+        in_flight -= 1
+
+    async def checkpoint(stream_id: str) -> None:
+        checkpoints.append(stream_id)
+
+    runner = MessageRunner(broker, handle, concurrency=5, checkpoint=checkpoint)  # type: ignore[arg-type]
+    asyncio.run(runner.run("events", "0"))
+
+    assert max_in_flight == 5
+    assert runner.last_processed_id == "50-0"
+    assert checkpoints[-1] == "50-0"
+    ids = [int(c.split("-")[0]) for c in checkpoints]
+    assert ids == sorted(ids)
+
+
+def test_sync_handlers_run_in_executor() -> None:
+    broker = ListBroker(8)
+
+    def handle(stream_id: str, message: str) -> None:  # noqa: ARG001
+        time.sleep(0.05)
+
+    runner = MessageRunner(broker, handle, concurrency=8)  # type: ignore[arg-type]
+    start = time.monotonic()
+    asyncio.run(runner.run("events", "0"))
+
+    # Handlers run in parallel threads, so total time is close to a single handler's time.
+    assert time.monotonic() - start < 0.3
+
+
+def test_group_acks_only_processed_messages_in_order() -> None:
+    broker = ListBroker(10)
+
+    async def handle(stream_id: str, message: str) -> None:  # noqa: ARG001
+        await asyncio.sleep(0.001 * (10 - int(stream_id.split("-")[0])))
+        if stream_id == "3-0":
+            msg = "Handler failed"
+            raise ValueError(msg)
+
+    runner = MessageRunner(broker, handle, concurrency=4)  # type: ignore[arg-type]
+    asyncio.run(runner.run_group("events", "group", "consumer"))
+
+    assert broker.acked == [f"{i}-0" for i in range(1, 11) if i != 3]
+
+
+def test_cancelled_processing_does_not_block_run() -> None:
+    broker = ListBroker(5)
+
+    async def handle(stream_id: str, message: str) -> None:  # noqa: ARG001
+        if stream_id == "2-0":
+            raise asyncio.CancelledError
+
+    runner = MessageRunner(broker, handle, concurrency=2)  # type: ignore[arg-type]
+    asyncio.run(asyncio.wait_for(runner.run_group("events", "group", "consumer"), timeout=5))
+
+    assert broker.acked == ["1-0", "3-0", "4-0", "5-0"]
+    assert runner.last_processed_id == "5-0"
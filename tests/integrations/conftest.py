@@ -0,0 +1,64 @@
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class FakeService(ThreadingHTTPServer):
+    """
+    HTTP server answering with queued (status, headers, body) responses, or 200 with {"ok": true}.
+    """
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), FakeServiceHandler)
+        self.responses: list[tuple[int, dict[str, str], object]] = []
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+        self.connections: set[int] = set()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FakeServiceHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: FakeService
+
+    def handle_one_request(self) -> None:
+        self.server.connections.add(self.client_address[1])
+        super().handle_one_request()
+
+    def _respond(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+        self.server.requests.append((self.command, self.path, dict(self.headers)))
+
+        status, headers, body = self.server.responses.pop(0) if self.server.responses else (200, {}, {"ok": True})
+        data = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(status)
+        headers = {"Content-Type": "application/json", **headers}
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture()
+def fake_service() -> Iterator[FakeService]:
+    server = FakeService()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,33 @@
+from odevlib.errors import codes
+from odevlib.integrations.odevlib.api_client import ODLAPIClient
+from odevlib.models.errors import Error
+
+
+def test_connections_are_reused(fake_service) -> None:
+    with ODLAPIClient(fake_service.base_url, "token") as client:
+        for _ in range(5):
+            assert client.get("items/") == {"ok": True}
+
+    assert len(fake_service.requests) == 5
+    assert len(fake_service.connections) == 1
+    assert fake_service.requests[0][2]["Authorization"] == "Token token"
+
+
+def test_odevlib_errors_are_mapped(fake_service) -> None:
+    fake_service.responses.append(
+        (404, {}, {"error_code": codes.does_not_exist, "eng_description": "Missing", "ui_description": "Missing"}),
+    )
+
+    with ODLAPIClient(fake_service.base_url, "token") as client:
+        result = client.get("items/1/")
+
+    assert isinstance(result, Error)
+    assert result.error_code == codes.does_not_exist
+
+
+def test_connection_errors_are_returned_as_error() -> None:
+    with ODLAPIClient("http://127.0.0.1:9", "token", connect_timeout=0.5) as client:
+        result = client.get("items/")
+
+    assert isinstance(result, Error)
+    assert result.error_code == codes.unhandled_error
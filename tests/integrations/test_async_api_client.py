@@ -0,0 +1,47 @@
+import asyncio
+
+from odevlib.errors import codes
+from odevlib.integrations.odevlib.async_api_client import AsyncODLAPIClient, gather, run_sync
+from odevlib.models.errors import Error
+
+
+def test_gather_limits_concurrency_and_keeps_order() -> None:
+    running = 0
+    max_running = 0
+
+    async def job(i: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return i
+
+    results = asyncio.run(gather(*(job(i) for i in range(20)), limit=4))
+
+    assert results == list(range(20))
+    assert max_running == 4
+
+
+def test_requests_are_sent_concurrently_and_errors_are_mapped(fake_service) -> None:
+    fake_service.responses.append(
+        (403, {}, {"error_code": codes.permission_denied, "eng_description": "No", "ui_description": "No"}),
+    )
+
+    async def main() -> list:
+        async with AsyncODLAPIClient(fake_service.base_url, "token") as client:
+            return await gather(*(client.get(f"items/{i}/") for i in range(5)), limit=5)
+
+    results = asyncio.run(main())
+
+    assert sum(isinstance(result, Error) for result in results) == 1
+    assert results.count({"ok": True}) == 4
+
+
+def test_run_sync(fake_service) -> None:
+    client = AsyncODLAPIClient(fake_service.base_url, "token")
+
+    first, second = run_sync(gather(client.get("a/"), client.post("b/", {"x": 1})))
+
+    assert first == second == {"ok": True}
+    run_sync(client.aclose())
@@ -0,0 +1,36 @@
+from odevlib.errors import codes
+from odevlib.integrations.odevlib.api_client import ODLAPIClient
+from odevlib.models.errors import Error
+
+
+def test_iter_items_walks_all_pages(fake_service) -> None:
+    fake_service.responses += [
+        (200, {"X-ODEVLIB-HAS-MORE": "true"}, [{"id": 1}, {"id": 2}]),
+        (200, {"X-ODEVLIB-HAS-MORE": "true"}, [{"id": 5}, {"id": 7}]),
+        (200, {"X-ODEVLIB-HAS-MORE": "false"}, [{"id": 8}]),
+    ]
+
+    with ODLAPIClient(fake_service.base_url, "token") as client:
+        items = list(client.iter_items("items", {"kind": "a"}, count=2))
+
+    assert [item["id"] for item in items] == [1, 2, 5, 7, 8]
+    assert [path for _, path, _ in fake_service.requests] == [
+        "/items?kind=a&count=2",
+        "/items?kind=a&count=2&last_id=2",
+        "/items?kind=a&count=2&last_id=7",
+    ]
+
+
+def test_iter_pages_stops_on_error(fake_service) -> None:
+    fake_service.responses += [
+        (200, {"X-ODEVLIB-HAS-MORE": "true"}, [{"id": 1}]),
+        (403, {}, {"error_code": codes.permission_denied, "eng_description": "No", "ui_description": "No"}),
+    ]
+
+    with ODLAPIClient(fake_service.base_url, "token") as client:
+        pages = list(client.iter_pages("items", count=1, last_id=0))
+
+    assert pages[0] == [{"id": 1}]
+    assert isinstance(pages[1], Error)
+    assert len(pages) == 2
+    assert fake_service.requests[0][1] == "/items?count=1&last_id=0"
@@ -0,0 +1,92 @@
+import time
+
+import pytest
+
+from odevlib.errors import codes
+from odevlib.integrations.odevlib.api_client import ODLAPIClient
+from odevlib.integrations.odevlib.resilience import CircuitBreaker, RetryPolicy, parse_retry_after
+from odevlib.models.errors import Error
+
+UNAVAILABLE = {"error_code": codes.internal_server_error, "eng_description": "Down", "ui_description": "Down"}
+
+
+def test_only_idempotent_methods_are_retried() -> None:
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.should_retry("GET", 1)
+    assert policy.should_retry("GET", 2, 503)
+    assert not policy.should_retry("GET", 3, 503)
+    assert not policy.should_retry("GET", 1, 500)
+    assert not policy.should_retry("POST", 1)
+
+
+def test_backoff_is_jittered_and_honours_retry_after() -> None:
+    policy = RetryPolicy(backoff=0.1, max_backoff=1.0)
+
+    assert all(0 <= policy.delay(3) <= 0.4 for _ in range(100))
+    assert all(policy.delay(10) <= 1.0 for _ in range(100))
+    assert policy.delay(1, "0") == 0
+    assert policy.delay(1, "120") == 1.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+
+
+def test_transient_responses_are_retried(fake_service) -> None:
+    fake_service.responses += [(503, {"Retry-After": "0"}, UNAVAILABLE), (429, {"Retry-After": "0"}, UNAVAILABLE)]
+
+    with ODLAPIClient(fake_service.base_url, "token") as client:
+        assert client.get("items/") == {"ok": True}
+    assert len(fake_service.requests) == 3
+
+    fake_service.responses.append((503, {"Retry-After": "0"}, UNAVAILABLE))
+    with ODLAPIClient(fake_service.base_url, "token") as client:
+        result = client.post("items/", {})
+    assert isinstance(result, Error)
+    assert len(fake_service.requests) == 4
+
+
+def test_circuit_breaker_opens_and_recovers() -> None:
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05)
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    # Only a single probe is let through.
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.allow()
+
+
+def test_open_circuit_fails_fast(fake_service) -> None:
+    fake_service.responses += [(500, {}, UNAVAILABLE)] * 5
+
+    with ODLAPIClient(fake_service.base_url, "token") as client:
+        for _ in range(5):
+            client.get("items/")
+        result = client.get("items/")
+
+    assert isinstance(result, Error)
+    assert result.error_code == codes.service_unavailable
+    assert len(fake_service.requests) == 5
+
+
+def test_probe_raising_unexpected_exception_does_not_keep_circuit_open(fake_service) -> None:
+    with ODLAPIClient(fake_service.base_url, "token") as client:
+        client.circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+        client.circuit_breaker.record_failure()
+        time.sleep(0.06)
+
+        def fail(*args, **kwargs):
+            raise RuntimeError
+
+        client.session.hooks["response"].append(fail)
+        with pytest.raises(RuntimeError):
+            client.get("items/")
+        client.session.hooks["response"].remove(fail)
+
+        assert client.get("items/") == {"ok": True}
+    assert not client.circuit_breaker.is_open
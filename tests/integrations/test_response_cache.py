@@ -0,0 +1,53 @@
+import time
+
+from odevlib.integrations.odevlib.api_client import ODLAPIClient
+from odevlib.integrations.odevlib.response_cache import CachedResponse, LRUResponseCache
+
+
+def test_fresh_responses_are_served_from_cache(fake_service) -> None:
+    fake_service.responses.append((200, {"Cache-Control": "max-age=60"}, {"value": 1}))
+
+    with ODLAPIClient(fake_service.base_url, "token", response_cache=LRUResponseCache()) as client:
+        assert client.get("items/", {"b": 2, "a": 1}) == {"value": 1}
+        assert client.get("items/", {"a": 1, "b": 2}) == {"value": 1}
+        # Different query parameters are a different resource.
+        assert client.get("items/", {"a": 2}) == {"ok": True}
+
+    assert len(fake_service.requests) == 2
+
+
+def test_stale_responses_are_revalidated(fake_service) -> None:
+    fake_service.responses += [
+        (200, {"Cache-Control": "no-cache", "ETag": '"v1"'}, {"value": 1}),
+        (304, {"Cache-Control": "no-cache"}, b""),
+    ]
+
+    with ODLAPIClient(fake_service.base_url, "token", response_cache=LRUResponseCache()) as client:
+        assert client.get("items/") == {"value": 1}
+        assert client.get("items/") == {"value": 1}
+
+    assert fake_service.requests[1][2]["If-None-Match"] == '"v1"'
+
+
+def test_no_store_responses_are_not_cached() -> None:
+    assert CachedResponse.from_response(b"{}", {"Cache-Control": "no-store, max-age=60"}) is None
+    assert CachedResponse.from_response(b"{}", {}) is None
+    assert CachedResponse.from_response(b"{}", {"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}) is not None
+
+
+def test_age_is_subtracted_from_max_age() -> None:
+    entry = CachedResponse.from_response(b"{}", {"Cache-Control": "max-age=60", "Age": "30"})
+
+    assert entry is not None
+    assert 29 < entry.expires_at - time.time() <= 30
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    cache = LRUResponseCache(maxsize=2)
+    for key in ("a", "b"):
+        cache.set_response(key, CachedResponse(b"{}", None, None, 0))
+    cache.get_response("a")
+    cache.set_response("c", CachedResponse(b"{}", None, None, 0))
+
+    assert cache.get_response("b") is None
+    assert cache.get_response("a") is not None
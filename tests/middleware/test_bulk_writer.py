@@ -0,0 +1,114 @@
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+import pytest
+from django.db import models
+
+from odevlib.middleware.request_log_writer import RequestLogWriter
+from odevlib.utils import bulk_writer
+from odevlib.utils.bulk_writer import BulkWriter
+
+
+class MemoryWriter(BulkWriter):
+    """
+    Keeps written batches in memory instead of inserting them into the database.
+    """
+
+    def __init__(self, *args, release: threading.Event | None = None, **kwargs) -> None:  # noqa: ANN002, ANN003
+        self.batches: list[list[models.Model]] = []
+        self.databases: list[str | None] = []
+        self.release = release
+        super().__init__(*args, **kwargs)
+
+    def save_batch(  # noqa: ARG002
+        self,
+        model: type[models.Model],
+        instances: list[models.Model],
+        using: str | None = None,
+    ) -> None:
+        if self.release is not None:
+            self.release.wait()
+        self.batches.append(instances)
+        self.databases.append(using)
+
+
+def wait_for(condition: Callable[[], bool], timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Condition was not met in time"
+        time.sleep(0.005)
+
+
+def test_batches_are_flushed_by_size() -> None:
+    writer = MemoryWriter(batch_size=3, flush_interval=60)
+    for i in range(7):
+        writer.write(i)  # type: ignore[arg-type]
+
+    wait_for(lambda: len(writer.batches) == 2)
+    assert writer.batches == [[0, 1, 2], [3, 4, 5]]
+
+    writer.close()
+    assert writer.batches[-1] == [6]
+
+
+def test_batches_are_split_by_database() -> None:
+    writer = MemoryWriter(batch_size=100, flush_interval=60)
+    writer.write(1)  # type: ignore[arg-type]
+    writer.write(2, "replica")  # type: ignore[arg-type]
+    writer.write(3)  # type: ignore[arg-type]
+    writer.close()
+
+    assert writer.batches == [[1, 3], [2]]
+    assert writer.databases == [None, "replica"]
+
+
+def test_batches_are_flushed_by_interval() -> None:
+    writer = MemoryWriter(batch_size=100, flush_interval=0.05)
+    writer.write(1)  # type: ignore[arg-type]
+    writer.write(2)  # type: ignore[arg-type]
+
+    wait_for(lambda: len(writer.batches) == 1)
+    assert writer.batches == [[1, 2]]
+    writer.close()
+
+
+def test_instances_are_dropped_when_queue_is_full(caplog: pytest.LogCaptureFixture) -> None:
+    release = threading.Event()
+    writer = MemoryWriter(queue_size=2, batch_size=1, flush_interval=60, release=release)
+    # The first instance is taken by the writer thread, which then blocks in save_batch.
+    writer.write(0)  # type: ignore[arg-type]
+    wait_for(lambda: writer._queue.empty())  # noqa: SLF001
+    for i in range(1, 6):
+        writer.write(i)  # type: ignore[arg-type]
+    assert writer.dropped == 3
+
+    release.set()
+    with caplog.at_level(logging.WARNING):
+        writer.close()
+
+    assert writer.batches == [[0], [1], [2]]
+    assert writer.dropped == 0
+    assert "dropped 3 instances" in caplog.text
+
+
+def test_close_flushes_remaining_instances_and_is_registered_atexit(monkeypatch: pytest.MonkeyPatch) -> None:
+    registered: list[Callable[[], None]] = []
+    monkeypatch.setattr(bulk_writer.atexit, "register", registered.append)
+
+    writer = MemoryWriter(batch_size=100, flush_interval=60)
+    writer.write(1)  # type: ignore[arg-type]
+    assert registered == [writer.close]
+
+    writer.close()
+    writer.close()
+
+    assert writer.batches == [[1]]
+    assert not writer._thread.is_alive()  # noqa: SLF001
+
+
+def test_request_log_writer_never_blocks() -> None:
+    writer = RequestLogWriter(queue_size=1, batch_size=1, flush_interval=60)
+    assert not writer.block_when_full
+    writer.close()
@@ -0,0 +1,84 @@
+import asyncio
+import contextvars
+from types import SimpleNamespace
+
+import pytest
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from odevlib.middleware import current_user
+from odevlib.middleware.current_user import CurrentUserMiddleware, as_user, get_request, get_user, request_local
+
+
+def make_request(username: str):  # noqa: ANN201
+    request = RequestFactory().get("/")
+    request.user = SimpleNamespace(username=username)
+    return request
+
+
+def test_sync_middleware_unsets_request() -> None:
+    seen = []
+
+    def view(request):  # noqa: ANN001, ANN202
+        seen.append((get_request(), get_user().username))
+        return HttpResponse()
+
+    request = make_request("first")
+    CurrentUserMiddleware(view)(request)
+
+    assert seen == [(request, "first")]
+    assert get_request() is None
+    assert get_user() is None
+
+
+def test_async_middleware_isolates_concurrent_requests() -> None:
+    async def view(request):  # noqa: ANN001, ANN202
+        await asyncio.sleep(0.01)
+        # Offloaded sync code sees the request as well.
+        username = await sync_to_async(lambda: get_user().username)()
+        return HttpResponse(username)
+
+    middleware = CurrentUserMiddleware(view)
+    assert asyncio.iscoroutinefunction(middleware)
+
+    async def serve() -> list[bytes]:
+        responses = await asyncio.gather(*(middleware(make_request(name)) for name in ("first", "second")))
+        return [response.content for response in responses]
+
+    assert asyncio.run(serve()) == [b"first", b"second"]
+    assert get_request() is None
+
+
+def test_as_user() -> None:
+    user = SimpleNamespace(username="command")
+    with as_user(user):
+        assert get_user() is user
+    assert get_user() is None
+
+
+def test_deprecated_user_local_sets_current_user() -> None:
+    def run() -> None:
+        user = SimpleNamespace(username="legacy")
+        with pytest.deprecated_call():
+            current_user.user_local = user  # type: ignore[assignment]
+        assert get_user() is user
+        with pytest.deprecated_call():
+            assert current_user.user_local is user
+
+    # Run in a copy of the context, so the user doesn't leak into other tests.
+    contextvars.copy_context().run(run)
+    assert get_user() is None
+
+
+def test_deprecated_request_local_sets_current_request() -> None:
+    def run() -> None:
+        request = make_request("legacy")
+        with pytest.deprecated_call():
+            request_local.request = request
+        assert get_request() is request
+        with pytest.deprecated_call():
+            assert request_local.request is request
+
+    contextvars.copy_context().run(run)
+    assert get_request() is None
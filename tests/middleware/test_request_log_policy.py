@@ -0,0 +1,44 @@
+from django.test import override_settings
+
+from odevlib.middleware.timescale_logger import RequestLogPolicy
+
+
+@override_settings(REQUEST_LOG_EXCLUDED_PATHS=["/health/", "/static/"])
+def test_excluded_paths() -> None:
+    policy = RequestLogPolicy()
+
+    assert policy.is_excluded("/health/live")
+    assert not policy.is_excluded("/api/health/")
+
+
+@override_settings(REQUEST_LOG_PATH_SAMPLE_RATES={"/api/": 0.0, "/api/important/": 1.0})
+def test_longest_path_prefix_wins() -> None:
+    policy = RequestLogPolicy()
+
+    assert policy.should_log("/api/important/1/", 200, 10)
+    assert not policy.should_log("/api/other/", 200, 10)
+    assert policy.should_log("/admin/", 200, 10)
+
+
+@override_settings(REQUEST_LOG_STATUS_SAMPLE_RATES={"2xx": 0.0})
+def test_status_sample_rates() -> None:
+    policy = RequestLogPolicy()
+
+    assert not policy.should_log("/api/", 201, 10)
+    assert policy.should_log("/api/", 404, 10)
+
+
+@override_settings(REQUEST_LOG_SAMPLE_RATE=0.0, REQUEST_LOG_SLOW_THRESHOLD_MS=500)
+def test_slow_requests_are_always_logged() -> None:
+    policy = RequestLogPolicy()
+
+    assert not policy.should_log("/api/", 200, 499)
+    assert policy.should_log("/api/", 200, 500)
+
+
+@override_settings(REQUEST_LOG_MAX_BODY_SIZE=4)
+def test_truncate() -> None:
+    policy = RequestLogPolicy()
+
+    assert policy.truncate(b"body") == "body"
+    assert policy.truncate("тело".encode()) == "те… (truncated)"
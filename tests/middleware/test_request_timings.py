@@ -0,0 +1,45 @@
+import time
+
+from odevlib.utils.timing import db_timing_wrapper, get_timings, measure, start_timings, stop_timings, timed
+
+
+def test_measure_is_noop_outside_of_request() -> None:
+    stop_timings()
+    with measure("serialization"):
+        pass
+    assert get_timings() is None
+
+
+def test_nested_measurements_are_counted_once() -> None:
+    timings = start_timings()
+    try:
+
+        @timed("rbac")
+        def resolve() -> None:
+            time.sleep(0.001)
+
+        with measure("rbac"):
+            resolve()
+            resolve()
+        with measure("serialization"):
+            pass
+    finally:
+        stop_timings()
+
+    assert 2_000_000 <= timings.phases["rbac"] < 1_000_000_000
+    assert set(timings.as_dict()) == {"rbac_us", "serialization_us", "db_queries"}
+
+
+def test_db_wrapper_counts_queries() -> None:
+    def execute(sql, params, many, context):
+        return sql
+
+    timings = start_timings()
+    try:
+        assert db_timing_wrapper(execute, "SELECT 1", None, False, {}) == "SELECT 1"
+        db_timing_wrapper(execute, "SELECT 2", None, False, {})
+    finally:
+        stop_timings()
+
+    assert timings.db_queries == 2
+    assert "db_us" in timings.as_dict()
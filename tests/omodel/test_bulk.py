@@ -0,0 +1,38 @@
+import pytest
+from django.contrib.auth.models import User
+
+from test_app.models import ExampleOModel
+
+
+@pytest.mark.django_db()
+def test_bulk_create_stamps_users_and_writes_history(user: User) -> None:
+    instances = ExampleOModel.objects.bulk_create(
+        [ExampleOModel(test_field=f"Value {i}") for i in range(3)],
+        user=user,
+    )
+
+    assert all(instance.pk is not None for instance in instances)
+    assert ExampleOModel.objects.filter(created_by=user, updated_by=user).count() == 3
+    assert ExampleOModel.history.filter(history_type="+", history_user=user).count() == 3
+
+
+@pytest.mark.django_db()
+def test_bulk_update_stamps_users_and_writes_history(user: User, superuser: User) -> None:
+    instances = ExampleOModel.objects.bulk_create([ExampleOModel(test_field="Value")], user=user)
+    updated_at = ExampleOModel.objects.get().updated_at
+
+    instances[0].test_field = "New value"
+    ExampleOModel.objects.bulk_update(instances, ["test_field"], user=superuser)
+
+    instance = ExampleOModel.objects.get()
+    assert instance.test_field == "New value"
+    assert instance.created_by == user
+    assert instance.updated_by == superuser
+    assert instance.updated_at > updated_at
+    assert ExampleOModel.history.filter(history_type="~", history_user=superuser).count() == 1
+
+
+@pytest.mark.django_db()
+def test_bulk_create_requires_user() -> None:
+    with pytest.raises(ValueError, match="User was not passed"):
+        ExampleOModel.objects.bulk_create([ExampleOModel(test_field="Value")])
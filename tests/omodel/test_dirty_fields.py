@@ -0,0 +1,100 @@
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models.signals import pre_save
+from django.test.utils import CaptureQueriesContext
+
+from test_app.models import ExampleAutoNowOModel, ExampleOModel, ExampleRBACParent
+
+
+def test_new_objects_are_not_tracked() -> None:
+    assert ExampleOModel(test_field="Value").get_dirty_fields() is None
+
+
+@pytest.mark.django_db()
+def test_unchanged_objects_are_not_saved(user: User) -> None:
+    instance = ExampleOModel(test_field="Value")
+    instance.save(user=user)
+    instance = ExampleOModel.objects.get(pk=instance.pk)
+
+    with CaptureQueriesContext(connection) as queries:
+        instance.save(user=user)
+
+    assert len(queries) == 0
+    assert instance.history.count() == 1
+
+
+@pytest.mark.django_db()
+def test_only_changed_fields_are_updated(user: User) -> None:
+    instance = ExampleRBACParent(test_field="Value", test_field2="Value 2")
+    instance.save(user=user)
+
+    instance.test_field = "New value"
+    assert instance.get_dirty_fields() == ["test_field"]
+    with CaptureQueriesContext(connection) as queries:
+        instance.save(user=user)
+
+    update = next(query["sql"] for query in queries if query["sql"].startswith("UPDATE"))
+    assert '"test_field"' in update
+    assert '"updated_by_id"' in update
+    assert '"test_field2"' not in update
+    assert instance.get_dirty_fields() == []
+    assert instance.history.count() == 2
+
+
+@pytest.mark.django_db()
+def test_unchanged_save_by_another_user_updates_audit_fields(user: User, superuser: User) -> None:
+    instance = ExampleOModel(test_field="Value")
+    instance.save(user=user)
+    updated_at = instance.updated_at
+
+    instance.save(user=superuser)
+
+    instance.refresh_from_db()
+    assert instance.updated_by == superuser
+    assert instance.updated_at > updated_at
+    assert instance.history.count() == 2
+
+
+@pytest.mark.django_db()
+def test_concurrently_deleted_object_is_inserted_again(user: User) -> None:
+    instance = ExampleRBACParent(test_field="Value", test_field2="Value 2")
+    instance.save(user=user)
+    ExampleRBACParent.objects.filter(pk=instance.pk).delete()
+
+    instance.test_field = "New value"
+    instance.save(user=user)
+
+    assert ExampleRBACParent.objects.filter(pk=instance.pk, test_field="New value", test_field2="Value 2").exists()
+
+
+@pytest.mark.django_db()
+def test_auto_now_fields_are_updated_with_changed_fields(user: User) -> None:
+    instance = ExampleAutoNowOModel(test_field="Value")
+    instance.save(user=user)
+    touched_at = instance.touched_at
+
+    instance.test_field = "New value"
+    instance.save(user=user)
+
+    instance.refresh_from_db()
+    assert instance.touched_at > touched_at
+
+
+@pytest.mark.django_db()
+def test_fields_changed_by_pre_save_receivers_are_updated(user: User) -> None:
+    def uppercase(sender: type, instance: ExampleRBACParent, **kwargs: object) -> None:
+        instance.test_field2 = instance.test_field2.upper()
+
+    instance = ExampleRBACParent(test_field="Value", test_field2="value 2")
+    instance.save(user=user)
+
+    pre_save.connect(uppercase, sender=ExampleRBACParent)
+    try:
+        instance.test_field = "New value"
+        instance.save(user=user)
+    finally:
+        pre_save.disconnect(uppercase, sender=ExampleRBACParent)
+
+    instance.refresh_from_db()
+    assert instance.test_field2 == "VALUE 2"
@@ -0,0 +1,67 @@
+import pytest
+from django.db import connection
+from django.db.migrations.loader import MigrationLoader
+from django.test import override_settings
+from timescale.db.models.fields import TimescaleDateTimeField
+
+from odevlib.models import RBACRole
+from odevlib.models.history import OHistoricalRecords, get_history_hypertable_interval
+from odevlib.models.timescale import AddCompressionPolicy, AddRetentionPolicy
+from test_app.models import ExampleOModel
+
+
+def test_history_date_is_plain_by_default() -> None:
+    extra_fields = OHistoricalRecords(inherit=True).get_extra_fields(ExampleOModel, {})
+    assert not isinstance(extra_fields["history_date"], TimescaleDateTimeField)
+
+
+def test_history_date_is_partition_column(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ExampleOModel, "history_hypertable_interval", "7 days")
+    extra_fields = OHistoricalRecords(inherit=True).get_extra_fields(ExampleOModel, {})
+    assert isinstance(extra_fields["history_date"], TimescaleDateTimeField)
+    assert extra_fields["history_date"].interval == "7 days"
+
+
+@override_settings(ODEVLIB_HISTORY_HYPERTABLE_INTERVAL="1 day")
+def test_interval_setting_does_not_apply_to_odevlib_models() -> None:
+    assert get_history_hypertable_interval(ExampleOModel) == "1 day"
+    assert get_history_hypertable_interval(RBACRole) is None
+
+
+def collect_sql(operation, *, backwards: bool = False) -> list[str]:  # noqa: ANN001
+    state = MigrationLoader(None, ignore_no_migrations=True).project_state()
+    with connection.schema_editor(collect_sql=True, atomic=False) as schema_editor:
+        if backwards:
+            operation.database_backwards("test_app", schema_editor, state, state)
+        else:
+            operation.database_forwards("test_app", schema_editor, state, state)
+    return schema_editor.collected_sql
+
+
+@pytest.mark.django_db()
+def test_retention_policy_sql() -> None:
+    operation = AddRetentionPolicy("historicalexampleomodel", drop_after="365 days")
+    assert collect_sql(operation) == [
+        "SELECT add_retention_policy('test_app_historicalexampleomodel', INTERVAL '365 days');",
+    ]
+
+
+@pytest.mark.django_db()
+def test_compression_policy_sql() -> None:
+    operation = AddCompressionPolicy("historicalexampleomodel", compress_after="30 days", segment_by="id")
+    assert collect_sql(operation) == [
+        'ALTER TABLE "test_app_historicalexampleomodel" SET (timescaledb.compress, '
+        "timescaledb.compress_segmentby = 'id');",
+        "SELECT add_compression_policy('test_app_historicalexampleomodel', INTERVAL '30 days');",
+    ]
+    assert collect_sql(operation, backwards=True)[-1] == (
+        'ALTER TABLE "test_app_historicalexampleomodel" SET (timescaledb.compress = false);'
+    )
+
+
+@pytest.mark.django_db()
+def test_retention_policy_of_other_app_model() -> None:
+    operation = AddRetentionPolicy("odevlib.requestlogentry", drop_after="30 days")
+    assert collect_sql(operation) == [
+        "SELECT add_retention_policy('odevlib_requestlogentry', INTERVAL '30 days');",
+    ]
@@ -0,0 +1,50 @@
+import pytest
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+from test_app.models import ExampleRBACParent
+
+
+def test_changes_are_computed_with_lag() -> None:
+    sql = str(ExampleRBACParent.history.with_changes(["test_field"]).query)
+    assert "LAG(" in sql
+    assert "IS DISTINCT FROM" in sql
+
+
+@pytest.mark.django_db()
+def test_diffs(user: User) -> None:
+    first = ExampleRBACParent(test_field="A", test_field2="B")
+    first.save(user=user)
+    first.test_field = "A2"
+    first.save(user=user)
+    first.test_field2 = "B2"
+    first.save(user=user)
+    second = ExampleRBACParent(test_field="C", test_field2="D")
+    second.save(user=user)
+
+    diffs = [
+        (record.id, [(change.field, change.old, change.new) for change in changes])
+        for record, changes in ExampleRBACParent.history.for_objects([first.pk, second.pk]).diffs()
+    ]
+
+    assert diffs == [
+        (first.pk, [("test_field", None, "A"), ("test_field2", None, "B")]),
+        (first.pk, [("test_field", "A", "A2")]),
+        (first.pk, [("test_field2", "B", "B2")]),
+        (second.pk, [("test_field", None, "C"), ("test_field2", None, "D")]),
+    ]
+
+
+@pytest.mark.django_db()
+def test_latest_at(user: User) -> None:
+    instance = ExampleRBACParent(test_field="A", test_field2="B")
+    instance.save(user=user)
+    moment = timezone.now()
+    instance.test_field = "A2"
+    instance.save(user=user)
+
+    records = list(ExampleRBACParent.history.latest_at(moment))
+
+    assert len(records) == 1
+    assert records[0].instance.test_field == "A"
+    assert instance.history.latest_at(timezone.now()).get().test_field == "A2"
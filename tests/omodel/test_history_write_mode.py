@@ -0,0 +1,92 @@
+import logging
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import DatabaseError, connection, models, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from odevlib.caching import tags
+from odevlib.caching.tags import connect_tag_invalidation
+from test_app.models import ExampleOModel
+
+
+@pytest.mark.django_db()
+@override_settings(ODEVLIB_HISTORY_WRITE_MODE="deferred")
+def test_deferred_history_is_written_once_on_commit(user: User, django_capture_on_commit_callbacks) -> None:
+    with django_capture_on_commit_callbacks(execute=True) as callbacks, transaction.atomic():
+        for i in range(3):
+            ExampleOModel(test_field=f"Value {i}").save(user=user)
+        assert ExampleOModel.history.count() == 0
+
+    assert len(callbacks) == 1
+    assert ExampleOModel.history.count() == 3
+
+
+@pytest.mark.django_db()
+@override_settings(ODEVLIB_HISTORY_WRITE_MODE="deferred")
+def test_deferred_history_is_batched_with_tag_invalidation(
+    user: User,
+    django_capture_on_commit_callbacks,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Tag invalidation schedules a callback on commit after every save, between historical records.
+    monkeypatch.setattr(tags, "_redis_instances", {})
+    connect_tag_invalidation()
+    try:
+        with CaptureQueriesContext(connection) as queries, django_capture_on_commit_callbacks(execute=True):
+            with transaction.atomic():
+                for i in range(3):
+                    ExampleOModel(test_field=f"Value {i}").save(user=user)
+    finally:
+        models.signals.post_save.disconnect(dispatch_uid="odevlib_cache_tags")
+        models.signals.post_delete.disconnect(dispatch_uid="odevlib_cache_tags")
+
+    history_table = ExampleOModel.history.model._meta.db_table  # noqa: SLF001
+    history_inserts = [query for query in queries if query["sql"].startswith(f'INSERT INTO "{history_table}"')]
+    assert len(history_inserts) == 1
+    assert ExampleOModel.history.count() == 3
+
+
+@pytest.mark.django_db()
+@override_settings(ODEVLIB_HISTORY_WRITE_MODE="deferred")
+def test_history_of_rolled_back_savepoint_is_dropped(user: User, django_capture_on_commit_callbacks) -> None:
+    with django_capture_on_commit_callbacks(execute=True):
+        ExampleOModel(test_field="Kept").save(user=user)
+        try:
+            with transaction.atomic():
+                ExampleOModel(test_field="Rolled back").save(user=user)
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+    assert list(ExampleOModel.history.values_list("test_field", flat=True)) == ["Kept"]
+
+
+@pytest.mark.django_db()
+@override_settings(ODEVLIB_HISTORY_WRITE_MODE="deferred")
+def test_failed_deferred_bulk_insert_falls_back_to_single_inserts(
+    user: User,
+    django_capture_on_commit_callbacks,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    def fail(*args, **kwargs):  # noqa: ANN002, ANN003, ANN202
+        raise DatabaseError
+
+    history_queryset = type(ExampleOModel.history.model._default_manager.all())  # noqa: SLF001
+    monkeypatch.setattr(history_queryset, "bulk_create", fail)
+
+    with caplog.at_level(logging.ERROR), django_capture_on_commit_callbacks(execute=True), transaction.atomic():
+        for i in range(2):
+            ExampleOModel(test_field=f"Value {i}").save(user=user)
+
+    assert "inserting them one by one" in caplog.text
+    assert ExampleOModel.history.count() == 2
+
+
+@pytest.mark.django_db()
+def test_sync_history_is_written_immediately(user: User) -> None:
+    ExampleOModel(test_field="Value").save(user=user)
+
+    assert ExampleOModel.history.count() == 1
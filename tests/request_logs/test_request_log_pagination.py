@@ -0,0 +1,71 @@
+import datetime
+import json
+from types import SimpleNamespace
+
+import pytest
+from django.test import RequestFactory
+from django.utils import timezone
+
+from odevlib.business_logic.request_logs import (
+    decode_request_log_cursor,
+    encode_request_log_cursor,
+    get_request_logs,
+)
+from odevlib.errors import codes
+from odevlib.models.errors import Error
+from odevlib.models.logging import RequestLogEntry
+from odevlib.template_views.logging import request_logs_view
+
+
+def test_cursor_roundtrip() -> None:
+    entry_time = timezone.now()
+    entry = RequestLogEntry(pk=42, time=entry_time)
+
+    assert decode_request_log_cursor(encode_request_log_cursor(entry)) == (entry_time, 42)
+
+
+def test_malformed_cursor_is_rejected() -> None:
+    result = decode_request_log_cursor("yesterday_1")
+
+    assert isinstance(result, Error)
+    assert result.error_code == codes.invalid_request_data
+
+
+def test_malformed_status_is_rejected() -> None:
+    end = timezone.now()
+
+    result = get_request_logs(end - datetime.timedelta(days=1), end, status="server error")
+
+    assert isinstance(result, Error)
+    assert result.error_code == codes.invalid_request_data
+
+
+def test_zero_limit_is_rejected_by_view() -> None:
+    request = RequestFactory().get("/", {"limit": "0", "format": "json"})
+    request.user = SimpleNamespace(is_superuser=True)
+
+    response = request_logs_view(request)
+
+    assert response.status_code == 400
+    assert json.loads(response.content)["error_code"] == codes.invalid_request_data
+
+
+@pytest.mark.django_db()
+def test_zero_limit_is_clamped() -> None:
+    end = timezone.now()
+    for minutes in range(3):
+        RequestLogEntry.objects.create(
+            time=end - datetime.timedelta(minutes=minutes + 1),
+            application="test",
+            method="GET",
+            path="/",
+            code=200,
+            processing_time=1,
+        )
+
+    result = get_request_logs(end - datetime.timedelta(hours=1), end, limit=0)
+
+    assert not isinstance(result, Error)
+    entries, next_cursor = result
+    assert len(entries) == 1
+    assert next_cursor is not None
@@ -0,0 +1,79 @@
+import datetime
+
+import pytest
+from django.utils import timezone
+
+from odevlib.business_logic import request_logs
+from odevlib.business_logic.request_logs import get_request_log_rollups
+from odevlib.errors import codes
+from odevlib.models.errors import Error
+
+
+class FakeCursor:
+    def __init__(self, rows: list[tuple]) -> None:
+        self.rows = rows
+        self.executed: list[tuple[str, list]] = []
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+    def execute(self, query: str, params: list) -> None:
+        self.executed.append((query, params))
+
+    def fetchall(self) -> list[tuple]:
+        return self.rows
+
+
+class FakeConnection:
+    def __init__(self, cursor: FakeCursor) -> None:
+        self._cursor = cursor
+
+    def cursor(self) -> FakeCursor:
+        return self._cursor
+
+
+def test_unknown_resolution_is_rejected() -> None:
+    end = timezone.now()
+
+    result = get_request_log_rollups("week", end - datetime.timedelta(days=1), end)
+
+    assert isinstance(result, Error)
+    assert result.error_code == codes.invalid_request_data
+
+
+def test_rollups_are_queried_from_view(monkeypatch: pytest.MonkeyPatch) -> None:
+    end = timezone.now()
+    start = end - datetime.timedelta(hours=2)
+    cursor = FakeCursor(
+        [
+            (end, "/api/orders/", "GET", 40, 2, 10, 12.0, 80.0, 150.0),
+            (start, "/api/orders/", "GET", 0, 0, 0, None, None, None),
+        ],
+    )
+    monkeypatch.setattr(request_logs, "connection", FakeConnection(cursor))
+
+    result = get_request_log_rollups("hour", start, end, path="/api/orders/", limit=10)
+
+    assert not isinstance(result, Error)
+    assert result[0] == {
+        "bucket": end,
+        "path": "/api/orders/",
+        "method": "GET",
+        "requests": 40,
+        "client_errors": 2,
+        "server_errors": 10,
+        "p50": 12.0,
+        "p95": 80.0,
+        "p99": 150.0,
+        "error_rate": 0.25,
+    }
+    assert result[1]["error_rate"] == 0.0
+
+    [(query, params)] = cursor.executed
+    assert "FROM odevlib_requestlog_1h " in query
+    assert "path = %s" in query
+    assert "method = %s" not in query
+    assert params == [start, end, "/api/orders/", 10]
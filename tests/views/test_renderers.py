@@ -0,0 +1,82 @@
+import datetime
+import decimal
+import io
+import uuid
+
+import pytest
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from odevlib.renderers import ODevLibJSONParser, ODevLibJSONRenderer
+from odevlib.utils import json_backend
+from odevlib.utils.json_backend import JSONBackend, OrjsonBackend
+
+PAYLOAD = {
+    "id": 1,
+    "name": "Пример",
+    "price": decimal.Decimal("10.50"),
+    "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "created_at": datetime.datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=datetime.UTC),
+    "local_time": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.get_fixed_timezone(180)),
+    "date": datetime.date(2024, 1, 2),
+    "time": datetime.time(3, 4, 5, 123456),
+    "duration": datetime.timedelta(minutes=1),
+    "label": gettext_lazy("Name"),
+    "items": [{"id": 2}, None, True, 1.5],
+    "text": "line\u2028separator\u2029",
+}
+
+
+@pytest.mark.parametrize("backend", [JSONBackend(), OrjsonBackend()], ids=["json", "orjson"])
+def test_backends_match_drf_renderer(backend) -> None:
+    assert backend.dumps(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+    assert backend.loads(backend.dumps({"a": [1, "б"]})) == {"a": [1, "б"]}
+
+
+@pytest.mark.parametrize("backend", [JSONBackend(), OrjsonBackend()], ids=["json", "orjson"])
+def test_backends_encode_big_integers(backend) -> None:
+    payload = {"id": 2**70}
+
+    assert backend.dumps(payload) == JSONRenderer().render(payload)
+
+
+def test_orjson_backend_formats_datetimes_with_drf_encoder(monkeypatch: pytest.MonkeyPatch) -> None:
+    class MillisecondEncoder(JSONEncoder):
+        def default(self, obj):
+            if isinstance(obj, datetime.datetime):
+                return obj.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3]
+            return super().default(obj)
+
+    monkeypatch.setattr(json_backend, "_encoder", MillisecondEncoder())
+
+    assert OrjsonBackend().dumps(PAYLOAD["created_at"]) == b'"2024-01-02T03:04:05.123"'
+
+
+def test_renderer_and_parser_roundtrip() -> None:
+    data = ODevLibJSONRenderer().render({"a": 1, "b": ["c"]})
+
+    assert ODevLibJSONParser().parse(io.BytesIO(data)) == {"a": 1, "b": ["c"]}
+    assert ODevLibJSONRenderer().render(None) == b""
+
+
+@pytest.mark.parametrize(
+    ("attribute", "value"),
+    [("ensure_ascii", True), ("compact", False), ("strict", False)],
+)
+def test_renderer_falls_back_to_drf_for_non_default_settings(attribute, value) -> None:
+    renderer = ODevLibJSONRenderer()
+    setattr(renderer, attribute, value)
+    payload = {"name": "Пример", "value": 1e20, "nan": float("nan") if attribute == "strict" else None}
+
+    drf_renderer = JSONRenderer()
+    setattr(drf_renderer, attribute, value)
+
+    assert renderer.render(payload) == drf_renderer.render(payload)
+
+
+def test_parser_rejects_malformed_json() -> None:
+    with pytest.raises(ParseError):
+        ODevLibJSONParser().parse(io.BytesIO(b"{"))